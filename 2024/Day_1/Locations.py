@@ -0,0 +1,177 @@
+from collections import Counter
+from collections.abc import Iterable
+from typing import Tuple
+
+import numpy as np
+
+
+class Locations():
+    """
+    Object modeling the two lists of location IDs of day 1 of Advent of Code
+    2024, filled pair by pair. The total distance (part 1) and the
+    similarity score (part 2) are kept up to date at each new pair instead
+    of being computed again on the whole lists.
+
+    The distance between the two sorted lists is also the sum, over each ID
+    t, of |number of left IDs <= t - number of right IDs <= t|: the i-th
+    smallest IDs of the two lists are apart by as many t values as the
+    counts differ. Adding a pair only changes this difference between its
+    two IDs, so the lists do not have to be kept sorted. The difference is
+    constant from an ID of the lists to the next one, so it is only stored
+    for the distinct IDs: the memory does not depend on their values.
+
+    Attributes
+    ----------
+    __left_counts: Counter
+        The number of occurrences of each ID in the left list.
+    __right_counts: Counter
+        The number of occurrences of each ID in the right list.
+    __ids: np.ndarray
+        The distinct IDs of both lists, in increasing order, followed by
+        free space.
+    __differences: np.ndarray
+        For each distinct ID t, the number of left IDs <= t minus the number
+        of right IDs <= t, which holds until the next distinct ID. It is zero
+        from the greatest ID.
+    __n_ids: int
+        The number of distinct IDs.
+    __size: int
+        The number of pairs.
+    __distance: int
+        The total distance between the two sorted lists.
+    __similarity: int
+        The similarity score between the two lists.
+    """
+
+    __left_counts: Counter
+    __right_counts: Counter
+    __ids: np.ndarray
+    __differences: np.ndarray
+    __n_ids: int
+    __size: int
+    __distance: int
+    __similarity: int
+
+    def __init__(self, pairs: Iterable[Tuple[int, int]] = ()):
+        self.__left_counts = Counter()
+        self.__right_counts = Counter()
+        self.__ids = np.zeros(1024, dtype=np.int64)
+        self.__differences = np.zeros(1024, dtype=np.int64)
+        self.__n_ids = 0
+        self.__size = 0
+        self.__distance = 0
+        self.__similarity = 0
+        self.extend(pairs)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    @property
+    def distance(self) -> int:
+        """
+        The total distance between the two sorted lists.
+
+        Return
+        ------
+        int
+            the sum of the distances between the i-th smallest IDs.
+        """
+        return self.__distance
+
+    @property
+    def similarity(self) -> int:
+        """
+        The similarity score between the two lists.
+
+        Return
+        ------
+        int
+            the sum of each left ID times its occurrences in the right list.
+        """
+        return self.__similarity
+
+    def add(self, left: int, right: int) -> None:
+        """
+        Adds a pair of location IDs.
+
+        The similarity score is updated in O(1) with the occurrences of the
+        two IDs, and the distance with vectorized operations on the distinct
+        IDs between them, whatever their values. An update is therefore
+        linear, not logarithmic, in the number of distinct IDs: a new ID
+        also shifts the sorted arrays after it.
+
+        Parameters
+        ----------
+        left: int
+            the ID added to the left list.
+        right: int
+            the ID added to the right list.
+
+        Raises
+        ------
+        ValueError
+            when an ID is negative or doesn't fit in 63 bits.
+        """
+        if left < 0 or right < 0:
+            raise ValueError("The location IDs must be positive!")
+        if max(left, right) >= 2**63:
+            raise ValueError("The location IDs must fit in 63 bits!")
+
+        self.__left_counts[left] += 1
+        self.__similarity += left * self.__right_counts[left]
+        self.__right_counts[right] += 1
+        self.__similarity += right * self.__left_counts[right]
+        self.__size += 1
+
+        self.__insert(left)
+        self.__insert(right)
+
+        # Each difference d between the two IDs becomes d + 1 (or d - 1),
+        # which adds 1 to |d| when d >= 0 (or d <= 0) and removes 1 otherwise,
+        # for each ID until the next distinct one.
+        start, end = np.searchsorted(self.__ids[:self.__n_ids],
+                                     sorted((left, right)))
+        segment = self.__differences[start:end]
+        weights = np.diff(self.__ids[start:end + 1])
+        if left < right:
+            self.__distance += right - left \
+                - 2 * int(weights.sum(where=segment < 0))
+            segment += 1
+        elif right < left:
+            self.__distance += left - right \
+                - 2 * int(weights.sum(where=segment > 0))
+            segment -= 1
+
+    def extend(self, pairs: Iterable[Tuple[int, int]]) -> None:
+        """
+        Adds several pairs of location IDs.
+
+        Parameters
+        ----------
+        pairs: Iterable[Tuple[int, int]]
+            the pairs of left and right IDs.
+        """
+        for left, right in pairs:
+            self.add(left, right)
+
+    def __insert(self, location: int) -> None:
+        """
+        Adds an ID to the distinct IDs, with the difference of the previous
+        one.
+        """
+        n_ids = self.__n_ids
+        i = int(np.searchsorted(self.__ids[:n_ids], location))
+        if i < n_ids and self.__ids[i] == location:
+            return
+        if n_ids == len(self.__ids):
+            self.__ids = np.concatenate((
+                self.__ids, np.zeros_like(self.__ids)
+            ))
+            self.__differences = np.concatenate((
+                self.__differences, np.zeros_like(self.__differences)
+            ))
+        self.__ids[i + 1:n_ids + 1] = self.__ids[i:n_ids]
+        self.__differences[i + 1:n_ids + 1] = self.__differences[i:n_ids]
+        self.__ids[i] = location
+        self.__differences[i] = self.__differences[i - 1] if i > 0 else 0
+        self.__n_ids += 1
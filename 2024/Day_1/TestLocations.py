@@ -0,0 +1,68 @@
+import random
+from unittest import TestCase
+from Locations import Locations
+
+
+class TestLocations(TestCase):
+    """
+    Unit test class for Locations object.
+    """
+
+    def test_example(self):
+        """
+        Checks if the distance and the similarity of the example are found.
+        """
+        locations = Locations([(3, 4), (4, 3), (2, 5), (1, 3), (3, 9),
+                               (3, 3)])
+        self.assertEqual(6, len(locations))
+        self.assertEqual(11, locations.distance)
+        self.assertEqual(31, locations.similarity)
+
+    def test_add(self):
+        """
+        Checks if the distance and the similarity are those of the whole
+        lists after each pair added.
+        """
+        rng = random.Random(0)
+        locations = Locations()
+        left = []
+        right = []
+        for _ in range(0, 300):
+            pair = (rng.randint(0, 50), rng.randint(0, 50))
+            locations.add(*pair)
+            left.append(pair[0])
+            right.append(pair[1])
+            self.assertEqual(
+                sum(abs(a - b) for a, b in zip(sorted(left), sorted(right))),
+                locations.distance
+            )
+            self.assertEqual(sum(a * right.count(a) for a in left),
+                             locations.similarity)
+
+    def test_add_large_ids(self):
+        """
+        Checks if the distance is found with large and many distinct IDs,
+        the sorted arrays of distinct IDs being shifted at each new one (a
+        linear update) and grown beyond their initial capacity.
+        """
+        rng = random.Random(1)
+        ids = [rng.randint(0, 10**12) for _ in range(0, 300)]
+        locations = Locations()
+        left = []
+        right = []
+        for i in range(0, 3000):
+            pair = (rng.choice(ids), rng.randint(0, 10**12))
+            locations.add(*pair)
+            left.append(pair[0])
+            right.append(pair[1])
+            if i % 100 == 0:
+                self.assertEqual(
+                    sum(abs(a - b)
+                        for a, b in zip(sorted(left), sorted(right))),
+                    locations.distance
+                )
+        self.assertEqual(
+            sum(abs(a - b) for a, b in zip(sorted(left), sorted(right))),
+            locations.distance
+        )
+        self.assertRaises(ValueError, locations.add, 2**63, 0)
@@ -1,9 +1,50 @@
+"""
+Advent of code - Day 1 (2024)
+"""
 import os
 import sys
 import time
-sys.path.append(os.path.abspath("../.."))
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", ".."))
 
-from reader import csv_to_list
+from reader import csv_to_array
+
+
+def parse(file_name: str) -> np.ndarray:
+    """
+    Reads the two lists of location IDs.
+
+    Parameters
+    ----------
+    file_name: str
+        The input file path.
+
+    Returns
+    -------
+    np.ndarray
+        The left and the right lists, as the two rows of an array.
+    """
+    return csv_to_array(file_name, "   ", "column")
+
+
+def part_one(data: np.ndarray) -> int:
+    """
+    Computes the total distance between the two sorted lists.
+    """
+    return int(np.abs(np.sort(data[0]) - np.sort(data[1])).sum())
+
+
+def part_two(data: np.ndarray) -> int:
+    """
+    Computes the similarity score between the two lists, with the number of
+    occurrences of each ID in the right list.
+    """
+    left, left_counts = np.unique(data[0], return_counts=True)
+    right, right_counts = np.unique(data[1], return_counts=True)
+    ids, i_left, i_right = np.intersect1d(left, right, assume_unique=True,
+                                          return_indices=True)
+    return int((ids * left_counts[i_left] * right_counts[i_right]).sum())
 
 
 if __name__ == '__main__':
@@ -11,21 +52,12 @@ if __name__ == '__main__':
 
     start = time.time()
 
-    data = csv_to_list(FILE_NAME, "   ", "column")
-    data[0].sort()
-    data[1].sort()
-
-    first = sum(
-        abs(data[1][i] - data[0][i])
-        for i in range(0, len(data[0]))
-    )
-    second = sum(
-            e_left * sum(1 if e_right == e_left else 0 for e_right in data[1])
-            for e_left in data[0]
-    )
+    DATA = parse(FILE_NAME)
+    FIRST = part_one(DATA)
+    SECOND = part_two(DATA)
 
     end = time.time() - start
 
-    print("First step solution: %d" % first)
-    print("Second step solution: %d" % second)
+    print("First step solution: %d" % FIRST)
+    print("Second step solution: %d" % SECOND)
     print("Found in %fs" % end)
@@ -6,7 +6,8 @@ import os
 import sys
 import time
 from collections import deque
-sys.path.append(os.path.abspath("../.."))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", ".."))
 
 from reader import csv_to_list
 
@@ -128,28 +129,57 @@ def solve(trailheads: List[complex],
     )
 
 
-if __name__ == "__main__":
-    FILE_NAME = sys.argv[1]
+def parse(file_name: str) -> Dict[complex, int]:
+    """
+    Reads the topographical map.
 
-    t = time.time()
+    Parameters
+    ----------
+    file_name: str
+        The input file path.
 
+    Return
+    ------
+    Dict[complex, int]
+        A dictionary that associates each position as a complex number with a
+        height.
+    """
     # Gets the input puzzle as 2D array of intergers.
-    data = csv_to_list(FILE_NAME, None, "row")
+    data = csv_to_list(file_name, None, "row")
 
     # Converts the input puzzle as a dict of position (as a complex number)
     # and the height at this point.
-    maps = {
+    return {
         complex(i, j): height
         for i, row in enumerate(data)
         for j, height in enumerate(row)
     }
 
-    # Find all trailheads.
-    trailheads = find_trailheads(maps)
+
+def part_one(topo_map: Dict[complex, int]) -> int:
+    """
+    Computes the sum of the number of peaks reachable from each trailhead.
+    """
+    return solve(find_trailheads(topo_map), topo_map, 1)
+
+
+def part_two(topo_map: Dict[complex, int]) -> int:
+    """
+    Computes the sum of the number of distinct trails from each trailhead.
+    """
+    return solve(find_trailheads(topo_map), topo_map, 2)
+
+
+if __name__ == "__main__":
+    FILE_NAME = sys.argv[1]
+
+    t = time.time()
+
+    MAPS = parse(FILE_NAME)
 
     # Solve the two parts of the puzzle.
-    FIRST = solve(trailheads, maps, 1)
-    SECOND = solve(trailheads, maps, 2)
+    FIRST = part_one(MAPS)
+    SECOND = part_two(MAPS)
 
     t = time.time() - t
 
@@ -66,24 +66,72 @@ def blink(stones: List[str]) -> Dict[str, int]:
     return result
 
 
+def parse(file_name: str) -> Dict[str, int]:
+    """
+    Reads the numbers engraved on the stones.
+
+    Parameters
+    ----------
+    file_name: str
+        The input file path.
+
+    Return
+    ------
+    Dict[str, int]
+        A dictionary of the stones and their number.
+    """
+    with open(file_name, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+        return {stone: 1 for stone in re.findall("[0-9]+", lines[0])}
+
+
+def n_stones(stones: Dict[str, int], n_blinks: int) -> int:
+    """
+    Computes the number of stones after several blinks.
+
+    Parameters
+    ----------
+    stones: Dict[str, int]
+        A dictionary of the starting stones and their number.
+    n_blinks: int
+        The number of blinks.
+
+    Return
+    ------
+    int
+        The number of stones.
+    """
+    for _ in range(0, n_blinks):
+        stones = blink(stones)
+    return sum(n for n in stones.values())
+
+
+def part_one(stones: Dict[str, int]) -> int:
+    """
+    Computes the number of stones after 25 blinks.
+    """
+    return n_stones(stones, 25)
+
+
+def part_two(stones: Dict[str, int]) -> int:
+    """
+    Computes the number of stones after 75 blinks.
+    """
+    return n_stones(stones, 75)
+
+
 if __name__ == "__main__":
     INPUT = sys.argv[1]
 
     t = time.time()
 
-    with open(INPUT, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-        stones = {stone: 1 for stone in re.findall("[0-9]+", lines[0])}
+    STONES = parse(INPUT)
 
-    FIRST = 0
-    for i in range(0, 75):
-        stones = blink(stones)
-        # First part.
-        if i == 24:
-            FIRST = sum(n for n in stones.values())
+    # First part.
+    FIRST = part_one(STONES)
 
     # Second part.
-    SECOND = sum(n for n in stones.values())
+    SECOND = part_two(STONES)
 
     t = time.time() - t
     print(f"The first part result is {FIRST:d}.")
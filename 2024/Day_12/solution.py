@@ -355,29 +355,51 @@ def number_of_faces(matrix: List[List[str]], indices: List[Tuple[int]]) -> int:
         number_of_v_faces(matrix, i_by_columns)
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-
-    t = time.time()
-
-    with open(INPUT, "r", encoding="utf-8") as f:
-        garden = [
+def parse(file_name: str) -> List[List[str]]:
+    """
+    Reads the matrix that represents the garden.
+    """
+    with open(file_name, "r", encoding="utf-8") as f:
+        return [
             [letter for letter in line if letter != '\n']
             for line in f.readlines()
         ]
 
-    regions = extract_regions(garden)
 
-    FIRST = 0
-    SECOND = 0
-    for plants in regions:
-        # Computes the first part of this puzzle for the current region.
+def part_one(garden: List[List[str]]) -> int:
+    """
+    Computes the total price of fencing all regions by their perimeter.
+    """
+    result = 0
+    for plants in extract_regions(garden):
         perimeter = region_perimeter(garden, plants)
-        FIRST += perimeter * len(plants)
+        result += perimeter * len(plants)
+    return result
+
 
-        # Computes the second part of this puzzle for the current region.
+def part_two(garden: List[List[str]]) -> int:
+    """
+    Computes the total price of fencing all regions by their number of faces.
+    """
+    result = 0
+    for plants in extract_regions(garden):
         n_faces = number_of_faces(garden, plants)
-        SECOND += n_faces * len(plants)
+        result += n_faces * len(plants)
+    return result
+
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+
+    t = time.time()
+
+    GARDEN = parse(INPUT)
+
+    # Computes the first part of this puzzle.
+    FIRST = part_one(GARDEN)
+
+    # Computes the second part of this puzzle.
+    SECOND = part_two(GARDEN)
 
     t = time.time() - t
 
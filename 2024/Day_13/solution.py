@@ -102,51 +102,98 @@ def n_button_b(a: int, b: int, c: int, d: int, e: int, f: int) -> float:
     return (d*c-a*f)/(d*b-a*e)
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
+def parse(file_name: str) -> List[List[int]]:
+    """
+    Reads the claw machines.
 
-    t = time.time()
+    Parameters
+    ----------
+    file_name : str
+        The input file path.
 
-    with open(INPUT, 'r', encoding="utf-8") as f:
-        BUTTONS_A = []
-        BUTTONS_B = []
-        PRIZES = []
+    Return
+    ------
+    List[List[int]]
+        For each claw machine, the moves of the A and B buttons along X, then
+        along Y, and the prize position: [a, b, c, d, e, f] so that
+        a*x + b*y = c and d*x + e*y = f.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
+        buttons_a = []
+        buttons_b = []
+        prizes = []
         for line in f.readlines():
-            claw = {}
             if re.match(r"^Button A:", line):
                 nbs = get_numbers(line)
-                BUTTONS_A.append((nbs[0], nbs[1]))
+                buttons_a.append((nbs[0], nbs[1]))
             elif re.match(r"^Button B:", line):
                 nbs = get_numbers(line)
-                BUTTONS_B.append((nbs[0], nbs[1]))
+                buttons_b.append((nbs[0], nbs[1]))
             elif re.match(r"^Prize:", line):
                 nbs = get_numbers(line)
-                PRIZES.append((nbs[0], nbs[1]))
-
-    FIRST = 0
-    SECOND = 0
-    for i, b_a in enumerate(BUTTONS_A):
-        # Initializes equation's variables.
-        a = b_a[0]
-        b = BUTTONS_B[i][0]
-        c = PRIZES[i][0]
-        d = b_a[1]
-        e = BUTTONS_B[i][1]
-        f = PRIZES[i][1]
-
-        # Computes the first part result.
-        x = n_button_a(a, b, c, d, e, f)
-        y = n_button_b(a, b, c, d, e, f)
-        if x.is_integer() and y.is_integer():
-            FIRST += (int(x)*3 + int(y))
+                prizes.append((nbs[0], nbs[1]))
+
+    return [
+        [b_a[0], buttons_b[i][0], prizes[i][0],
+         b_a[1], buttons_b[i][1], prizes[i][1]]
+        for i, b_a in enumerate(buttons_a)
+    ]
+
+
+def n_tokens(machines: List[List[int]], offset: int = 0) -> int:
+    """
+    Computes the fewest tokens to spend to win all possible prizes.
+
+    Parameters
+    ----------
+    machines : List[List[int]]
+        The equation's variables of each claw machine.
+    offset : int
+        The value added to both coordinates of each prize.
 
-        # Computes the second part result.
-        c = c + 10000000000000
-        f = f + 10000000000000
+    Return
+    ------
+    int
+        The number of tokens.
+    """
+    result = 0
+    for a, b, c, d, e, f in machines:
+        c = c + offset
+        f = f + offset
         x = n_button_a(a, b, c, d, e, f)
         y = n_button_b(a, b, c, d, e, f)
         if x.is_integer() and y.is_integer():
-            SECOND += (int(x)*3 + int(y))
+            result += (int(x)*3 + int(y))
+    return result
+
+
+def part_one(machines: List[List[int]]) -> int:
+    """
+    Computes the fewest tokens to spend to win all possible prizes.
+    """
+    return n_tokens(machines)
+
+
+def part_two(machines: List[List[int]]) -> int:
+    """
+    Computes the fewest tokens to spend to win all possible prizes once their
+    positions are corrected.
+    """
+    return n_tokens(machines, 10000000000000)
+
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+
+    t = time.time()
+
+    MACHINES = parse(INPUT)
+
+    # Computes the first part result.
+    FIRST = part_one(MACHINES)
+
+    # Computes the second part result.
+    SECOND = part_two(MACHINES)
 
     t = time.time() - t
 
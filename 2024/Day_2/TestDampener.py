@@ -0,0 +1,75 @@
+import os
+import random
+import sys
+from unittest import TestCase
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", ".."))
+
+from aoc.days import load_day
+
+# The solution is loaded from its path, since "solution" names the module of
+# every day.
+solution = load_day(2024, 2)
+
+
+class TestDampener(TestCase):
+    """
+    Unit test class for the single scan check of part 2.
+    """
+
+    def test_example(self):
+        """
+        Checks if the reports of the example are classified correctly.
+        """
+        reports = [[7, 6, 4, 2, 1], [1, 2, 7, 8, 9], [9, 7, 6, 2, 1],
+                   [1, 3, 2, 4, 5], [8, 6, 4, 4, 1], [1, 3, 6, 7, 9]]
+        self.assertEqual([True, False, False, True, True, True],
+                         [solution.is_safe_dampened(report)
+                          for report in reports])
+
+    def test_removal_of_first_and_last_levels(self):
+        """
+        Checks if the first or the last level can be the removed one.
+        """
+        self.assertTrue(solution.is_safe_dampened([9, 1, 2, 3]))
+        self.assertTrue(solution.is_safe_dampened([1, 2, 3, 9]))
+        self.assertFalse(solution.is_safe_dampened([9, 1, 2, 3, 9]))
+
+    def test_same_as_each_removal(self):
+        """
+        Checks if the single scan agrees with trying every removal.
+        """
+        rng = random.Random(0)
+        for _ in range(0, 5000):
+            report = [rng.randint(0, 12) for _ in range(rng.randint(0, 8))]
+            expected = solution.is_safe(report) or any(
+                solution.is_safe(report[:i] + report[i+1:])
+                for i in range(0, len(report))
+            )
+            self.assertEqual(expected, solution.is_safe_dampened(report),
+                             report)
+
+    def test_safe_reports(self):
+        """
+        Checks if the batch check of padded reports agrees with the check of
+        each report.
+        """
+        rng = random.Random(1)
+        reports = [
+            [rng.randint(0, 12) for _ in range(rng.randint(0, 8))]
+            for _ in range(5000)
+        ]
+        lengths = np.array([len(report) for report in reports])
+        levels = np.zeros((len(reports), 8), dtype=np.int64)
+        for i, report in enumerate(reports):
+            levels[i, :len(report)] = report
+
+        self.assertEqual([bool(solution.is_safe(report))
+                          for report in reports],
+                         solution.safe_reports(levels, lengths, 1).tolist())
+        self.assertEqual([solution.is_safe_dampened(report)
+                          for report in reports],
+                         solution.safe_reports(levels, lengths, 2).tolist())
+        self.assertRaises(ValueError, solution.safe_reports, levels, lengths,
+                          3)
@@ -1,13 +1,17 @@
 """
 Advent of code - Day 2
 """
+import multiprocessing
 import os
 import sys
 import time
 from collections.abc import Sequence
-sys.path.append(os.path.abspath("../.."))
+from typing import Tuple
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", ".."))
 
-from reader import csv_to_list
+from reader import csv_to_array, line_ranges
 
 
 def is_all_increasing(report: Sequence[int]) -> bool:
@@ -43,6 +47,46 @@ def is_safe(report: Sequence[int]) -> int:
     )
 
 
+def is_safe_dampened(report: Sequence[int]) -> bool:
+    """
+    Check if a report is safe according to the conditions of part 2, i.e.
+    safe for the part 1 once at most one level is removed, in a single scan
+    and without copying the report.
+
+    For each direction (increasing or decreasing), three cases are followed
+    along the levels:
+    - no level has been removed;
+    - a level before the current one has been removed;
+    - the current level is removed, the last level kept is the previous one.
+
+    Parameters
+    ----------
+    report: Sequence[int]
+        the levels of the report.
+
+    Returns
+    -------
+    bool
+        true when the report is safe with at most one level removed.
+    """
+    # Cases of the increasing (+1) and the decreasing (-1) directions. The
+    # removal of the first level is the third case before the scan.
+    kept = [True, True]
+    removed_before = [False, False]
+    removed_current = [True, True]
+    for i in range(1, len(report)):
+        for d, sign in enumerate((1, -1)):
+            is_good = 1 <= (report[i] - report[i-1]) * sign <= 3
+            is_good_skip = i < 2 or 1 <= (report[i] - report[i-2]) * sign <= 3
+            removed_before[d], removed_current[d], kept[d] = (
+                (removed_before[d] and is_good)
+                or (removed_current[d] and is_good_skip),
+                kept[d],
+                kept[d] and is_good
+            )
+    return any(kept) or any(removed_before) or any(removed_current)
+
+
 def n_safe(reports: Sequence[Sequence[int]], part: int = 1) -> int:
     """
     Count the number of safe report according to the conditions of part 1 or 2.
@@ -77,33 +121,177 @@ def n_safe(reports: Sequence[Sequence[int]], part: int = 1) -> int:
         )
 
     elif part == 2:
-        count = 0
-        for report in reports:
-            if is_safe(report):
-                count += 1
-            else:
-                i = 0
-                is_found = False
-                while i < len(report) and not is_found:
-                    is_found = is_safe(report[:i] + report[i+1:])
-                    i += 1
-                if is_found:
-                    count += 1
-        return count
+        return sum(
+            1 if is_safe_dampened(report) else 0
+            for report in reports
+        )
 
     else:
         raise ValueError("The part number must equal 1 or 2.")
 
 
+def safe_reports(levels: np.ndarray, lengths: np.ndarray,
+                 part: int = 1) -> np.ndarray:
+    """
+    Check the safety of all the reports at once according to the conditions
+    of part 1 or 2, with vectorized operations on their differences.
+
+    For each direction, a report with the level j removed is safe when the
+    differences before j-1 and after j+1 are good, as well as the
+    difference between the levels j-1 and j+1 that become neighbours. The
+    cumulative "all good" of the differences from the start and from the
+    end give the first two conditions for every j at once.
+
+    Parameters
+    ----------
+    levels: np.ndarray
+        the levels of the reports, one per row, padded at the end of the
+        shortest reports.
+    lengths: np.ndarray
+        the number of levels of each report.
+    part: int
+        the number of the part that defines the conditions of a safe report.
+
+    Returns
+    -------
+    np.ndarray
+        a boolean per report, true when the report is safe.
+
+    Raises
+    ------
+    ValueError
+        when part is different to 1 and 2.
+    """
+    if part not in (1, 2):
+        raise ValueError("The part number must equal 1 or 2.")
+    n_reports, n_levels = levels.shape
+    if n_levels < 2:
+        return np.ones(n_reports, dtype=bool)
+
+    lengths = lengths[:, np.newaxis]
+    steps = np.diff(levels, axis=1)
+    # The differences with a padding level are always good.
+    is_padding = np.arange(1, n_levels) >= lengths
+    # Difference between the levels j-1 and j+1, for 1 <= j <= n_levels-2.
+    bridges = levels[:, 2:] - levels[:, :-2]
+    is_bridge_padding = np.arange(2, n_levels) >= lengths
+    is_removable = np.arange(0, n_levels) < lengths
+
+    result = np.zeros(n_reports, dtype=bool)
+    for sign in (1, -1):
+        is_good = ((1 <= sign * steps) & (sign * steps <= 3)) | is_padding
+        # before[:, j]: all the differences before the level j are good.
+        # after[:, j]: all the differences after the level j are good.
+        before = np.ones((n_reports, n_levels), dtype=bool)
+        before[:, 1:] = np.logical_and.accumulate(is_good, axis=1)
+        after = np.ones((n_reports, n_levels), dtype=bool)
+        after[:, :-1] = np.logical_and.accumulate(is_good[:, ::-1],
+                                                  axis=1)[:, ::-1]
+        result |= before[:, -1]
+        if part == 1:
+            continue
+
+        is_good_bridge = np.ones((n_reports, n_levels), dtype=bool)
+        is_good_bridge[:, 1:-1] = ((1 <= sign * bridges)
+                                   & (sign * bridges <= 3)) | is_bridge_padding
+        without = np.ones((n_reports, n_levels), dtype=bool)
+        without[:, 1:] = before[:, :-1]
+        without[:, :-1] &= after[:, 1:]
+        without &= is_good_bridge & is_removable
+        result |= without.any(axis=1)
+    return result
+
+
+def count_chunk(file_name: str, start: int, end: int) -> Tuple[int, int]:
+    """
+    Counts the safe reports of a range of lines of a file, according to the
+    conditions of part 1 and 2.
+
+    Parameters
+    ----------
+    file_name: str
+        the input file path.
+    start: int
+        the position of the first byte of the lines.
+    end: int
+        the position after the last byte of the lines.
+
+    Returns
+    -------
+    Tuple[int, int]
+        the number of safe reports of part 1 and of part 2.
+    """
+    levels, lengths = csv_to_array(file_name, ' ', padded=True, start=start,
+                                   end=end)
+    return (int(safe_reports(levels, lengths, 1).sum()),
+            int(safe_reports(levels, lengths, 2).sum()))
+
+
+def n_safe_parallel(file_name: str, n_processes: int | None = None,
+                    chunk_size: int = 2**22) -> Tuple[int, int]:
+    """
+    Counts the safe reports of a file according to the conditions of part 1
+    and 2, with a pool of processes counting ranges of lines. Each process
+    only reads its own ranges, so the file is never loaded at once.
+
+    Parameters
+    ----------
+    file_name: str
+        the input file path.
+    n_processes: int | None
+        the number of processes, or None for the number of processors.
+    chunk_size: int
+        the approximate number of bytes of each range of lines.
+
+    Returns
+    -------
+    Tuple[int, int]
+        the number of safe reports of part 1 and of part 2.
+    """
+    ranges = line_ranges(file_name, chunk_size)
+    with multiprocessing.Pool(n_processes) as pool:
+        counts = pool.starmap(count_chunk,
+                              [(file_name, start, end)
+                               for start, end in ranges], chunksize=1)
+    return sum(c[0] for c in counts), sum(c[1] for c in counts)
+
+
+def parse(file_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reads the reports, one per line, as a padded array and the number of
+    levels of each report.
+    """
+    return csv_to_array(file_name, ' ', padded=True)
+
+
+def part_one(reports: Tuple[np.ndarray, np.ndarray]) -> int:
+    """
+    Counts the safe reports according to the conditions of part 1.
+    """
+    return int(safe_reports(*reports, 1).sum())
+
+
+def part_two(reports: Tuple[np.ndarray, np.ndarray]) -> int:
+    """
+    Counts the safe reports according to the conditions of part 2.
+    """
+    return int(safe_reports(*reports, 2).sum())
+
+
 if __name__ == '__main__':
     FILE_NAME = sys.argv[1]
 
     t = time.time()
-    reports = csv_to_list(FILE_NAME, ' ')
-    first = n_safe(reports, 1)
-    second = n_safe(reports, 2)
+    if len(sys.argv) > 2:
+        # Counts ranges of lines in parallel with the given number of
+        # processes.
+        FIRST, SECOND = n_safe_parallel(FILE_NAME, int(sys.argv[2]))
+    else:
+        REPORTS = parse(FILE_NAME)
+        FIRST = part_one(REPORTS)
+        SECOND = part_two(REPORTS)
     t = time.time() - t
 
-    print(f"The first part result is: {first:d}")
-    print(f"The second part result is: {second:d}")
+    print(f"The first part result is: {FIRST:d}")
+    print(f"The second part result is: {SECOND:d}")
     print(f"Found in {t:.5f}s !")
@@ -0,0 +1,55 @@
+import os
+import random
+import sys
+import tempfile
+from unittest import TestCase
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", ".."))
+
+from aoc.days import load_day
+
+# The solution is loaded from its path, since "solution" names the module of
+# every day.
+solution = load_day(2024, 3)
+
+
+class TestScanner(TestCase):
+    """
+    Unit test class for the scan of the memory by chunks.
+    """
+
+    def setUp(self):
+        rng = random.Random(0)
+        tokens = ["mul(2,4)", "mul(11,8)", "mul(123,456)", "do()", "don't()",
+                  "mul[3,7]", "mul(32,64]", "mul ( 2 , 4 )", "x", "&", "\n"]
+        self.memory = "".join(rng.choice(tokens) for _ in range(300))
+        self.dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.dir.name, "input.txt")
+        with open(self.file_name, "w", encoding="utf-8") as f:
+            f.write(self.memory)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_chunks(self):
+        """
+        Checks if the chunks give the sums of the whole memory, whatever the
+        instructions cut by their boundaries.
+        """
+        size = len(self.memory)
+        for chunk_size in range(1, 40):
+            chunks = [
+                solution.scan_chunk(self.file_name, start,
+                                    min(start + chunk_size, size))
+                for start in range(0, size, chunk_size)
+            ]
+            self.assertEqual(solution.scan(self.memory),
+                             solution.combine(chunks))
+
+    def test_parallel(self):
+        """
+        Checks if the scan of the chunks by a pool of processes gives the
+        sums of the whole memory.
+        """
+        self.assertEqual(solution.scan(self.memory),
+                         solution.scan_parallel(self.file_name, 2, 100))
@@ -1,9 +1,213 @@
 """
 Advent of code - Day 3
 """
+import mmap
+import multiprocessing
+import os
 import re
 import sys
 import time
+from itertools import chain
+from operator import mul
+from typing import List, Tuple
+
+
+# Regular expressions of the instructions.
+REG_INT = "[1-9][0-9]*"
+REG_DO = "do\\(\\)"
+REG_DONT = "don't\\(\\)"
+
+# Scanner of the multiplications, with their operands in the groups 1 and 2.
+MUL_SCANNER = re.compile(f"mul\\(({REG_INT:}),({REG_INT:})\\)")
+
+
+def parse(file_name: str) -> str:
+    """
+    Reads the whole corrupted memory.
+    """
+    with open(file_name, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def sum_products(memory: str) -> int:
+    """
+    Adds up the results of the multiplications of a part of the memory.
+    """
+    values = list(map(int, chain.from_iterable(MUL_SCANNER.findall(memory))))
+    return sum(map(mul, values[::2], values[1::2]))
+
+
+def scan(memory: str) -> Tuple[int, int]:
+    """
+    Adds up the results of the multiplications in a single pass, for both
+    parts.
+
+    The memory is cut at each don't(): the multiplications before the first
+    do() of a piece are disabled and the others are enabled (the first piece
+    is enabled from its start). Since no instruction contains another, each
+    character is scanned once and a multiplication is never cut.
+
+    Parameters
+    ----------
+    memory: str
+        the corrupted memory.
+
+    Returns
+    -------
+    Tuple[int, int]
+        the sum of all the multiplications, and the sum of those enabled by
+        do() and disabled by don't() instructions.
+    """
+    pieces = memory.split("don't()")
+    enabled = sum_products(pieces[0])
+    disabled = 0
+    for piece in pieces[1:]:
+        off, _, on = piece.partition("do()")
+        disabled += sum_products(off)
+        enabled += sum_products(on)
+    return enabled + disabled, enabled
+
+
+# Scanner of all the instructions in bytes, with the operands of a
+# multiplication in the groups 1 and 2.
+BYTES_SCANNER = re.compile(
+    f"mul\\(({REG_INT:}),({REG_INT:})\\)|({REG_DO:})|({REG_DONT:})"
+    .encode("ascii")
+)
+
+# Number of bytes read after a chunk, to complete the instructions starting
+# at its end (mul(999,999) has 12 characters).
+OVERLAP = 64
+
+
+def scan_chunk(file_name: str, start: int,
+               end: int) -> Tuple[int, int, int, bool | None]:
+    """
+    Adds up the results of the multiplications starting in a chunk of a
+    file, without knowing if they are enabled at the start of the chunk.
+
+    The file is memory-mapped and OVERLAP bytes after the chunk are scanned
+    too, so that an instruction cut by the end of the chunk is found, but
+    only the instructions starting in the chunk are counted. Since no
+    instruction contains the start of another one, each instruction is
+    counted by exactly one chunk.
+
+    Parameters
+    ----------
+    file_name: str
+        the input file path.
+    start: int
+        the position of the first byte of the chunk.
+    end: int
+        the position after the last byte of the chunk.
+
+    Returns
+    -------
+    Tuple[int, int, int, bool | None]
+        the sum of all the multiplications, the sum of the enabled ones when
+        the chunk starts enabled, and when it starts disabled, and whether
+        the multiplications are enabled at the end of the chunk (None when
+        the chunk has no do() nor don't()).
+    """
+    total = 0
+    before = 0
+    after = 0
+    do = None
+    with open(file_name, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+        for match in BYTES_SCANNER.finditer(
+            memory, start, min(end + OVERLAP, len(memory))
+        ):
+            if match.start() >= end:
+                break
+            left, right, is_do, is_dont = match.groups()
+            if is_do:
+                do = True
+            elif is_dont:
+                do = False
+            else:
+                product = int(left) * int(right)
+                total += product
+                if do is None:
+                    before += product
+                elif do:
+                    after += product
+    return total, before + after, after, do
+
+
+def combine(chunks: List[Tuple[int, int, int, bool | None]]
+            ) -> Tuple[int, int]:
+    """
+    Combines the sums of consecutive chunks (see scan_chunk), the first one
+    starting enabled.
+
+    Parameters
+    ----------
+    chunks: List[Tuple[int, int, int, bool | None]]
+        the sums of each chunk, in order.
+
+    Returns
+    -------
+    Tuple[int, int]
+        the sum of all the multiplications, and the sum of those enabled.
+    """
+    first = 0
+    second = 0
+    do = True
+    for total, if_enabled, if_disabled, final in chunks:
+        first += total
+        second += if_enabled if do else if_disabled
+        if final is not None:
+            do = final
+    return first, second
+
+
+def scan_parallel(file_name: str, n_processes: int | None = None,
+                  chunk_size: int = 2**24) -> Tuple[int, int]:
+    """
+    Adds up the results of the multiplications for both parts, with a pool
+    of processes scanning chunks of the memory-mapped file.
+
+    Parameters
+    ----------
+    file_name: str
+        the input file path.
+    n_processes: int | None
+        the number of processes, or None for the number of processors.
+    chunk_size: int
+        the number of bytes of each chunk.
+
+    Returns
+    -------
+    Tuple[int, int]
+        the sum of all the multiplications, and the sum of those enabled by
+        do() and disabled by don't() instructions.
+    """
+    size = os.path.getsize(file_name)
+    ranges = [
+        (file_name, start, min(start + chunk_size, size))
+        for start in range(0, size, chunk_size)
+    ]
+    with multiprocessing.Pool(n_processes) as pool:
+        return combine(pool.starmap(scan_chunk, ranges, chunksize=1))
+
+
+def part_one(memory: str) -> int:
+    """
+    Adds up the results of all the multiplications.
+    """
+    return sum_products(memory)
+
+
+def part_two(memory: str) -> int:
+    """
+    Adds up the results of the multiplications enabled by do() and disabled by
+    don't() instructions.
+    """
+    pieces = memory.split("don't()")
+    return sum_products(pieces[0]) + sum(
+        sum_products(piece.partition("do()")[2]) for piece in pieces[1:]
+    )
 
 
 if __name__ == '__main__':
@@ -11,40 +215,18 @@ if __name__ == '__main__':
 
     t = time.time()
 
-    reg_int = "[1-9][0-9]*"
-    reg_mul = f"mul\({reg_int:},{reg_int:}\)"
-    reg_do = "do\(\)"
-    reg_dont = "don't\(\)"
-    reg = f"{reg_mul:}|{reg_do:}|{reg_dont:}"
-
-    with open(FILE_NAME, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-        # First part.
-        first = 0
-        for line in lines:
-            matches = re.findall(reg_mul, line)
-            for match in matches:
-                m_val = re.findall(reg_int, match)
-                first += int(m_val[0]) * int(m_val[1])
-
-        # Second part.
-        do = True
-        second = 0
-        for line in lines:
-            matches = re.findall(reg, line)
-            for match in matches:
-                if match == "do()":
-                    do = True
-                elif match == "don't()":
-                    do = False
-                else:
-                    if do:
-                        m_val = re.findall(reg_int, match)
-                        second += int(m_val[0]) * int(m_val[1])
+    if len(sys.argv) > 2:
+        # Scans chunks of the file in parallel with the given number of
+        # processes.
+        FIRST, SECOND = scan_parallel(FILE_NAME, int(sys.argv[2]))
+    else:
+        MEMORY = parse(FILE_NAME)
+
+        # Both parts at once.
+        FIRST, SECOND = scan(MEMORY)
 
     t = time.time() - t
 
-    print(f"The first part result is: {first:d}.")
-    print(f"The second part result is: {second:d}.")
+    print(f"The first part result is: {FIRST:d}.")
+    print(f"The second part result is: {SECOND:d}.")
     print(f"Found in {t:.5f}s!")
@@ -0,0 +1,448 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+class LetterGrid():
+    """
+    Object modeling the letter grid of day 4 of Advent of Code 2024, in
+    which words are searched with vectorized comparisons of shifted views of
+    the grid instead of regular expressions.
+
+    Attributes
+    ----------
+    __grid: np.ndarray
+        The (rows, columns) uint8 array of the letters.
+    """
+
+    __grid: np.ndarray
+
+    # The 8 directions (row step, column step) in which a word can be read.
+    DIRECTIONS: Tuple[Tuple[int, int], ...] = (
+        (0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1)
+    )
+
+    # Number of cells compared at once, to bound the memory of the masks.
+    BAND_SIZE: int = 2**22
+
+    def __init__(self, grid: np.ndarray):
+        if grid.ndim != 2:
+            raise ValueError("The grid must have two dimensions!")
+        self.__grid = grid
+
+    def __str__(self):
+        return "\n".join(bytes(row).decode("ascii") for row in self.__grid)
+
+    @staticmethod
+    def build_from_string(grid: str):
+        """
+        Build an object LetterGrid with the lines of a string.
+
+        Parameters
+        ----------
+        grid: str
+            the lines of the grid.
+
+        Raises
+        ------
+        ValueError
+            when the grid is empty or when its lines don't have the same
+            length.
+        """
+        lines = grid.split()
+        if len(lines) == 0 or any(len(line) != len(lines[0])
+                                  for line in lines):
+            raise ValueError("The grid must be a non-empty rectangle!")
+        return LetterGrid(np.array([list(line.encode("ascii"))
+                                    for line in lines], dtype=np.uint8))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """
+        The number of rows and columns of the grid.
+
+        Return
+        ------
+        Tuple[int, int]
+            the shape.
+        """
+        return self.__grid.shape
+
+    def count_word(self, word: str) -> int:
+        """
+        Counts the occurrences of a word in the 8 directions.
+
+        For each direction, the cells where the word can start are compared
+        with its first letter, the cells one step further with its second
+        letter, and so on, each comparison being made on a shifted view of
+        the whole grid. The grid is processed by bands of rows, with the
+        rows needed by the words starting in a band.
+
+        Parameters
+        ----------
+        word: str
+            the word, of ASCII letters.
+
+        Returns
+        -------
+        int
+            the number of occurrences. A word of a single letter is counted
+            once per cell.
+
+        Raises
+        ------
+        ValueError
+            when the word is empty.
+        """
+        if len(word) == 0:
+            raise ValueError("The word must not be empty!")
+        letters = list(word.encode("ascii"))
+        span = len(letters) - 1
+        directions = self.DIRECTIONS if span > 0 else ((0, 1),)
+
+        n_rows, n_cols = self.__grid.shape
+        band = max(1, self.BAND_SIZE // max(1, n_cols))
+        count = 0
+        for start in range(0, n_rows, band):
+            end = min(start + band, n_rows)
+            top = max(0, start - span)
+            rows = self.__grid[top:min(n_rows, end + span)]
+            masks = {letter: rows == letter for letter in set(letters)}
+
+            for d_row, d_col in directions:
+                # Cells of the band where the word fits in this direction.
+                r_min = max(start - top, -span * d_row)
+                r_max = min(end - top, len(rows) - span * d_row)
+                c_min = max(0, -span * d_col)
+                c_max = min(n_cols, n_cols - span * d_col)
+                if r_min >= r_max or c_min >= c_max:
+                    continue
+
+                found = masks[letters[0]][r_min:r_max, c_min:c_max].copy()
+                for k in range(1, len(letters)):
+                    found &= masks[letters[k]][
+                        r_min + k*d_row:r_max + k*d_row,
+                        c_min + k*d_col:c_max + k*d_col
+                    ]
+                count += int(np.count_nonzero(found))
+        return count
+
+    def count_words(self, words: Iterable[str]) -> Dict[str, int]:
+        """
+        Counts the occurrences of several words in the 8 directions at once,
+        with an Aho-Corasick automaton.
+
+        Every row, column and diagonal is read once in each direction by
+        the automaton, all the lines of a family being advanced together.
+        The diagonals are read as the columns of a sheared copy of the grid.
+        The grid is processed by bands of rows, the state of each column and
+        diagonal being kept from a band to the next one, so the memory stays
+        bounded. The states reached are counted, and each word is counted
+        with the states whose text ends with it. The cost is linear in the
+        size of the grid plus the size of the automaton, whatever the number
+        of words.
+
+        Parameters
+        ----------
+        words: Iterable[str]
+            the words, of ASCII letters.
+
+        Returns
+        -------
+        Dict[str, int]
+            the number of occurrences of each word, as count_word.
+
+        Raises
+        ------
+        ValueError
+            when a word is empty.
+        """
+        words = list(words)
+        if any(len(word) == 0 for word in words):
+            raise ValueError("The words must not be empty!")
+        result = {word: 0 for word in words}
+        n_rows, n_cols = self.__grid.shape
+        n_diagonals = n_rows + n_cols - 1
+        band = max(1, self.BAND_SIZE // n_diagonals)
+
+        # A word of a single letter is read once per cell, not 8 times.
+        for word in result:
+            if len(word) == 1:
+                result[word] = sum(
+                    int(np.count_nonzero(
+                        self.__grid[start:start + band] == ord(word)
+                    ))
+                    for start in range(0, n_rows, band)
+                )
+        words = [word for word in result if len(word) > 1]
+        if len(words) == 0:
+            return result
+
+        # Index of each letter in the transition table, 0 for the others.
+        letters = sorted(set("".join(words)))
+        index = np.zeros(256, dtype=np.uint8)
+        for i, letter in enumerate(letters):
+            index[ord(letter)] = i + 1
+        transitions, nodes, order, fails = self.__automaton(words, index)
+
+        visits = np.zeros(len(transitions), dtype=np.int64)
+        for is_forward in (True, False):
+            # The columns and the diagonals cross the bands: the state of
+            # each of them is kept from a band to the next one.
+            states = [np.zeros(n_cols, dtype=np.int32),
+                      np.zeros(n_diagonals, dtype=np.int32),
+                      np.zeros(n_diagonals, dtype=np.int32)]
+            starts = range(0, n_rows, band)
+            for start in starts if is_forward else reversed(starts):
+                end = min(start + band, n_rows)
+                codes = index[self.__grid[start:end]]
+                if is_forward:
+                    # The rows are read in both directions at once.
+                    for steps in (codes.T, codes.T[::-1]):
+                        visits += self.__visits(
+                            transitions, steps,
+                            np.zeros(len(codes), dtype=np.int32)
+                        )
+
+                # Columns of the first copy are the diagonals going
+                # down-left, those of the second copy the diagonals going
+                # down-right.
+                sheared = np.zeros((2, end - start, n_diagonals),
+                                   dtype=codes.dtype)
+                for row in range(start, end):
+                    sheared[0, row - start, row:row + n_cols] = \
+                        codes[row - start]
+                    sheared[1, row - start,
+                            n_rows - 1 - row:n_rows - 1 - row + n_cols] = \
+                        codes[row - start]
+
+                for lines, line_states in zip(
+                    (codes, sheared[0], sheared[1]), states
+                ):
+                    visits += self.__visits(
+                        transitions, lines if is_forward else lines[::-1],
+                        line_states
+                    )
+
+        # A state visited ends the words of the states on its fail links.
+        for state in reversed(order):
+            visits[fails[state]] += visits[state]
+        visits[0] = 0
+        for word in words:
+            result[word] = int(visits[nodes[word]])
+        return result
+
+    @staticmethod
+    def variants(template: str, symmetric: bool = False,
+                 wildcard: str = '.') -> List[np.ndarray]:
+        """
+        Builds the distinct orientations of a template.
+
+        Parameters
+        ----------
+        template: str
+            the lines of the template.
+        symmetric: bool, default: False
+            when true, then the 4 rotations of the template and of its
+            mirror image are built, else only the template itself.
+        wildcard: str, default: '.'
+            the character matching any letter.
+
+        Returns
+        -------
+        List[np.ndarray]
+            the (rows, columns) uint8 array of each distinct orientation,
+            the wildcards being 0.
+
+        Raises
+        ------
+        ValueError
+            when the template is empty or when its lines don't have the same
+            length.
+        """
+        lines = template.split()
+        if len(lines) == 0 or any(len(line) != len(lines[0])
+                                  for line in lines):
+            raise ValueError("The template must be a non-empty rectangle!")
+        array = np.array([list(line.encode("ascii")) for line in lines],
+                         dtype=np.uint8)
+        array[array == ord(wildcard)] = 0
+
+        orientations = [array]
+        if symmetric:
+            orientations = [
+                np.rot90(image, k)
+                for image in (array, array[:, ::-1])
+                for k in range(0, 4)
+            ]
+        result = []
+        for orientation in orientations:
+            if not any(orientation.shape == other.shape
+                       and np.array_equal(orientation, other)
+                       for other in result):
+                result.append(orientation)
+        return result
+
+    def count_template(self, template: str, symmetric: bool = False,
+                       wildcard: str = '.') -> int:
+        """
+        Counts the windows of the grid matching a template.
+
+        Parameters
+        ----------
+        template: str
+            the lines of the template, e.g. "M.S\n.A.\nM.S" for a X-MAS.
+        symmetric: bool, default: False
+            when true, then the rotations and the reflections of the template
+            are matched too, a window being counted once per distinct
+            orientation it matches.
+        wildcard: str, default: '.'
+            the character matching any letter.
+
+        Returns
+        -------
+        int
+            the number of matches.
+        """
+        return sum(
+            int(np.count_nonzero(found))
+            for _, found in self.__match(template, symmetric, wildcard)
+        )
+
+    def find_template(self, template: str, symmetric: bool = False,
+                      wildcard: str = '.') -> np.ndarray:
+        """
+        Finds the windows of the grid matching a template.
+
+        Parameters
+        ----------
+        template: str
+            the lines of the template.
+        symmetric: bool, default: False
+            when true, then the rotations and the reflections of the template
+            are matched too.
+        wildcard: str, default: '.'
+            the character matching any letter.
+
+        Returns
+        -------
+        np.ndarray
+            the (matches, 2) array of the row and the column of the top-left
+            cell of each match, orientation after orientation.
+        """
+        positions = [
+            np.argwhere(found) + [start, 0]
+            for start, found in self.__match(template, symmetric, wildcard)
+        ]
+        if len(positions) == 0:
+            return np.zeros((0, 2), dtype=np.intp)
+        return np.concatenate(positions)
+
+    def __match(self, template: str, symmetric: bool,
+                wildcard: str) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Compares each orientation of a template with all the windows of the
+        grid, by bands of rows: each letter of the template is compared with
+        a shifted view of the band, and the comparisons are combined.
+
+        Returns
+        -------
+        Iterator[Tuple[int, np.ndarray]]
+            for each band and each orientation, the row of the first window
+            of the band and the mask of the windows matching.
+        """
+        n_rows, n_cols = self.__grid.shape
+        band = max(1, self.BAND_SIZE // max(1, n_cols))
+        for variant in self.variants(template, symmetric, wildcard):
+            height, width = variant.shape
+            n_windows = n_rows - height + 1
+            if n_windows <= 0 or width > n_cols:
+                continue
+            letters = np.argwhere(variant != 0)
+            for start in range(0, n_windows, band):
+                end = min(start + band, n_windows)
+                found = np.ones((end - start, n_cols - width + 1), dtype=bool)
+                for row, col in letters:
+                    found &= self.__grid[
+                        start + row:end + row, col:n_cols - width + 1 + col
+                    ] == variant[row, col]
+                yield start, found
+
+    @staticmethod
+    def __automaton(words: List[str], index: np.ndarray
+                    ) -> Tuple[np.ndarray, Dict[str, int], List[int],
+                               List[int]]:
+        """
+        Builds the Aho-Corasick automaton of words, with a transition for
+        each state and each letter.
+
+        Returns
+        -------
+        Tuple[np.ndarray, Dict[str, int], List[int], List[int]]
+            the (states, letters) table of transitions, the state of each
+            word, the states in breadth-first order, and the fail link of
+            each state (the state of its longest proper suffix).
+        """
+        children: List[Dict[int, int]] = [{}]
+        nodes = {}
+        for word in words:
+            state = 0
+            for letter in index[list(word.encode("ascii"))]:
+                if letter not in children[state]:
+                    children[state][letter] = len(children)
+                    children.append({})
+                state = children[state][letter]
+            nodes[word] = state
+
+        n_letters = int(index.max()) + 1
+        transitions = np.zeros((len(children), n_letters), dtype=np.int32)
+        fails = [0] * len(children)
+        order = []
+        queue = deque()
+        for letter, child in children[0].items():
+            transitions[0, letter] = child
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            transitions[state] = transitions[fails[state]]
+            for letter, child in children[state].items():
+                fails[child] = transitions[fails[state], letter]
+                transitions[state, letter] = child
+                queue.append(child)
+        return transitions, nodes, order, fails
+
+    def __visits(self, transitions: np.ndarray, steps: np.ndarray,
+                 states: np.ndarray) -> np.ndarray:
+        """
+        Reads lines with the automaton, all the lines being advanced
+        together, and counts the visits of each state.
+
+        Parameters
+        ----------
+        transitions: np.ndarray
+            the (states, letters) table of transitions.
+        steps: np.ndarray
+            the (steps, lines) array of the letter indexes of the lines.
+        states: np.ndarray
+            the state of each line before the steps, updated in place.
+
+        Returns
+        -------
+        np.ndarray
+            the number of visits of each state.
+        """
+        n_steps, n_lines = steps.shape
+        visits = np.zeros(len(transitions), dtype=np.int64)
+        block = max(1, self.BAND_SIZE // max(1, n_lines))
+        path = np.empty((min(block, n_steps), n_lines), dtype=np.int32)
+        for start in range(0, n_steps, block):
+            end = min(start + block, n_steps)
+            for step in range(start, end):
+                states[:] = transitions[states, steps[step]]
+                path[step - start] = states
+            visits += np.bincount(path[:end - start].ravel(),
+                                  minlength=len(transitions))
+        return visits
@@ -0,0 +1,138 @@
+import random
+from unittest import TestCase
+from LetterGrid import LetterGrid
+
+
+EXAMPLE = """MMMSXXMASM
+MSAMXMSMSA
+AMXSXMAAMM
+MSAMASMSMX
+XMASAMXAMM
+XXAMMXXAMA
+SMSMSASXSS
+SAXAMASAAA
+MAMMMXMMMM
+MXMXAXMASX"""
+
+
+def count_brute_force(lines, word):
+    """
+    Counts the occurrences of a word by reading it from each cell in each
+    direction.
+    """
+    count = 0
+    for row in range(0, len(lines)):
+        for col in range(0, len(lines[0])):
+            for d_row, d_col in LetterGrid.DIRECTIONS:
+                cells = [(row + k*d_row, col + k*d_col)
+                         for k in range(0, len(word))]
+                if all(0 <= r < len(lines) and 0 <= c < len(lines[0])
+                       and lines[r][c] == word[k]
+                       for k, (r, c) in enumerate(cells)):
+                    count += 1
+    return count
+
+
+def find_brute_force(lines, template):
+    """
+    Finds the windows matching a template by comparing each of their cells.
+    """
+    result = []
+    height, width = len(template), len(template[0])
+    for row in range(0, len(lines) - height + 1):
+        for col in range(0, len(lines[0]) - width + 1):
+            if all(template[i][j] in ('.', lines[row + i][col + j])
+                   for i in range(0, height) for j in range(0, width)):
+                result.append([row, col])
+    return result
+
+
+class TestLetterGrid(TestCase):
+    """
+    Unit test class for LetterGrid object.
+    """
+
+    def test_build_from_string_not_rectangular(self):
+        """
+        Checks if the build from a string raises an exception when the lines
+        don't have the same length.
+        """
+        self.assertRaises(ValueError, LetterGrid.build_from_string,
+                          "XMAS\nXMA\n")
+        self.assertRaises(ValueError, LetterGrid.build_from_string, "")
+
+    def test_count_word_example(self):
+        """
+        Checks if the XMAS words of the example are found.
+        """
+        grid = LetterGrid.build_from_string(EXAMPLE)
+        self.assertEqual(18, grid.count_word("XMAS"))
+        self.assertEqual(EXAMPLE, str(grid))
+        self.assertRaises(ValueError, grid.count_word, "")
+
+    def test_count_word(self):
+        """
+        Checks if the counts are those of reading each word from each cell,
+        with bands of a few rows.
+        """
+        rng = random.Random(0)
+        lines = ["".join(rng.choice("XMAS") for _ in range(0, 13))
+                 for _ in range(0, 17)]
+        grid = LetterGrid.build_from_string("\n".join(lines))
+        grid.BAND_SIZE = 20
+        for word in ("XMAS", "AS", "SAMXS", "MAM", "XMASXMASXMASXMAS"):
+            self.assertEqual(count_brute_force(lines, word),
+                             grid.count_word(word), word)
+        self.assertEqual(sum(line.count("A") for line in lines),
+                         grid.count_word("A"))
+
+    def test_count_words(self):
+        """
+        Checks if the counts of several words at once are those of each
+        word, including words which are part of others.
+        """
+        rng = random.Random(1)
+        lines = ["".join(rng.choice("XMAS") for _ in range(0, 11))
+                 for _ in range(0, 7)]
+        grid = LetterGrid.build_from_string("\n".join(lines))
+        words = ["XMAS", "MAS", "AS", "SAM", "MAM", "XX", "A", "XMASX",
+                 "XQ", "Q"]
+        expected = {word: grid.count_word(word) for word in words}
+        for band_size in (20, 50, 2**22):
+            grid.BAND_SIZE = band_size
+            self.assertEqual(expected, grid.count_words(words))
+        self.assertRaises(ValueError, grid.count_words, ["XMAS", ""])
+
+    def test_count_template_example(self):
+        """
+        Checks if the X-MAS of the example are found with the 4 orientations
+        of the cross.
+        """
+        grid = LetterGrid.build_from_string(EXAMPLE)
+        self.assertEqual(4, len(LetterGrid.variants("M.S\n.A.\nM.S", True)))
+        self.assertEqual(9, grid.count_template("M.S\n.A.\nM.S", True))
+        self.assertEqual(0, grid.count_template("M" * 11))
+        self.assertRaises(ValueError, grid.count_template, "MS\nA")
+
+    def test_find_template(self):
+        """
+        Checks if the windows found are those matching each orientation of a
+        template, with bands of a few rows.
+        """
+        rng = random.Random(2)
+        lines = ["".join(rng.choice("XMAS") for _ in range(0, 9))
+                 for _ in range(0, 12)]
+        grid = LetterGrid.build_from_string("\n".join(lines))
+        grid.BAND_SIZE = 20
+        template = "X.A\nM.."
+        expected = []
+        for variant in LetterGrid.variants(template, True):
+            expected.extend(find_brute_force(
+                lines,
+                ["".join(chr(c) if c else '.' for c in row)
+                 for row in variant]
+            ))
+        self.assertEqual(8, len(LetterGrid.variants(template, True)))
+        self.assertEqual(expected,
+                         grid.find_template(template, True).tolist())
+        self.assertEqual(len(expected), grid.count_template(template, True))
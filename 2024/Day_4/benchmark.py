@@ -0,0 +1,60 @@
+"""
+Advent of code - Day 4 (2024)
+Benchmark of the XMAS search with regular expressions, on the grid as a
+single string, and with LetterGrid, on the grid as an array.
+The vertical and diagonal regular expressions skip a whole line for each
+letter tried, so they take O(n^3) for a n x n grid: about 2s for 1000 x
+1000 letters, and more than 15 minutes for 10000 x 10000 (against 1s for
+LetterGrid).
+
+python benchmark.py [SIZE [SEED]] (default: 1000 x 1000 letters)
+"""
+import re
+import sys
+import time
+import numpy as np
+from LetterGrid import LetterGrid
+
+
+def count_xmas_regex(data: str, n: int) -> int:
+    """
+    Counts the XMAS words in all 8 directions with regular expressions, the
+    lines being separated by spaces in data and n being their length.
+    """
+    # Number of characters to skip to make a left or right diagonal.
+    l = n + 1
+    r = n - 1
+
+    return (
+        len(re.findall("XMAS", data)) + len(re.findall("SAMX", data))
+        + len(re.findall(f"(?=X.{{{n:d}}}M.{{{n:d}}}A.{{{n:d}}}S)", data))
+        + len(re.findall(f"(?=S.{{{n:d}}}A.{{{n:d}}}M.{{{n:d}}}X)", data))
+        + len(re.findall(f"(?=S.{{{l:d}}}A.{{{l:d}}}M.{{{l:d}}}X)", data))
+        + len(re.findall(f"(?=X.{{{l:d}}}M.{{{l:d}}}A.{{{l:d}}}S)", data))
+        + len(re.findall(f"(?=S.{{{r:d}}}A.{{{r:d}}}M.{{{r:d}}}X)", data))
+        + len(re.findall(f"(?=X.{{{r:d}}}M.{{{r:d}}}A.{{{r:d}}}S)", data))
+    )
+
+
+if __name__ == "__main__":
+    SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    SEED = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    GRID = np.random.default_rng(SEED).choice(
+        np.frombuffer(b"XMAS", dtype=np.uint8), (SIZE, SIZE)
+    )
+
+    t = time.time()
+    ARRAY_COUNT = LetterGrid(GRID).count_word("XMAS")
+    t = time.time() - t
+    print(f"LetterGrid: {ARRAY_COUNT:d} XMAS found in {t:.5f}s")
+
+    t = time.time()
+    DATA = b" ".join(bytes(row) for row in GRID).decode("ascii") + " "
+    REGEX_COUNT = count_xmas_regex(DATA, SIZE)
+    t = time.time() - t
+    print(f"Regex: {REGEX_COUNT:d} XMAS found in {t:.5f}s")
+
+    if ARRAY_COUNT != REGEX_COUNT:
+        print("The counts are different!")
+        sys.exit(1)
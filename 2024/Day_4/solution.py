@@ -1,9 +1,41 @@
 """
 Advent of code - Day 4
 """
-import re
+import os
 import sys
 import time
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", ".."))
+
+from reader import grid_to_array
+from LetterGrid import LetterGrid
+
+
+def parse(file_name: str) -> np.ndarray:
+    """
+    Maps the letter grid into memory.
+
+    Returns
+    -------
+    np.ndarray
+        The (rows, columns) uint8 array of the letters.
+    """
+    return grid_to_array(file_name)
+
+
+def part_one(grid: np.ndarray) -> int:
+    """
+    Counts the XMAS words in all 8 directions.
+    """
+    return LetterGrid(grid).count_word("XMAS")
+
+
+def part_two(grid: np.ndarray) -> int:
+    """
+    Counts the MAS words crossed in X.
+    """
+    return LetterGrid(grid).count_template("M.S\n.A.\nM.S", symmetric=True)
 
 
 if __name__ == "__main__":
@@ -11,41 +43,16 @@ if __name__ == "__main__":
 
     t = time.time()
 
-    # Convert the contents of the file into a single string to apply our
-    # regular expressions.
-    # Line breaks are replaced by spaces, as .{INT} segments do not work with.
-    DATA = ""
-    with open(FILE_NAME, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-        n = len(lines[0]) - 1
-        for line in lines:
-            DATA += line[:len(line)-1] + " "
-
-    # Number of characters to skip to make a left or right diagonal.
-    l = n + 1
-    r = n - 1
+    DATA = parse(FILE_NAME)
 
     # First part.
-    first = (
-        len(re.findall("XMAS", DATA)) + len(re.findall("SAMX", DATA))
-        + len(re.findall(f"(?=X.{{{n:d}}}M.{{{n:d}}}A.{{{n:d}}}S)", DATA))
-        + len(re.findall(f"(?=S.{{{n:d}}}A.{{{n:d}}}M.{{{n:d}}}X)", DATA))
-        + len(re.findall(f"(?=S.{{{l:d}}}A.{{{l:d}}}M.{{{l:d}}}X)", DATA))
-        + len(re.findall(f"(?=X.{{{l:d}}}M.{{{l:d}}}A.{{{l:d}}}S)", DATA))
-        + len(re.findall(f"(?=S.{{{r:d}}}A.{{{r:d}}}M.{{{r:d}}}X)", DATA))
-        + len(re.findall(f"(?=X.{{{r:d}}}M.{{{r:d}}}A.{{{r:d}}}S)", DATA))
-    )
+    FIRST = part_one(DATA)
 
     # Second part.
-    second = (
-        len(re.findall(f"(?=(M.{{1}}S.{{{r:d}}}A.{{{r:d}}}M.{{1}}S))", DATA))
-        + len(re.findall(f"(?=(S.{{1}}M.{{{r:d}}}A.{{{r:d}}}S.{{1}}M))", DATA))
-        + len(re.findall(f"(?=(S.{{1}}S.{{{r:d}}}A.{{{r:d}}}M.{{1}}M))", DATA))
-        + len(re.findall(f"(?=(M.{{1}}M.{{{r:d}}}A.{{{r:d}}}S.{{1}}S))", DATA))
-    )
+    SECOND = part_two(DATA)
 
     t = time.time() - t
 
-    print(f"The first part result is: {first:d}.")
-    print(f"The second part result is: {second:d}.")
+    print(f"The first part result is: {FIRST:d}.")
+    print(f"The second part result is: {SECOND:d}.")
     print(f"Found in {t:.5f}s!")
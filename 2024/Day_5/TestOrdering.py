@@ -0,0 +1,183 @@
+import os
+import random
+import sys
+import tempfile
+from unittest import TestCase
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", ".."))
+
+from aoc.days import load_day
+
+# The solution is loaded from its path, since "solution" names the module of
+# every day.
+solution = load_day(2024, 5)
+
+
+EXAMPLE = """47|53
+97|13
+97|61
+97|47
+75|29
+61|13
+75|53
+29|13
+97|29
+53|29
+61|53
+97|53
+61|29
+47|13
+75|47
+97|75
+47|61
+75|61
+47|29
+75|13
+53|13
+
+75,47,61,53,29
+97,61,53,29,13
+75,29,13
+75,97,47,61,53
+61,13,29
+97,13,75,29,47
+"""
+
+
+class TestOrdering(TestCase):
+    """
+    Unit test class for the checks and the reorganization of the updates.
+    """
+
+    def setUp(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "input.txt")
+            with open(file_name, "w", encoding="utf-8") as f:
+                f.write(EXAMPLE)
+            self.rules, self.orders = solution.parse(file_name)
+
+    def test_reorganize_example(self):
+        """
+        Checks if the incorrectly-ordered updates of the example are
+        reorganized as expected.
+        """
+        expected = [[97, 75, 47, 61, 53], [61, 29, 13],
+                    [97, 75, 47, 29, 13]]
+        result = []
+        for order in self.orders:
+            if not solution.is_order_respected(self.rules, order):
+                order = list(order)
+                solution.reorganize(self.rules, order)
+                result.append(order)
+        self.assertEqual(expected, result)
+
+    def test_reorganize(self):
+        """
+        Checks if any shuffled update is reorganized in a correct order.
+        """
+        rng = random.Random(0)
+        pages = list(self.rules)
+        for _ in range(0, 100):
+            order = rng.sample(pages, rng.randint(1, len(pages)))
+            solution.reorganize(self.rules, order)
+            self.assertTrue(solution.is_order_respected(self.rules, order))
+
+    def test_are_orders_respected(self):
+        """
+        Checks if the vectorized check of padded lists agrees with the check
+        of each list.
+        """
+        rng = random.Random(1)
+        pages = list(self.rules)
+        orders = self.orders + [
+            rng.sample(pages, rng.randint(1, len(pages)))
+            for _ in range(0, 200)
+        ]
+        for order in orders[-50:]:
+            solution.reorganize(self.rules, order)
+        result = solution.are_orders_respected(
+            solution.precedence_matrix(self.rules),
+            *solution.pad_orders(orders)
+        )
+        self.assertEqual([solution.is_order_respected(self.rules, order)
+                          for order in orders], result.tolist())
+
+        # Pages beyond the ones of the rules.
+        orders = [[120], [53, 29, 47]]
+        result = solution.are_orders_respected(
+            solution.precedence_matrix(self.rules, orders),
+            *solution.pad_orders(orders)
+        )
+        self.assertEqual([True, False], result.tolist())
+
+    def test_is_order_respected_by_masks(self):
+        """
+        Checks if the check with bitmasks agrees with the check of each pair
+        of pages, with page numbers beyond 99.
+        """
+        rng = random.Random(2)
+        pages = rng.sample(range(10, 5000), 40)
+        rules = {page: {} for page in pages}
+        for i, page in enumerate(pages):
+            for other in pages[i+1:]:
+                rules[page][other] = 1
+                rules[other][page] = -1
+        masks = solution.successor_masks(rules)
+        orders = [rng.sample(pages, rng.randint(1, 10))
+                  for _ in range(0, 300)]
+        for order in orders[-100:]:
+            solution.reorganize(rules, order)
+        self.assertEqual([solution.is_order_respected(rules, order)
+                          for order in orders],
+                         [solution.is_order_respected_by_masks(masks, order)
+                          for order in orders])
+        self.assertEqual([solution.is_order_respected(self.rules, order)
+                          for order in self.orders],
+                         [solution.is_order_respected_by_masks(
+                             solution.successor_masks(self.rules), order
+                         ) for order in self.orders])
+
+    def test_pages_without_rule(self):
+        """
+        Checks if a pair of pages without rule is allowed by both the check
+        with the precedence matrix and the check with bitmasks, so that an
+        update is counted by one of the parts.
+        """
+        rules = {10: {20: 1}, 20: {10: -1}}
+        orders = [[10, 20, 30], [30, 20, 10]]
+        self.assertEqual([True, False], solution.are_orders_respected(
+            solution.precedence_matrix(rules, orders),
+            *solution.pad_orders(orders)
+        ).tolist())
+        masks = solution.successor_masks(rules)
+        self.assertEqual([True, False], [
+            solution.is_order_respected_by_masks(masks, order)
+            for order in orders
+        ])
+        self.assertEqual(20, solution.part_one((rules, orders[:1])))
+        self.assertEqual(0, solution.part_two((rules, orders[:1])))
+
+    def test_middle_pages(self):
+        """
+        Checks if the middle pages found without reorganizing the lists are
+        those of the reorganized lists.
+        """
+        expected = []
+        for order in self.orders:
+            order = list(order)
+            solution.reorganize(self.rules, order)
+            expected.append(order[len(order)//2])
+        masks = solution.successor_masks(self.rules)
+        self.assertEqual(expected, [solution.middle_page(masks, order)
+                                    for order in self.orders])
+        self.assertEqual(expected, list(solution.middle_pages(
+            solution.precedence_matrix(self.rules),
+            *solution.pad_orders(self.orders)
+        )))
+
+        del self.rules[47][53], self.rules[53][47]
+        with self.assertRaises(ValueError):
+            solution.middle_pages(
+                solution.precedence_matrix(self.rules),
+                *solution.pad_orders([[75, 47, 61, 53, 29]])
+            )
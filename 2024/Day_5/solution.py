@@ -1,11 +1,12 @@
 """
 Advent of code - Day 5
 """
+import functools
 import re
 import sys
 import time
-from typing import Any
 from collections.abc import Sequence, Mapping
+import numpy as np
 
 
 def is_one_page_order_respected(rules: Mapping[int, Mapping[int, int]],
@@ -65,69 +66,64 @@ def is_order_respected(rules: Mapping[int, Mapping[int, int]],
     )
 
 
-def swap(order: Sequence[Any], i: int, j: int) -> None:
+def successor_masks(rules: Mapping[int, Mapping[int, int]]) -> dict[int, int]:
     """
-    Swap two elements in a given list.
+    Compiles the ordering rules into bitmasks.
 
     Parameters
     ----------
-    order: Sequence[Any]
-        The list in which these elements are swapped.
-    i: int
-        First element index.
-    j: int
-        Second element index.
+    rules: Mapping[int, Mapping[int, int]]
+        Ordering rules that pages must respect.
+        Each page number is associated with a map that indicates if the other
+        page numbers must be located before (-1) or after (1) it.
 
-    Raises
-    ------
-    ValueError
-        when i or j is outside the list boundaries.
+    Returns
+    -------
+    dict[int, int]
+        For each page number, the integer whose bit n is set when the page n
+        must be after it. Integers have no size limit, so any page number
+        works.
     """
-    if i < 0 or i >= len(order):
-        raise ValueError("The index of the first element is outside the list.")
-    if j < 0 or j >= len(order):
-        raise ValueError("The index of the second element is outside the list")
-    tmp = order[i]
-    order[i] = order[j]
-    order[j] = tmp
+    return {
+        page: sum(1 << other for other, position in others.items()
+                  if position == 1)
+        for page, others in rules.items()
+    }
 
 
-def index_missplace_right(rules: Mapping[int, Mapping[int, int]],
-                          order: Sequence[int],
-                          start: int) -> int:
+def is_order_respected_by_masks(masks: Mapping[int, int],
+                                order: Sequence[int]) -> bool:
     """
-    Returns the first page number index encountered after the given page number
-    when it should have been before.
+    Checks that a set of page numbers is correctly ordered, by walking it
+    once: a page is misplaced when a page that must be after it has already
+    been seen. It takes O(k) operations on integers instead of checking
+    each pair of pages. A pair of pages without rule is allowed in any
+    order, as in are_orders_respected.
 
     Parameters
     ----------
-    rules: Mapping[int, Mapping[int, int]]
-        Ordering rules that pages must respect.
-        Each page number is associated with a map that indicates if the other
-        page numbers must be located before (-1) or after (1) it.
+    masks: Mapping[int, int]
+        The pages that must be after each page (see successor_masks).
     order: Sequence[int]
         An ordered page list.
-    start: int
-        Page index to check.
 
     Returns
     -------
-    int
-        the page index or -1 if none is found.
+    bool
+        Returns true if the set of page is well-ordered, false otherwise.
     """
-    page = order[start]
-    for i in range(start+1, len(order)):
-        if rules[page][order[i]] == -1:
-            return i
-    return -1
+    seen = 0
+    for page in order:
+        if seen & masks.get(page, 0):
+            return False
+        seen |= 1 << page
+    return True
 
 
-def index_missplace_left(rules: Mapping[int, Mapping[int, int]],
-                         order: Sequence[int],
-                         start: int) -> int:
+def precedence_matrix(rules: Mapping[int, Mapping[int, int]],
+                      orders: Sequence[Sequence[int]] = ()) -> np.ndarray:
     """
-    Returns the first page number index encountered before the given page
-    number when it should have been after.
+    Compiles the ordering rules into a dense matrix.
 
     Parameters
     ----------
@@ -135,27 +131,96 @@ def index_missplace_left(rules: Mapping[int, Mapping[int, int]],
         Ordering rules that pages must respect.
         Each page number is associated with a map that indicates if the other
         page numbers must be located before (-1) or after (1) it.
-    order: Sequence[int]
-        An ordered page list.
-    start: int
-        Page index to check.
+    orders: Sequence[Sequence[int]], default: ()
+        The page lists checked with the matrix, whose pages may have no rule.
 
     Returns
     -------
-    int
-        the page index or -1 if none is found.
+    np.ndarray
+        The int8 matrix where [page, other] is -1 when the other page must be
+        before the page, 1 when it must be after and 0 without rule.
     """
-    page = order[start]
-    for i in range(0, start):
-        if rules[page][order[i]] == 1:
-            return i
-    return -1
+    size = max(max(rules, default=0),
+               max((max(order, default=0) for order in orders),
+                   default=0)) + 1
+    matrix = np.zeros((size, size), dtype=np.int8)
+    for page, others in rules.items():
+        for other, position in others.items():
+            matrix[page, other] = position
+    return matrix
+
+
+def pad_orders(orders: Sequence[Sequence[int]]
+               ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gathers page lists of different lengths into an array.
+
+    Parameters
+    ----------
+    orders: Sequence[Sequence[int]]
+        The ordered page lists.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The (lists, pages) array of the page numbers, the shortest lists
+        being padded with zeros, and the length of each list.
+    """
+    lengths = np.array([len(order) for order in orders], dtype=np.intp)
+    pages = np.zeros((len(orders), int(lengths.max()) if len(orders) else 0),
+                     dtype=np.intp)
+    for i, order in enumerate(orders):
+        pages[i, :len(order)] = order
+    return pages, lengths
+
+
+def are_orders_respected(matrix: np.ndarray, pages: np.ndarray,
+                         lengths: np.ndarray) -> np.ndarray:
+    """
+    Checks that page lists are correctly ordered, all at once, by looking up
+    the rule of each pair of pages of each list in the precedence matrix.
+    A pair of pages without rule is allowed in any order, as in
+    is_order_respected_by_masks.
+
+    Parameters
+    ----------
+    matrix: np.ndarray
+        The precedence matrix of the rules (see precedence_matrix).
+    pages: np.ndarray
+        The padded page lists (see pad_orders).
+    lengths: np.ndarray
+        The length of each list.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean per list, true when it is well-ordered.
+    """
+    n_orders, n_pages = pages.shape
+    columns = np.arange(0, n_pages)
+    # Pairs of pages where the first one is before the second one.
+    is_pair = columns[:, np.newaxis] < columns[np.newaxis, :]
+
+    result = np.ones(n_orders, dtype=bool)
+    # Checks blocks of lists to bound the memory of the pairs.
+    block = max(1, 2**22 // max(1, n_pages * n_pages))
+    for start in range(0, n_orders, block):
+        end = min(start + block, n_orders)
+        block_pages = pages[start:end]
+        positions = matrix[block_pages[:, :, np.newaxis],
+                           block_pages[:, np.newaxis, :]]
+        is_checked = is_pair & (columns < lengths[start:end, np.newaxis,
+                                                  np.newaxis])
+        result[start:end] = np.all((positions != -1) | ~is_checked,
+                                   axis=(1, 2))
+    return result
 
 
 def reorganize(rules: Mapping[int, Mapping[int, int]],
-               order: Sequence[int]) -> None:
+               order: list[int]) -> None:
     """
-    Reorganizes a list of page numbers so that it is correctly ordered.
+    Reorganizes a list of page numbers so that it is correctly ordered, by
+    sorting it with the rules as comparison, in O(k log k) comparisons.
 
     Parameters
     ----------
@@ -163,28 +228,118 @@ def reorganize(rules: Mapping[int, Mapping[int, int]],
         Ordering rules that pages must respect.
         Each page number is associated with a map that indicates if the other
         page numbers must be located before (-1) or after (1) it.
-    order: Sequence[int]
+    order: list[int]
         An ordered page list.
     """
-    while not is_order_respected(rules, order):
-        for i in range(0, len(order)):
-            j = index_missplace_right(rules, order, i)
-            if j != -1:
-                swap(order, i, j)
-        for i in range(0, len(order)):
-            j = index_missplace_left(rules, order, i)
-            if j != -1:
-                swap(order, i, j)
+    # A page is placed before another one when the latter must be after it.
+    order.sort(key=functools.cmp_to_key(
+        lambda page, other: 0 if page == other else -rules[page][other]
+    ))
 
 
-if __name__ == "__main__":
-    FILE_NAME = sys.argv[1]
+def middle_page(masks: Mapping[int, int], order: Sequence[int]) -> int:
+    """
+    Finds the middle page of a list of page numbers once reorganized,
+    without reorganizing it: it is the page having as many pages of the
+    list after it as the middle index of the reorganized list allows.
 
-    t = time.time()
+    Parameters
+    ----------
+    masks: Mapping[int, int]
+        The pages that must be after each page (see successor_masks).
+    order: Sequence[int]
+        A page list.
+
+    Returns
+    -------
+    int
+        The page in the middle of the reorganized list.
+
+    Raises
+    ------
+    ValueError
+        when the rules don't give a single page in the middle.
+    """
+    pages = 0
+    for page in order:
+        pages |= 1 << page
+    # The page at index len // 2 has len - 1 - len // 2 pages after it.
+    n_after = len(order) - 1 - len(order) // 2
+    for page in order:
+        if (masks.get(page, 0) & pages).bit_count() == n_after:
+            return page
+    raise ValueError("The rules don't order the pages!")
+
+
+def middle_pages(matrix: np.ndarray, pages: np.ndarray,
+                 lengths: np.ndarray) -> np.ndarray:
+    """
+    Finds the middle page of page lists once reorganized, all at once and
+    without reorganizing them: for each page of each list, the pages of the
+    list that must be before it are counted with the precedence matrix, and
+    the middle page is the one with len // 2 of them.
+
+    Parameters
+    ----------
+    matrix: np.ndarray
+        The precedence matrix of the rules (see precedence_matrix).
+    pages: np.ndarray
+        The padded page lists (see pad_orders).
+    lengths: np.ndarray
+        The length of each list.
+
+    Returns
+    -------
+    np.ndarray
+        The page in the middle of each reorganized list.
+
+    Raises
+    ------
+    ValueError
+        when the rules don't give a single page in the middle of a list.
+    """
+    n_orders, n_pages = pages.shape
+    columns = np.arange(0, n_pages)
+
+    result = np.zeros(n_orders, dtype=pages.dtype)
+    # Counts by blocks of lists to bound the memory of the pairs.
+    block = max(1, 2**22 // max(1, n_pages * n_pages))
+    for start in range(0, n_orders, block):
+        end = min(start + block, n_orders)
+        block_pages = pages[start:end]
+        is_page = columns < lengths[start:end, np.newaxis]
+        positions = matrix[block_pages[:, :, np.newaxis],
+                           block_pages[:, np.newaxis, :]]
+        n_before = np.count_nonzero((positions == -1)
+                                    & is_page[:, np.newaxis, :], axis=2)
+        is_middle = is_page & (n_before == lengths[start:end, np.newaxis] // 2)
+        if not np.all(np.count_nonzero(is_middle, axis=1) == 1):
+            raise ValueError("The rules don't order the pages!")
+        result[start:end] = block_pages[np.arange(0, end - start),
+                                        np.argmax(is_middle, axis=1)]
+    return result
+
+
+def parse(file_name: str) -> tuple[dict[int, dict[int, int]],
+                                   list[list[int]]]:
+    """
+    Reads the ordering rules and the updates.
+
+    Parameters
+    ----------
+    file_name: str
+        The input file path.
 
+    Returns
+    -------
+    tuple[dict[int, dict[int, int]], list[list[int]]]
+        The ordering rules, where each page number is associated with a map
+        that indicates if the other page numbers must be located before (-1)
+        or after (1) it, and the ordered page lists.
+    """
     orders = []
     rules = {}
-    with open(FILE_NAME, "r", encoding="utf-8") as f:
+    with open(file_name, "r", encoding="utf-8") as f:
         for line in f.readlines():
             # Check if the current line has the format of a new rule.
             if re.search(r"^[1-9][0-9]+\|[1-9][0-9]+$", line):
@@ -206,27 +361,53 @@ if __name__ == "__main__":
             elif re.search("^([1-9][0-9]+,)+[1-9][0-9]+$", line):
                 pages = line.split(',')
                 orders.append([int(page) for page in pages])
+    return rules, orders
+
+
+def part_one(data: tuple[Mapping[int, Mapping[int, int]],
+                         Sequence[Sequence[int]]]) -> int:
+    """
+    Adds up the middle page numbers of the correctly-ordered updates.
+    """
+    rules, orders = data
+    pages, lengths = pad_orders(orders)
+    is_respected = are_orders_respected(precedence_matrix(rules, orders),
+                                        pages, lengths)
+    middles = pages[np.arange(0, len(pages)), lengths // 2]
+    return int(middles[is_respected].sum())
+
+
+def part_two(data: tuple[Mapping[int, Mapping[int, int]],
+                         Sequence[Sequence[int]]]) -> int:
+    """
+    Adds up the middle page numbers of the incorrectly-ordered updates once
+    they are reorganized.
+    """
+    rules, orders = data
+    masks = successor_masks(rules)
+    invalid = [order for order in orders
+               if not is_order_respected_by_masks(masks, order)]
+    if len(invalid) == 0:
+        return 0
+    return int(middle_pages(precedence_matrix(rules, invalid),
+                            *pad_orders(invalid)).sum())
+
+
+if __name__ == "__main__":
+    FILE_NAME = sys.argv[1]
+
+    t = time.time()
+
+    DATA = parse(FILE_NAME)
 
     # First part.
-    first = sum(
-        order[len(order)//2] if is_order_respected(rules, order) else 0
-        for order in orders
-    )
+    FIRST = part_one(DATA)
 
     # Second part.
-    indices = []  # Indices for sets of misordered pages
-    for i in range(0, len(orders)):
-        if not is_order_respected(rules, orders[i]):
-            reorganize(rules, orders[i])
-            indices.append(i)
-
-    second = sum(
-        orders[i][len(orders[i])//2]
-        for i in indices
-    )
+    SECOND = part_two(DATA)
 
     t = time.time() - t
 
-    print(f"The first part result is {first:d}.")
-    print(f"The second part result is {second:d}.")
+    print(f"The first part result is {FIRST:d}.")
+    print(f"The second part result is {SECOND:d}.")
     print(f"Found in {t:.5f}s!")
@@ -65,6 +65,18 @@ class Guard():
         """
         return self.__coords
 
+    @property
+    def direction(self) -> int:
+        """
+        Gets the guard's direction.
+
+        Return
+        ------
+        int
+            its direction: 0 is up; 1 is down; 2 is left; 3 is right.
+        """
+        return self.__dir
+
     def reset(self) -> None:
         """
         Resets guard to its original position and direction.
@@ -42,6 +42,11 @@ class Map():
             The status of the last patrol.
         __tmp_obs: Sequence[int]
             Coordinates of the temporary obstacle.
+        __stops: Sequence[Sequence[Sequence[int]]]
+            For each direction of the guard and each cell, the row (when
+            moving up or down) or the column (when moving left or right)
+            where the guard stops in front of the next obstacle, or -1 when
+            he leaves the map. The temporary obstacle isn't included.
     """
 
     __obstacles: Sequence[Sequence[bool]]
@@ -51,6 +56,7 @@ class Map():
     __guard: Guard
     __status: Status
     __tmp_obs: Sequence[int]
+    __stops: Sequence[Sequence[Sequence[int]]]
 
     def __init__(self, grid: Sequence[Sequence[bool]], guard: Guard):
         self.__obstacles = deepcopy(grid)
@@ -63,6 +69,7 @@ class Map():
             [False for _ in range(0, self.__n_col)]
             for _ in range(0, self.__n_row)
         ]
+        self.__stops = self.__build_stops()
 
     @staticmethod
     def build(file_name: str):
@@ -152,6 +159,78 @@ class Map():
         self.__obstacles[self.__tmp_obs[0]][self.__tmp_obs[1]] = False
         self.__tmp_obs = [-1, -1]
 
+    def __build_stops(self) -> Sequence[Sequence[Sequence[int]]]:
+        """
+        Builds the stop of the guard from each cell in each direction, by
+        scanning every row and every column once in both directions.
+
+        Return
+        ------
+        Sequence[Sequence[Sequence[int]]]
+            the stops, indexed by direction, row and column.
+        """
+        stops = [
+            [[-1 for _ in range(0, self.__n_col)]
+             for _ in range(0, self.__n_row)]
+            for _ in range(0, 4)
+        ]
+        for direction, (d_x, d_y) in enumerate(Guard.movements):
+            # Scans against the movement, so the next obstacle of a cell is
+            # the last one scanned.
+            rows = list(range(0, self.__n_row))[::-1 if d_x == 1 else 1]
+            cols = list(range(0, self.__n_col))[::-1 if d_y == 1 else 1]
+            if d_x != 0:
+                for y in cols:
+                    stop = -1
+                    for x in rows:
+                        if self.__obstacles[x][y]:
+                            stop = x - d_x
+                        else:
+                            stops[direction][x][y] = stop
+            else:
+                for x in rows:
+                    stop = -1
+                    for y in cols:
+                        if self.__obstacles[x][y]:
+                            stop = y - d_y
+                        else:
+                            stops[direction][x][y] = stop
+        return stops
+
+    def __jump(self, x: int, y: int, direction: int) -> int:
+        """
+        Gets where the guard stops when walking straight from a cell, the
+        temporary obstacle being checked in O(1) against the precomputed
+        stop.
+
+        Parameters
+        ----------
+        x: int
+            the x coordinate of the guard.
+        y: int
+            the y coordinate of the guard.
+        direction: int
+            the direction of the guard.
+
+        Return
+        ------
+        int
+            the row (when moving up or down) or the column (when moving left
+            or right) where the guard stops, or -1 when he leaves the map.
+        """
+        stop = self.__stops[direction][x][y]
+        xo, yo = self.__tmp_obs
+        d_x, d_y = Guard.movements[direction]
+        if d_x != 0:
+            # The temporary obstacle is ahead and before the next obstacle.
+            if yo == y and (xo - x) * d_x > 0 \
+                    and (stop == -1 or (xo - stop) * d_x <= 0):
+                return xo - d_x
+        elif xo == x and (yo - y) * d_y > 0 \
+                and (stop == -1 or (yo - stop) * d_y <= 0):
+            return yo - d_y
+        return stop
+
     def move(self):
         """
         Moves the guard if it can, or changes its direction if it faces an
@@ -204,3 +283,39 @@ class Map():
 
             # Move the guard.
             self.move()
+
+    def jump_patrol(self) -> Status:
+        """
+        The guard performs its patrol by walking each straight segment at
+        once, up to the next obstacle. An endless loop is found when the
+        guard turns twice at the same cell in the same direction, so the
+        patrol takes as many steps as the guard turns.
+        At the end, the status is updated with this patrol, but not the
+        visited cells.
+
+        Return
+        ------
+        Status
+            the status of the patrol.
+        """
+        self.__guard.reset()
+        x, y = self.__guard.coords
+        direction = self.__guard.direction
+
+        turns = set()
+        self.__status = Status.NONE
+        while self.__status == Status.NONE:
+            stop = self.__jump(x, y, direction)
+            if stop == -1:
+                self.__status = Status.QUIT
+            else:
+                if Guard.movements[direction][0] != 0:
+                    x = stop
+                else:
+                    y = stop
+                if (x, y, direction) in turns:
+                    self.__status = Status.LOOP
+                else:
+                    turns.add((x, y, direction))
+                    direction = Guard.rotations[direction]
+        return self.__status
@@ -0,0 +1,80 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+from Map import Map, Status
+
+
+EXAMPLE = """....#.....
+.........#
+..........
+..#.......
+.......#..
+..........
+.#..^.....
+........#.
+#.........
+......#...
+"""
+
+
+class TestMap(TestCase):
+    """
+    Unit test class for the patrol of the guard with jumps.
+    """
+
+    @staticmethod
+    def build(grid: str) -> Map:
+        """
+        Builds a map from its lines.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "input.txt")
+            with open(file_name, "w", encoding="utf-8") as f:
+                f.write(grid)
+            return Map.build(file_name)
+
+    def assert_same_patrols(self, _map: Map) -> int:
+        """
+        Checks if the patrol with jumps ends as the patrol cell by cell, with
+        a temporary obstacle on each free cell, and counts the loops.
+        """
+        n_row, n_col = len(_map.visited), len(_map.visited[0])
+        _map.guard.reset()
+        x, y = _map.guard.coords
+        n_loops = 0
+        for xo in range(0, n_row):
+            for yo in range(0, n_col):
+                if (xo, yo) == (x, y):
+                    continue
+                try:
+                    _map.add_temporary_obstacle(xo, yo)
+                except ValueError:
+                    continue
+                status = _map.jump_patrol()
+                _map.patrol()
+                self.assertEqual(status, _map.status, (xo, yo))
+                n_loops += status == Status.LOOP
+        return n_loops
+
+    def test_jump_patrol_example(self):
+        """
+        Checks if the patrol with jumps finds the 6 loops of the example.
+        """
+        _map = self.build(EXAMPLE)
+        self.assertEqual(_map.jump_patrol(), Status.QUIT)
+        self.assertEqual(self.assert_same_patrols(_map), 6)
+
+    def test_jump_patrol_random(self):
+        """
+        Checks if the patrol with jumps ends as the patrol cell by cell on
+        random maps.
+        """
+        rng = random.Random(6)
+        for _ in range(0, 10):
+            grid = [['#' if rng.random() < 0.15 else '.'
+                     for _ in range(0, 12)] for _ in range(0, 9)]
+            grid[rng.randrange(0, 9)][rng.randrange(0, 12)] = \
+                rng.choice("^v<>")
+            _map = self.build("\n".join("".join(row) for row in grid))
+            self.assert_same_patrols(_map)
@@ -5,32 +5,78 @@ import sys
 import time
 from Map import Map, Status
 
-if __name__ == "__main__":
-    FILE_NAME = sys.argv[1]
 
-    t = time.time()
+def parse(file_name: str) -> Map:
+    """
+    Builds the map with its guard and obstacles.
+    """
+    return Map.build(file_name)
 
-    _map = Map.build(FILE_NAME)
-    x, y = _map.guard.coords
 
-    # First part.
+def patrolled_cells(_map: Map) -> set[tuple[int, int]]:
+    """
+    Performs the guard's patrol and gets the cells visited, except its
+    starting position.
+    They are the only cells where a new obstacle can change the patrol.
+
+    Parameters
+    ----------
+    _map: Map
+        The map where the guard patrols.
+
+    Returns
+    -------
+    set[tuple[int, int]]
+        Coordinates of the visited cells.
+    """
+    _map.guard.reset()
+    x, y = _map.guard.coords
     _map.patrol()
     visited = _map.visited
-    obstacles = set(
+    return set(
         (i, j)
         for i in range(0, len(visited))
         for j in range(0, len(visited[i]))
         if visited[i][j] and not (x == i and y == j)
     )
-    FIRST = len(obstacles) + 1
 
-    # Second part.
-    SECOND = 0
+
+def part_one(_map: Map) -> int:
+    """
+    Counts the distinct positions visited by the guard.
+    """
+    return len(patrolled_cells(_map)) + 1
+
+
+def part_two(_map: Map) -> int:
+    """
+    Counts the positions where a new obstacle traps the guard in a loop.
+    """
+    obstacles = patrolled_cells(_map)
+
+    result = 0
     for xo, yo in obstacles:
         _map.add_temporary_obstacle(xo, yo)
-        _map.patrol()
-        if _map.status == Status.LOOP:
-            SECOND += 1
+        if _map.jump_patrol() == Status.LOOP:
+            result += 1
+
+    if len(obstacles) > 0:
+        _map.remove_temporary_obstacle()
+    return result
+
+
+if __name__ == "__main__":
+    FILE_NAME = sys.argv[1]
+
+    t = time.time()
+
+    MAP = parse(FILE_NAME)
+
+    # First part.
+    FIRST = part_one(MAP)
+
+    # Second part.
+    SECOND = part_two(MAP)
 
     t = time.time() - t
 
@@ -137,60 +137,96 @@ def is_correct(elements: Sequence[int], memory: Sequence[str],
     )
 
 
-if __name__ == "__main__":
-    FILE_NAME = sys.argv[1]
-
-    t = time.time()
-
-    with open(FILE_NAME, "r", encoding="utf-8") as f:
+def parse(file_name: str) -> Sequence[Sequence[int]]:
+    """
+    Reads the equations: the expected value followed by its operands.
+    """
+    with open(file_name, "r", encoding="utf-8") as f:
         lines = f.readlines()
-        equations = [
+        return [
             [int(value) for value in re.findall(r"[1-9][0-9]*", line)]
             for line in lines
         ]
 
-    n_max_op = max(len(equation)-2 for equation in equations)
 
-    ###########################################################################
-    #                               First part.                               #
-    ###########################################################################
-    n_comb = 2**(n_max_op)
-    base2 = [
-        bin(value)[2:]
-        for value in range(0, n_comb)
-    ]
-
-    # Store lines that can already be solved with the + and * operations, to
-    # avoid having to calculate them again in part 2.
-    FIRST = 0
-    resolved = []
-    for i_e, equation in enumerate(equations):
-        if is_correct(equation, base2, 2**(len(equation)-2)):
-            resolved.append(True)
-            FIRST += equation[0]
-        else:
-            resolved.append(False)
-    del base2
-    ###########################################################################
-
-    ###########################################################################
-    #                              Second part.                               #
-    ###########################################################################
-    n_comb = 3**(n_max_op)
+def combinations(n_max_op: int, base: int) -> Sequence[str]:
+    """
+    Computes all the combinations of operations for a given number of
+    operators, encoded as binary (+ and *) or tertiary (+, * and ||) numbers.
+
+    Parameters
+    ----------
+    n_max_op: int
+        The highest number of operators in an equation.
+    base: int
+        2 for the + and * operations, 3 to add the || operation.
+        In base 3, the combinations without any || are replaced by None since
+        they are already checked in base 2.
+
+    Return
+    ------
+    Sequence[str]
+        The combinations indexed by their value in base 10.
+    """
+    n_comb = base**(n_max_op)
+    if base == 2:
+        return [
+            bin(value)[2:]
+            for value in range(0, n_comb)
+        ]
+
     base3 = []
     for value in range(0, n_comb):
-        CONVERT = convert_to_base3(value)
-        if '2' in CONVERT:
-            base3.append(CONVERT)
+        convert = convert_to_base3(value)
+        if '2' in convert:
+            base3.append(convert)
         else:
             base3.append(None)
-    SECOND = sum(
+    return base3
+
+
+def part_one(equations: Sequence[Sequence[int]]) -> int:
+    """
+    Adds up the expected values of the equations that can be solved with the
+    + and * operations.
+    """
+    n_max_op = max(len(equation)-2 for equation in equations)
+    base2 = combinations(n_max_op, 2)
+    return sum(
+        equation[0]
+        for equation in equations
+        if is_correct(equation, base2, 2**(len(equation)-2))
+    )
+
+
+def part_two(equations: Sequence[Sequence[int]]) -> int:
+    """
+    Adds up the expected values of the equations that can be solved with the
+    +, * and || operations.
+    """
+    n_max_op = max(len(equation)-2 for equation in equations)
+
+    # Lines that can already be solved with the + and * operations avoid
+    # having to check the combinations with ||.
+    base2 = combinations(n_max_op, 2)
+    base3 = combinations(n_max_op, 3)
+    return sum(
         equation[0]
-        for i_e, equation in enumerate(equations)
-        if resolved[i_e] or is_correct(equation, base3, 3**(len(equation)-2))
+        for equation in equations
+        if is_correct(equation, base2, 2**(len(equation)-2))
+        or is_correct(equation, base3, 3**(len(equation)-2))
     )
-    del base3
-    ###########################################################################
+
+
+if __name__ == "__main__":
+    FILE_NAME = sys.argv[1]
+
+    t = time.time()
+
+    EQUATIONS = parse(FILE_NAME)
+
+    FIRST = part_one(EQUATIONS)
+    SECOND = part_two(EQUATIONS)
 
     t = time.time() - t
 
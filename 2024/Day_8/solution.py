@@ -126,35 +126,72 @@ def generate_antinodes(antennas: Mapping[str, Sequence[Tuple[int]]],
         raise ValueError("Unexpected part number!")
 
 
-if __name__ == "__main__":
-    t = time.time()
-    file_name = sys.argv[1]
+def parse(file_name: str) -> Tuple[Sequence[Sequence[str]],
+                                   Mapping[str, Sequence[Tuple[int]]]]:
+    """
+    Reads the map and gets the positions of the antennas.
 
-    MAPS = None
+    Attributes
+    ----------
+    file_name: str
+        The input file path.
+
+    Return
+    ------
+    Tuple[Sequence[Sequence[str]], Mapping[str, Sequence[Tuple[int]]]]
+        The map and the positions of all antennas for each frequency.
+    """
     with open(file_name, "r", encoding="utf-8") as f:
         lines = f.readlines()
-        MAPS = [
+        maps = [
             [char for char in line if char != '\n']
             for line in lines
         ]
 
     antennas = {}
-    for i, row in enumerate(MAPS):
+    for i, row in enumerate(maps):
         for j, element in enumerate(row):
             if element != '.':
                 if element not in antennas:
                     antennas[element] = []
-                antennas[MAPS[i][j]].append((i, j))
+                antennas[maps[i][j]].append((i, j))
 
-    # First part.
+    return maps, antennas
+
+
+def part_one(data: Tuple[Sequence[Sequence[str]],
+                         Mapping[str, Sequence[Tuple[int]]]]) -> int:
+    """
+    Counts the antinodes of the first part.
+    """
+    maps, antennas = data
     antinodes = set()
-    generate_antinodes(antennas, antinodes, MAPS)
-    FIRST = len(antinodes)
+    generate_antinodes(antennas, antinodes, maps)
+    return len(antinodes)
 
-    # Second part.
+
+def part_two(data: Tuple[Sequence[Sequence[str]],
+                         Mapping[str, Sequence[Tuple[int]]]]) -> int:
+    """
+    Counts the antinodes of the second part, in line with the antennas.
+    """
+    maps, antennas = data
     antinodes = set()
-    generate_antinodes(antennas, antinodes, MAPS, 2)
-    SECOND = len(antinodes)
+    generate_antinodes(antennas, antinodes, maps, 2)
+    return len(antinodes)
+
+
+if __name__ == "__main__":
+    t = time.time()
+    FILE_NAME = sys.argv[1]
+
+    MAPS = parse(FILE_NAME)
+
+    # First part.
+    FIRST = part_one(MAPS)
+
+    # Second part.
+    SECOND = part_two(MAPS)
 
     t = time.time() - t
 
@@ -6,53 +6,72 @@ import time
 from Disk import Disk
 
 
-if __name__ == "__main__":
-    t = time.time()
-    INPUT = sys.argv[1]
-
-    DISK1 = None
-    with open(INPUT, "r", encoding="utf-8") as f:
+def parse(file_name: str) -> str:
+    """
+    Reads the disk map.
+    """
+    with open(file_name, "r", encoding="utf-8") as f:
         lines = f.readlines()
-        DISK2 = Disk.build_from_string(lines[0][:len(lines[0])-1])
-
-        DISK1 = []
-        FID = 0
-        for i, char in enumerate(lines[0]):
-            if char != '\n':
-                val = int(char)
-                if i % 2 == 0:
-                    for j in range(0, val):
-                        DISK1.append(FID)
-                    FID += 1
-                else:
-                    for j in range(0, val):
-                        DISK1.append(-1)
-
-    if DISK1 is None or DISK2 is None:
-        raise ValueError("The input wasn't parse.")
+        return lines[0].rstrip('\n')
+
+
+def part_one(disk_map: str) -> int:
+    """
+    Compacts the disk by moving the file blocks one at a time and computes its
+    filesystem checksum.
+    """
+    disk = []
+    fid = 0
+    for i, char in enumerate(disk_map):
+        val = int(char)
+        if i % 2 == 0:
+            for _ in range(0, val):
+                disk.append(fid)
+            fid += 1
+        else:
+            for _ in range(0, val):
+                disk.append(-1)
 
-    # First part.
     i = 0
-    j = len(DISK1)-1
+    j = len(disk)-1
     while i < j:
-        if DISK1[i] == -1:
-            if DISK1[j] == -1:
+        if disk[i] == -1:
+            if disk[j] == -1:
                 j -= 1
             else:
-                tmp = DISK1[i]
-                DISK1[i] = DISK1[j]
-                DISK1[j] = tmp
+                tmp = disk[i]
+                disk[i] = disk[j]
+                disk[j] = tmp
         else:
             i += 1
 
-    FIRST = sum(
-        i * DISK1[i] if DISK1[i] != -1 else 0
-        for i in range(0, len(DISK1))
+    return sum(
+        i * disk[i] if disk[i] != -1 else 0
+        for i in range(0, len(disk))
     )
 
+
+def part_two(disk_map: str) -> int:
+    """
+    Compacts the disk by moving whole files and computes its filesystem
+    checksum.
+    """
+    disk = Disk.build_from_string(disk_map)
+    disk.fragmentation()
+    return disk.score()
+
+
+if __name__ == "__main__":
+    t = time.time()
+    INPUT = sys.argv[1]
+
+    DISK_MAP = parse(INPUT)
+
+    # First part.
+    FIRST = part_one(DISK_MAP)
+
     # Second part.
-    DISK2.fragmentation()
-    SECOND = DISK2.score()
+    SECOND = part_two(DISK_MAP)
 
     t = time.time() - t
 
@@ -1,45 +1,91 @@
 """
 Advent of code - Day 1 (2025)
 """
+from typing import List, Tuple
 import sys
 import time
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    t = time.time()
-
-    # Reads the entry and organizes the data in the following format:
-    # [ (DIRECTION, DISTANCE), ... ]
-    with open(INPUT, 'r', encoding="utf-8") as f:
+def parse(file_name: str) -> List[Tuple[str, int]]:
+    """
+    Reads the entry and organizes the data in the following format:
+    [ (DIRECTION, DISTANCE), ... ]
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
         lines = f.readlines()
-        document = [
+        return [
             (line[0], int(line[1:]))
             for line in lines
         ]
 
-    FIRST = 0
-    SECOND = 0
-    ARROW = 50
+
+def turn(arrow: int, direction: str, distance: int) -> Tuple[int, int]:
+    """
+    Turns the dial.
+
+    Parameters
+    ----------
+    arrow : int
+        The position the arrow points at.
+    direction : str
+        'R' to turn right, 'L' to turn left.
+    distance : int
+        The number of clicks.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The new position of the arrow and the number of times it passes at 0.
+    """
+    if direction == 'R':
+        rotation = (arrow + distance) // 100
+        arrow = (arrow + distance) % 100
+
+    elif direction == 'L':
+        # Place the arrow in the positives values to calculate rotation in
+        # the same way as 'R'.
+        rotation = (((100 - arrow) % 100) + distance) // 100
+        arrow = (arrow - distance) % 100
+
+    else:
+        raise ValueError("Unexpected direction!")
+
+    return arrow, rotation
+
+
+def part_one(document: List[Tuple[str, int]]) -> int:
+    """
+    Counts the number of times the arrow points at 0.
+    """
+    result = 0
+    arrow = 50
+    for direction, distance in document:
+        arrow, _ = turn(arrow, direction, distance)
+        if arrow == 0:
+            result += 1
+    return result
+
+
+def part_two(document: List[Tuple[str, int]]) -> int:
+    """
+    Counts the number of times the arrow passes at 0.
+    """
+    result = 0
+    arrow = 50
     for direction, distance in document:
-        if direction == 'R':
-            rotation = (ARROW + distance) // 100
-            ARROW = (ARROW + distance) % 100
-
-        elif direction == 'L':
-            # Place the arrow in the positives values to calculate rotation in
-            # the same way as 'R'.
-            rotation = (((100 - ARROW) % 100) + distance) // 100
-            ARROW = (ARROW - distance) % 100
-
-        else:
-            raise ValueError("Unexpected direction!")
-
-        # First part solution count the number of times the arrow points at 0.
-        # Second part solution count the number of times the arrow passes at 0.
-        SECOND += rotation
-        if ARROW == 0:
-            FIRST += 1
+        arrow, rotation = turn(arrow, direction, distance)
+        result += rotation
+    return result
+
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    t = time.time()
+
+    DOCUMENT = parse(INPUT)
+
+    FIRST = part_one(DOCUMENT)
+    SECOND = part_two(DOCUMENT)
 
     t = time.time() - t
 
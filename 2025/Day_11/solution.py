@@ -172,31 +172,53 @@ def count_paths(graph: Dict[str, List[str]], topo: List[str], start: str,
     return ways[end]
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    t = time.time()
-
-    with open(INPUT, 'r', encoding="utf-8") as f:
-        given_graph = {
+def parse(file_name: str) -> Dict[str, List[str]]:
+    """
+    Reads the graph as a dictionary such that each value are nodes accessible
+    from the key node.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
+        return {
             line[0:3]: line[5:].rstrip().split(' ')
             for line in f.readlines()
         }
 
-    sorted_graph = topological_sort(given_graph)
-    FIRST = count_paths(given_graph, sorted_graph, "you", "out")
-
-    SVR_DAC = count_paths(given_graph, sorted_graph, "svr", "dac")
-    DAC_FFT = count_paths(given_graph, sorted_graph, "dac", "fft")
-    FFT_OUT = count_paths(given_graph, sorted_graph, "fft", "out")
-    SVR_FFT = count_paths(given_graph, sorted_graph, "svr", "fft")
-    FFT_DAC = count_paths(given_graph, sorted_graph, "fft", "dac")
-    DAC_OUT = count_paths(given_graph, sorted_graph, "dac", "out")
-    SECOND = (
-        (SVR_DAC * DAC_FFT * FFT_OUT)
+
+def part_one(graph: Dict[str, List[str]]) -> int:
+    """
+    Counts the paths from 'you' to 'out'.
+    """
+    return count_paths(graph, topological_sort(graph), "you", "out")
+
+
+def part_two(graph: Dict[str, List[str]]) -> int:
+    """
+    Counts the paths from 'svr' to 'out' that pass through both 'dac' and
+    'fft'.
+    """
+    sorted_graph = topological_sort(graph)
+    svr_dac = count_paths(graph, sorted_graph, "svr", "dac")
+    dac_fft = count_paths(graph, sorted_graph, "dac", "fft")
+    fft_out = count_paths(graph, sorted_graph, "fft", "out")
+    svr_fft = count_paths(graph, sorted_graph, "svr", "fft")
+    fft_dac = count_paths(graph, sorted_graph, "fft", "dac")
+    dac_out = count_paths(graph, sorted_graph, "dac", "out")
+    return (
+        (svr_dac * dac_fft * fft_out)
         +
-        (SVR_FFT * FFT_DAC * DAC_OUT)
+        (svr_fft * fft_dac * dac_out)
     )
 
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    t = time.time()
+
+    GIVEN_GRAPH = parse(INPUT)
+
+    FIRST = part_one(GIVEN_GRAPH)
+    SECOND = part_two(GIVEN_GRAPH)
+
     t = time.time() - t
 
     print(f"The first part solution is {FIRST:d}.")
@@ -1,16 +1,29 @@
 """
 Advent of code - Day 12 (2025)
 """
+from typing import List, Tuple
 import re
 import sys
 import time
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    t = time.time()
+def parse(file_name: str) -> Tuple[List[List[List[int]]], List[list]]:
+    """
+    Reads the patterns of the presents and the regions under the trees.
+
+    Parameters
+    ----------
+    file_name : str
+        The input file path.
 
-    with open(INPUT, 'r', encoding="utf-8") as f:
+    Returns
+    -------
+    Tuple[List[List[List[int]]], List[list]]
+        The patterns, encoding the presence or absence of a block using 0s
+        and 1s, and the regions defined by their length, width, and a list of
+        the number of each pattern that must be found there.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
         lines = f.readlines()
         regions = []
         patterns = []
@@ -38,15 +51,23 @@ if __name__ == "__main__":
                     int(numbers[1]),
                     [int(numbers[j]) for j in range(2, len(numbers))]
                 ])
+    return patterns, regions
 
-    FIRST = 0
+
+def part_one(data: Tuple[List[List[List[int]]], List[list]]) -> int:
+    """
+    Counts the regions that can fit all of their presents.
+    """
+    patterns, regions = data
+
+    result = 0
     for length, width, gifts in regions:
         # Considers all required patterns as full.
         # Thus, if the region can already contain them, then there is no need
         # to search for a specific arrangement.
         max_size = sum(gifts) * 3
         if length >= max_size and width >= max_size:
-            FIRST += 1
+            result += 1
             continue
 
         # If the total number of blocks that make up the required patterns
@@ -63,7 +84,18 @@ if __name__ == "__main__":
             continue
 
         # ¯\_(ツ)_/¯
-        FIRST += 1
+        result += 1
+
+    return result
+
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    t = time.time()
+
+    DATA = parse(INPUT)
+
+    FIRST = part_one(DATA)
 
     t = time.time() - t
 
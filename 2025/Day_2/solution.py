@@ -1,33 +1,59 @@
 """
 Advent of code - Day 2 (2025)
 """
+from typing import List
 import re
 import sys
 import time
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    t = time.time()
-
-    with open(INPUT, 'r', encoding="utf-8") as f:
+def parse(file_name: str) -> List[List[int]]:
+    """
+    Reads the intervals of IDs.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
         lines = f.readlines()
-        intervals = [
+        return [
             [int(e) for e in interval.split('-')]
             for interval in lines[0].split(',')
         ]
 
-    FIRST = 0
-    SECOND = 0
+
+def part_one(intervals: List[List[int]]) -> int:
+    """
+    Adds up the IDs made of a sequence of digits repeated twice.
+    """
+    result = 0
     for start, end in intervals:
         for val in range(start, end+1):
             str_val = f"{val:d}"
-            if re.match(r"^([0-9]+)\1+$", str_val):
-                SECOND += val
-                # There's no point in checking the pattern when the string is
-                # an odd size, because it will always be wrong.
-                if len(str_val) % 2 == 0 and re.match(r"^(.+)\1{1}$", str_val):
-                    FIRST += val
+            # There's no point in checking the pattern when the string is
+            # an odd size, because it will always be wrong.
+            if len(str_val) % 2 == 0 and re.match(r"^(.+)\1{1}$", str_val):
+                result += val
+    return result
+
+
+def part_two(intervals: List[List[int]]) -> int:
+    """
+    Adds up the IDs made of a sequence of digits repeated at least twice.
+    """
+    result = 0
+    for start, end in intervals:
+        for val in range(start, end+1):
+            if re.match(r"^([0-9]+)\1+$", f"{val:d}"):
+                result += val
+    return result
+
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    t = time.time()
+
+    INTERVALS = parse(INPUT)
+
+    FIRST = part_one(INTERVALS)
+    SECOND = part_two(INTERVALS)
 
     t = time.time() - t
 
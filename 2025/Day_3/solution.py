@@ -1,6 +1,7 @@
 """
 Advent of code - Day 3 (2025)
 """
+from typing import List
 import sys
 import time
 
@@ -76,21 +77,39 @@ def higest_value(s: str, size: int) -> int:
     return int("".join(result))
 
 
+def parse(file_name: str) -> List[str]:
+    """
+    Reads the banks of batteries.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
+        return [
+            line.rstrip()
+            for line in f.readlines()
+        ]
+
+
+def part_one(banks: List[str]) -> int:
+    """
+    Adds up the largest 2 digits values of each bank.
+    """
+    return sum(higest_value(bank, 2) for bank in banks)
+
+
+def part_two(banks: List[str]) -> int:
+    """
+    Adds up the largest 12 digits values of each bank.
+    """
+    return sum(higest_value(bank, 12) for bank in banks)
+
+
 if __name__ == "__main__":
     INPUT = sys.argv[1]
     t = time.time()
 
-    with open(INPUT, 'r', encoding="utf-8") as f:
-        banks = [
-            line.rstrip()
-            for line in f.readlines()
-        ]
+    BANKS = parse(INPUT)
 
-    FIRST = 0
-    SECOND = 0
-    for bank in banks:
-        FIRST += higest_value(bank, 2)
-        SECOND += higest_value(bank, 12)
+    FIRST = part_one(BANKS)
+    SECOND = part_two(BANKS)
 
     t = time.time() - t
 
@@ -1,7 +1,7 @@
 """
 Advent of code - Day 4 (2025)
 """
-from typing import List
+from typing import List, Tuple
 import sys
 import time
 
@@ -48,42 +48,61 @@ def n_rolls(_map: List[List[str]], x: int, y: int, paper: str = '@') -> int:
     return result
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    t = time.time()
-
-    # Reads the input file and constructs the paper roll map.
-    with open(INPUT, 'r', encoding="utf-8") as f:
-        _map = [
+def parse(file_name: str) -> List[List[str]]:
+    """
+    Reads the input file and constructs the paper roll map.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
+        return [
             list(line.rstrip())
             for line in f.readlines()
         ]
 
-    # Character representing a roll.
-    PAPER = '@'
-
-    FIRST = 0
-    SECOND = 0
-    N_ITER = 0
-    FOUND = True
-    while FOUND:
-        indices = []
-        for i, line in enumerate(_map):
-            for j, e in enumerate(line):
-                if e == PAPER and n_rolls(_map, i, j, PAPER) < 4:
-                    # Count the number of paper rolls that are adjacent to less
-                    # than 4 other rolls.
-                    # Keep this number for the first iteration for the first
-                    # part of this puzzle.
-                    if N_ITER == 0:
-                        FIRST += 1
-                    SECOND += 1
-
-                    # Keep the indices of these rolls.
-                    indices.append((i, j))
-
-        # Check if any rolls were found to continue the loop or not.
-        FOUND = len(indices) > 0
+
+def accessible_rolls(_map: List[List[str]],
+                     paper: str = '@') -> List[Tuple[int, int]]:
+    """
+    Finds the rolls of paper that are adjacent to less than 4 other rolls.
+
+    Parameters
+    ----------
+    _map : List[List[str]]
+        Complete map of the rolls.
+    paper : str, default: '@'
+        Character representing a roll in the given map.
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        The indices of these rolls.
+    """
+    return [
+        (i, j)
+        for i, line in enumerate(_map)
+        for j, e in enumerate(line)
+        if e == paper and n_rolls(_map, i, j, paper) < 4
+    ]
+
+
+def part_one(_map: List[List[str]]) -> int:
+    """
+    Counts the rolls of paper that can be accessed.
+    """
+    return len(accessible_rolls(_map))
+
+
+def part_two(_map: List[List[str]]) -> int:
+    """
+    Counts the rolls of paper that can be removed, one layer of accessible
+    rolls after another.
+    """
+    # Works on a copy to keep the given map unchanged.
+    _map = [list(line) for line in _map]
+
+    result = 0
+    indices = accessible_rolls(_map)
+    while len(indices) > 0:
+        result += len(indices)
 
         # Removes all found rolls from the map.
         # This must only be done after the research has been completed so as
@@ -91,7 +110,19 @@ if __name__ == "__main__":
         for i, j in indices:
             _map[i][j] = '.'
 
-        N_ITER += 1
+        indices = accessible_rolls(_map)
+
+    return result
+
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    t = time.time()
+
+    MAP = parse(INPUT)
+
+    FIRST = part_one(MAP)
+    SECOND = part_two(MAP)
 
     t = time.time() - t
 
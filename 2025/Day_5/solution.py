@@ -1,18 +1,18 @@
 """
 Advent of code - Day 5 (2025)
 """
+from typing import List, Tuple
 import re
 import sys
 import time
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    t = time.time()
-
-    # Reads the input file and retrieves the food IDs and intervals that
-    # indicate which ones are fresh.
-    with open(INPUT, 'r', encoding="utf-8") as f:
+def parse(file_name: str) -> Tuple[List[List[int]], List[int]]:
+    """
+    Reads the input file and retrieves the intervals that indicate which food
+    IDs are fresh and the food IDs.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
         lines = f.readlines()
         intervals = []
         foods = []
@@ -21,19 +21,34 @@ if __name__ == "__main__":
                 intervals.append([int(e) for e in line.split('-')])
             elif re.match(r"^\d+$", line):
                 foods.append(int(line))
+    return intervals, foods
+
 
+def merge(intervals: List[List[int]]) -> List[List[int]]:
+    """
+    Merges all intervals so that there are no overlapping intervals.
+
+    Parameters
+    ----------
+    intervals : List[List[int]]
+        The intervals as their two bounds.
+
+    Returns
+    -------
+    List[List[int]]
+        The merged intervals, sorted by their first bound.
+    """
     # Sorts all intervals according to their first bound.
     intervals = sorted(intervals, key=lambda x: x[0])
 
-    # Merge all intervals so that there are no overlapping intervals.
     i = 0
     merged = []
     while i < len(intervals):
         first = intervals[i]
         j = i + 1
-        IS_MERGED = True
+        is_merged = True
         # Merges all intervals that can be merged with the current one.
-        while IS_MERGED and j < len(intervals):
+        while is_merged and j < len(intervals):
             second = intervals[j]
             if first[1] >= second[0]:
                 first = [
@@ -43,25 +58,49 @@ if __name__ == "__main__":
                 i += 1  # Increment to ignore the merged interval later.
                 j += 1  # Increment to check if the next one can be merged.
             else:
-                IS_MERGED = False
+                is_merged = False
 
         # Appends the current element or the merge between several intervals.
         merged.append(first)
         i += 1
 
-    # Count the number of fresh food items.
-    FIRST = sum(
+    return merged
+
+
+def part_one(data: Tuple[List[List[int]], List[int]]) -> int:
+    """
+    Count the number of fresh food items.
+    """
+    intervals, foods = data
+    merged = merge(intervals)
+    return sum(
         1
         if any(start <= food <= end for start, end in merged)
         else 0
         for food in foods
     )
-    # Counts the cumulative size of all intervals.
-    SECOND = sum(
+
+
+def part_two(data: Tuple[List[List[int]], List[int]]) -> int:
+    """
+    Counts the cumulative size of all intervals.
+    """
+    intervals, _ = data
+    return sum(
         end - start + 1
-        for start, end in merged
+        for start, end in merge(intervals)
     )
 
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    t = time.time()
+
+    DATA = parse(INPUT)
+
+    FIRST = part_one(DATA)
+    SECOND = part_two(DATA)
+
     t = time.time() - t
 
     print(f"The first part solution is {FIRST:d}.")
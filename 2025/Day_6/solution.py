@@ -1,7 +1,7 @@
 """
 Advent of code - Day 6 (2025)
 """
-from typing import List
+from typing import List, Tuple
 import sys
 import time
 
@@ -55,55 +55,95 @@ def resolve(values: List[int], operator: str) -> int:
     return result
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    t = time.time()
+def parse(file_name: str) -> Tuple[List[str], List[List[int]],
+                                   List[List[int]]]:
+    """
+    Reads the worksheet.
+
+    Parameters
+    ----------
+    file_name : str
+        The input file path.
 
-    with open(INPUT, 'r', encoding="utf-8") as f:
+    Returns
+    -------
+    Tuple[List[str], List[List[int]], List[List[int]]]
+        The operator of each equation, then the values of each equation read
+        from left to right and from top to bottom, and read from top to bottom
+        in columns.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
         lines = [
             line[:len(line)-1]  # Removes the last character that is '\n'.
             for line in f.readlines()
         ]
 
-        # Get the operations and remove the line that encodes them to keep
-        # only the values for the rest of the puzzle.
-        operators = lines[-1].split()
-        del lines[-1]
-
-        # Get the values in the following reading direction: from left to right
-        # and from top to bottom.
-        N_EQUATIONS = len(lines[0].split())
-        equations = [[] for _ in range(0, N_EQUATIONS)]
+    # Get the operations and remove the line that encodes them to keep
+    # only the values for the rest of the puzzle.
+    operators = lines[-1].split()
+    del lines[-1]
+
+    # Get the values in the following reading direction: from left to right
+    # and from top to bottom.
+    n_equations = len(lines[0].split())
+    equations = [[] for _ in range(0, n_equations)]
+    for line in lines:
+        for i, val in enumerate(line.split()):
+            equations[i].append(int(val))
+
+    # Get the values in the following reading direction: from bottom to
+    # top.
+    k = 0
+    new_equations = [[] for _ in range(0, n_equations)]
+    for i in range(0, len(lines[0])):
+        n = []
         for line in lines:
-            for i, val in enumerate(line.split()):
-                equations[i].append(int(val))
-
-        # Get the values in the following reading direction: from bottom to
-        # top.
-        k = 0
-        new_equations = [[] for _ in range(0, N_EQUATIONS)]
-        for i in range(0, len(lines[0])):
-            n = []
-            for line in lines:
-                if line[i] != ' ':
-                    n.append(line[i])
-            if len(n) > 0:
-                new_equations[k].append(
-                    int("".join(n))
-                )
-            else:
-                k += 1
+            if line[i] != ' ':
+                n.append(line[i])
+        if len(n) > 0:
+            new_equations[k].append(
+                int("".join(n))
+            )
+        else:
+            k += 1
 
-    # Performs operations with both reading directions.
-    FIRST = sum(
+    return operators, equations, new_equations
+
+
+def part_one(worksheet: Tuple[List[str], List[List[int]],
+                              List[List[int]]]) -> int:
+    """
+    Adds up the results of the equations read in rows.
+    """
+    operators, equations, _ = worksheet
+    return sum(
         resolve(values, operators[i])
         for i, values in enumerate(equations)
     )
-    SECOND = sum(
+
+
+def part_two(worksheet: Tuple[List[str], List[List[int]],
+                              List[List[int]]]) -> int:
+    """
+    Adds up the results of the equations read in columns.
+    """
+    operators, _, new_equations = worksheet
+    return sum(
         resolve(values, operators[i])
         for i, values in enumerate(new_equations)
     )
 
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    t = time.time()
+
+    WORKSHEET = parse(INPUT)
+
+    # Performs operations with both reading directions.
+    FIRST = part_one(WORKSHEET)
+    SECOND = part_two(WORKSHEET)
+
     t = time.time() - t
 
     print(f"The first part solution is {FIRST:d}.")
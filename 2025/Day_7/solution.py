@@ -1,21 +1,40 @@
 """
 Advent of code - Day 7 (2025)
 """
+from typing import List, Tuple
 import sys
 import time
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    t = time.time()
-
-    # Reads the input file and constructs the map where the tachyons will move.
-    with open(INPUT, 'r', encoding="utf-8") as f:
-        _map = [
+def parse(file_name: str) -> List[List[str]]:
+    """
+    Reads the input file and constructs the map where the tachyons will move.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
+        return [
             list(line.rstrip())
             for line in f.readlines()
         ]
 
+
+def propagate(_map: List[List[str]]) -> Tuple[int, List[List[int]]]:
+    """
+    Moves the tachyon beams from the starting point to the bottom of the map.
+
+    Parameters
+    ----------
+    _map : List[List[str]]
+        The map where the tachyons move.
+
+    Returns
+    -------
+    Tuple[int, List[List[int]]]
+        The number of times a beam is split, and a matrix representing the
+        number of times a tachyon passes through each cell.
+    """
+    # Works on a copy to keep the given map unchanged.
+    _map = [list(line) for line in _map]
+
     # A matrix representing the number of times a tachyon passes through each
     # cell.
     matrix = [
@@ -23,7 +42,7 @@ if __name__ == "__main__":
         for i in range(0, len(_map))
     ]
 
-    FIRST = 0
+    n_splits = 0
     for i, line in enumerate(_map):
         for j, char in enumerate(line):
             # Tachyon starting point.
@@ -37,7 +56,7 @@ if __name__ == "__main__":
                 if i+1 < len(_map):
                     # Tachyon separator.
                     if _map[i+1][j] == '^':
-                        FIRST += 1  # Number of times a beam is split.
+                        n_splits += 1  # Number of times a beam is split.
 
                         # If the map allows it, the beam is divided at the
                         # bottom right.
@@ -64,9 +83,34 @@ if __name__ == "__main__":
                         _map[i+1][j] = '|'
                         matrix[i+1][j] += matrix[i][j]
 
-    # The total number of different tachyon paths corresponds to the sum of
-    # the number of visits to each cell in the last row.
-    SECOND = sum(e for e in matrix[-1])
+    return n_splits, matrix
+
+
+def part_one(_map: List[List[str]]) -> int:
+    """
+    Counts the number of times a beam is split.
+    """
+    return propagate(_map)[0]
+
+
+def part_two(_map: List[List[str]]) -> int:
+    """
+    Counts the number of different tachyon paths.
+    """
+    # It corresponds to the sum of the number of visits to each cell in the
+    # last row.
+    matrix = propagate(_map)[1]
+    return sum(e for e in matrix[-1])
+
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    t = time.time()
+
+    MAP = parse(INPUT)
+
+    FIRST = part_one(MAP)
+    SECOND = part_two(MAP)
 
     t = time.time() - t
 
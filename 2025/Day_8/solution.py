@@ -1,11 +1,10 @@
 """
 Advent of code - Day 8 (2025)
 """
-from typing import List
+from typing import List, Tuple
 import sys
 import time
 import heapq
-from copy import deepcopy
 
 import numpy as np
 
@@ -35,14 +34,28 @@ def get_index(value: int, lst: List[List[int]]) -> int | None:
     return None
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    LIMIT = int(sys.argv[2])  # Number of circuits for the first part.
+def parse(file_name: str, limit: int = 1000) -> Tuple[np.ndarray,
+                                                      List[Tuple[int, int]],
+                                                      int]:
+    """
+    Reads the coordinates of the boxes and sorts their pairs by distance.
 
-    t = time.time()
+    Parameters
+    ----------
+    file_name : str
+        The input file path.
+    limit : int, default: 1000
+        Number of connections made for the first part.
 
+    Returns
+    -------
+    Tuple[np.ndarray, List[Tuple[int, int]], int]
+        The coordinates of the boxes, the index pairs of the boxes from the
+        closest to the farthest and the number of connections of the first
+        part.
+    """
     # Reads the input file and retrieves the coordinates of the boxes.
-    with open(INPUT, 'r', encoding="utf-8") as f:
+    with open(file_name, 'r', encoding="utf-8") as f:
         boxes = np.array([
             [int(c) for c in line.split(',')]
             for line in f.readlines()
@@ -62,14 +75,41 @@ if __name__ == "__main__":
     # Created a list containing the index pairs of the closest boxes.
     sorted_pairs = list(zip(i[order], j[order]))
 
+    return boxes, sorted_pairs, int(limit)
+
+
+def connect(n_boxes: int, sorted_pairs: List[Tuple[int, int]],
+            limit: int | None = None) -> Tuple[List[List[int]],
+                                               Tuple[int, int]]:
+    """
+    Connects the closest boxes into circuits, until all the boxes are
+    connected to each other or a number of connections is reached.
+
+    Parameters
+    ----------
+    n_boxes : int
+        The number of boxes.
+    sorted_pairs : List[Tuple[int, int]]
+        The index pairs of the boxes from the closest to the farthest.
+    limit : int | None, default: None
+        The maximum number of connections, or None to connect all boxes.
+
+    Returns
+    -------
+    Tuple[List[List[int]], Tuple[int, int]]
+        The circuits and the last pair of boxes connected.
+    """
+    if limit is None:
+        limit = len(sorted_pairs)
+
     circuits = []
-    TMP_CIRCUITS = None
-    IS_FIRST = False
-    I_PAIR = 0
-    while not IS_FIRST and I_PAIR < len(sorted_pairs):
+    b0, b1 = sorted_pairs[0]
+    is_first = False
+    i_pair = 0
+    while not is_first and i_pair < min(limit, len(sorted_pairs)):
         # Closest box indices.
-        b0 = sorted_pairs[I_PAIR][0]
-        b1 = sorted_pairs[I_PAIR][1]
+        b0 = sorted_pairs[i_pair][0]
+        b1 = sorted_pairs[i_pair][1]
 
         # Gets the indices of the circuits that contain the two current boxes.
         i_l0 = get_index(b0, circuits)
@@ -99,24 +139,52 @@ if __name__ == "__main__":
                 del circuits[i_l1], circuits[i_l0-1]
             circuits.append(new_link)
 
-        # Saves the link status at the LIMITth step.
-        if I_PAIR == LIMIT-1:
-            TMP_CIRCUITS = deepcopy(circuits)
-
         # Stop the loop when all the boxes are connected to each other.
-        if (not IS_FIRST and len(circuits) == 1 and
-           len(circuits[0]) == len(boxes)):
-            IS_FIRST = True
+        if len(circuits) == 1 and len(circuits[0]) == n_boxes:
+            is_first = True
+
+        i_pair += 1
+
+    return circuits, (b0, b1)
+
 
-        I_PAIR += 1
+def part_one(data: Tuple[np.ndarray, List[Tuple[int, int]], int]) -> int:
+    """
+    Multiplies the sizes of the 3 largest circuits after the first
+    connections.
+    """
+    boxes, sorted_pairs, limit = data
+    circuits, _ = connect(len(boxes), sorted_pairs, limit)
 
-    # Gets the 3 largest circuit in the temporary circuit.
-    largest = heapq.nlargest(3, TMP_CIRCUITS, key=len)
+    # Gets the 3 largest circuit.
+    largest = heapq.nlargest(3, circuits, key=len)
 
-    FIRST = 1
+    result = 1
     for circuit in largest:
-        FIRST *= len(circuit)
-    SECOND = boxes[b0][0] * boxes[b1][0]
+        result *= len(circuit)
+    return result
+
+
+def part_two(data: Tuple[np.ndarray, List[Tuple[int, int]], int]) -> int:
+    """
+    Multiplies the X coordinates of the last two boxes connected to make a
+    single circuit.
+    """
+    boxes, sorted_pairs, _ = data
+    _, (b0, b1) = connect(len(boxes), sorted_pairs)
+    return int(boxes[b0][0] * boxes[b1][0])
+
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    LIMIT = int(sys.argv[2])  # Number of circuits for the first part.
+
+    t = time.time()
+
+    DATA = parse(INPUT, LIMIT)
+
+    FIRST = part_one(DATA)
+    SECOND = part_two(DATA)
 
     t = time.time() - t
 
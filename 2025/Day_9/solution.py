@@ -1,7 +1,7 @@
 """
 Advent of code - Day 8 (2025)
 """
-from typing import List
+from typing import List, Tuple
 import sys
 import time
 
@@ -309,13 +309,12 @@ def point_in_polygon(
     )
 
 
-if __name__ == "__main__":
-    INPUT = sys.argv[1]
-    t = time.time()
-
-    # Reads the input file and retrieves the coordinates of the points and the
-    # edges of the main polygon.
-    with open(INPUT, 'r', encoding="utf-8") as f:
+def parse(file_name: str) -> Tuple[List[List[int]], List[List[List[int]]]]:
+    """
+    Reads the input file and retrieves the coordinates of the points and the
+    edges of the main polygon.
+    """
+    with open(file_name, 'r', encoding="utf-8") as f:
         points = [
             [int(val) for val in line.split(',')]
             for line in f.readlines()
@@ -325,6 +324,27 @@ if __name__ == "__main__":
             for i in range(0, len(points)-1)
         ]
         polygon.append([points[-1], points[0]])
+    return points, polygon
+
+
+def part_one(data: Tuple[List[List[int]], List[List[List[int]]]]) -> int:
+    """
+    Finds the largest rectangle with two points as opposite corners.
+    """
+    points, _ = data
+    return max(
+        rectangle_size(points[i], points[j])
+        for i in range(0, len(points))
+        for j in range(i+1, len(points))
+    )
+
+
+def part_two(data: Tuple[List[List[int]], List[List[List[int]]]]) -> int:
+    """
+    Finds the largest rectangle with two points as opposite corners that is
+    inside the main polygon.
+    """
+    points, polygon = data
 
     # Associate the two indices of opposite points that form a rectangle with
     # its size.
@@ -337,14 +357,11 @@ if __name__ == "__main__":
     rectangles = dict(
         sorted(rectangles.items(), key=lambda item: item[1], reverse=True)
     )
-
-    # Gets the largest size.
     keys = list(rectangles.keys())
-    FIRST = rectangles[keys[0]]
 
-    SECOND = 0
+    result = 0
     i = 0
-    while SECOND == 0 and i < len(keys):
+    while result == 0 and i < len(keys):
         rec_pts = keys[i]
         size = rectangles[rec_pts]
 
@@ -364,10 +381,22 @@ if __name__ == "__main__":
             ]
             if not any(is_cut_by_an_edge(A, B, polygon)
                        for A, B in edges):
-                SECOND = size
+                result = size
 
         i += 1
 
+    return result
+
+
+if __name__ == "__main__":
+    INPUT = sys.argv[1]
+    t = time.time()
+
+    DATA = parse(INPUT)
+
+    FIRST = part_one(DATA)
+    SECOND = part_two(DATA)
+
     t = time.time() - t
 
     print(f"The first part solution is {FIRST:d}.")
@@ -0,0 +1,215 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase, mock
+
+import numpy as np
+
+from reader import (cache_key, cached, csv_to_array, csv_to_iter, csv_to_list,
+                    grid_to_array, line_ranges)
+
+
+class TestReader(TestCase):
+    """
+    Unit test class for the input readers.
+    """
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.__dir.cleanup()
+
+    def write(self, content: str) -> str:
+        """
+        Writes a temporary input file and returns its path.
+        """
+        file_name = os.path.join(self.__dir.name, "input.txt")
+        with open(file_name, "w", encoding="utf-8") as f:
+            f.write(content)
+        return file_name
+
+    def test_array_by_row(self):
+        """
+        Checks if the array built by row matches the nested lists.
+        """
+        file_name = self.write("3   4\n4   3\n2   5\n1   3\n")
+        expected = csv_to_list(file_name, "   ")
+        result = csv_to_list(file_name, "   ", output="array")
+        self.assertEqual(np.int64, result.dtype)
+        self.assertEqual(expected, result.tolist())
+
+    def test_array_by_column(self):
+        """
+        Checks if the array built by column is a view of the array built by
+        row.
+        """
+        file_name = self.write("3   4\n4   3\n2   5\n1   3\n")
+        expected = csv_to_list(file_name, "   ", "column")
+        result = csv_to_array(file_name, "   ", "column")
+        self.assertEqual(expected, result.tolist())
+        self.assertIsNotNone(result.base)
+
+    def test_array_digits(self):
+        """
+        Checks if each digit is a value when no separator is given.
+        """
+        file_name = self.write("0123\n9876\n")
+        result = csv_to_array(file_name, None)
+        self.assertEqual(csv_to_list(file_name, None), result.tolist())
+
+    def test_array_ragged(self):
+        """
+        Checks if lines with different numbers of values raise an exception
+        unless the array is padded.
+        """
+        file_name = self.write("7 6 4 2 1\n1 2 7\n-1 3 6 7 9 4\n")
+        self.assertRaises(ValueError, csv_to_array, file_name, ' ')
+        result, lengths = csv_to_array(file_name, ' ', padded=True)
+        self.assertEqual([5, 3, 6], lengths.tolist())
+        self.assertEqual([[7, 6, 4, 2, 1, 0],
+                          [1, 2, 7, 0, 0, 0],
+                          [-1, 3, 6, 7, 9, 4]], result.tolist())
+
+    def test_array_not_integer(self):
+        """
+        Checks if a value that is not an integer raises an exception.
+        """
+        file_name = self.write("1,2\n3,a\n")
+        self.assertRaises(ValueError, csv_to_array, file_name)
+
+    def test_array_empty_value(self):
+        """
+        Checks if an empty value raises an exception in both readers, even
+        when every line has the same number of them.
+        """
+        for content in ("1,,2\n3,,4\n", ",1,2\n,3,4\n", "1,2,\n3,4,\n"):
+            file_name = self.write(content)
+            self.assertRaises(ValueError, csv_to_list, file_name)
+            self.assertRaises(ValueError, csv_to_array, file_name)
+
+    def test_iter(self):
+        """
+        Checks if the lazily read lines match the nested lists.
+        """
+        file_name = self.write("7 6 4 2 1\n1 2 7\n9 7 6 2 1\n")
+        self.assertEqual(csv_to_list(file_name, ' '),
+                         list(csv_to_iter(file_name, ' ')))
+        file_name = self.write("0123\n9876\n")
+        self.assertEqual([[0, 1, 2, 3], [9, 8, 7, 6]],
+                         list(csv_to_iter(file_name, None)))
+
+    def test_iter_batch(self):
+        """
+        Checks if the lines are yielded by batches, the last one being
+        shorter.
+        """
+        file_name = self.write("1,2\n3,4\n5,6\n")
+        self.assertEqual([[[1, 2], [3, 4]], [[5, 6]]],
+                         list(csv_to_iter(file_name, batch_size=2)))
+        self.assertRaises(ValueError, list, csv_to_iter(file_name,
+                                                        batch_size=0))
+
+    def test_line_ranges(self):
+        """
+        Checks if the ranges of lines cover the file and are parsed like the
+        whole file.
+        """
+        file_name = self.write("1 2 3\n40 5\n6\n7 8 9 10\n11 12\n")
+        for chunk_size in range(1, 30):
+            ranges = line_ranges(file_name, chunk_size)
+            self.assertEqual(0, ranges[0][0])
+            self.assertEqual(os.path.getsize(file_name), ranges[-1][1])
+            rows = []
+            for start, end in ranges:
+                array, lengths = csv_to_array(file_name, ' ', padded=True,
+                                              start=start, end=end)
+                rows.extend(row[:n].tolist()
+                            for row, n in zip(array, lengths))
+            self.assertEqual(csv_to_list(file_name, ' '), rows)
+        self.assertRaises(ValueError, line_ranges, file_name, 0)
+
+    def test_grid(self):
+        """
+        Checks if the grid is mapped without its line breaks.
+        """
+        for content in ("#..\n.^#\n", "#..\n.^#", "#..\r\n.^#\r\n"):
+            file_name = self.write(content)
+            result = grid_to_array(file_name)
+            self.assertEqual((2, 3), result.shape)
+            self.assertEqual([[True, False, False], [False, False, True]],
+                             (result == ord('#')).tolist())
+            self.assertEqual(ord('^'), result[1, 1])
+
+    def test_grid_not_rectangular(self):
+        """
+        Checks if a grid with lines of different lengths or an empty grid
+        raise an exception.
+        """
+        for content in ("", "#..\n.^\n", "#.\n.\n", "#.\n.^\n\n"):
+            file_name = self.write(content)
+            self.assertRaises(ValueError, grid_to_array, file_name)
+
+    def test_cached(self):
+        """
+        Checks if a cached parser is only called again when the file contents
+        or the arguments change, whatever the type of its result.
+        """
+        calls = []
+
+        def parse(file_name, sep=','):
+            calls.append(file_name)
+            return csv_to_array(file_name, sep, padded=True)
+
+        cache_dir = os.path.join(self.__dir.name, "cache")
+        with mock.patch.dict(os.environ, {"AOC_CACHE_DIR": cache_dir}):
+            for parser in (cached(parse), cached(csv_to_list)):
+                file_name = self.write("1,2\n3,4,5\n")
+                first = parser(file_name)
+                second = parser(file_name)
+                self.assertEqual(str(first), str(second))
+
+                file_name = self.write("1 2\n3 4 5\n")
+                parser(file_name, ' ')
+                parser(file_name, ' ')
+            self.assertEqual(2, len(calls))
+
+            lengths = cached(parse)(file_name, ' ')[1]
+            self.assertEqual([2, 3], lengths.tolist())
+            self.assertEqual(2, len(calls))
+
+    def test_cache_key_processes(self):
+        """
+        Checks if the key of a parser with nested code objects is the same in
+        separate processes, with different hash seeds.
+        """
+        file_name = self.write("1,2\n3,4\n")
+        keys = []
+        for seed in ("1", "2"):
+            output = subprocess.run(
+                [sys.executable, "-c",
+                 "import sys, reader; "
+                 "print(reader.cache_key(reader.csv_to_list, sys.argv[1], "
+                 "by='column'))", file_name],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                env=dict(os.environ, PYTHONHASHSEED=seed),
+                capture_output=True, check=True, text=True
+            )
+            keys.append(output.stdout.strip())
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(keys[0], cache_key(csv_to_list, file_name,
+                                            by="column"))
+
+    def test_cached_eviction(self):
+        """
+        Checks if the least recently used entries are removed when the cache
+        is full.
+        """
+        cache_dir = os.path.join(self.__dir.name, "cache")
+        with mock.patch.dict(os.environ, {"AOC_CACHE_DIR": cache_dir,
+                                          "AOC_CACHE_SIZE": "1"}):
+            parser = cached(csv_to_array)
+            for content in ("1,2\n", "3,4\n"):
+                parser(self.write(content))
+                self.assertEqual(0, len(os.listdir(cache_dir)))
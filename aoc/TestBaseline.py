@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from aoc.baseline import compare
+
+
+class TestBaseline(TestCase):
+    """
+    Unit test class for the comparison with a performance baseline.
+    """
+
+    def test_compare(self):
+        """
+        Checks if only the measures above their threshold are flagged.
+        """
+        baseline = {"2024-1": {"1000": {
+            "parse": {"median_ns": 10**7, "peak_bytes": 1000},
+            "part_two": {"median_ns": 10**7, "peak_bytes": 1000}
+        }}}
+        profiles = {
+            "2024-1": {
+                "1000": {
+                    "parse": {"median_ns": 14 * 10**6, "peak_bytes": 1500},
+                    "part_two": {"median_ns": 2 * 10**7, "peak_bytes": 1000}
+                },
+                "2000": {
+                    "parse": {"median_ns": 10**9, "peak_bytes": 10**6}
+                }
+            },
+            "2025-9": {"10": {
+                "parse": {"median_ns": 10**9, "peak_bytes": 10**6}
+            }}
+        }
+        found = compare(profiles, baseline, 0.5, 0.1, 0)
+        self.assertEqual(2, len(found))
+        self.assertTrue(found[0].startswith("2024-1 size 1000 parse: "
+                                            "peak_bytes"))
+        self.assertTrue(found[1].startswith("2024-1 size 1000 part_two: "
+                                            "median_ns"))
+
+    def test_compare_slack(self):
+        """
+        Checks if the increases of duration below the slack are tolerated.
+        """
+        baseline = {"2024-1": {"10": {
+            "parse": {"median_ns": 100, "peak_bytes": 1000}
+        }}}
+        profiles = {"2024-1": {"10": {
+            "parse": {"median_ns": 5000, "peak_bytes": 1000}
+        }}}
+        self.assertEqual(1, len(compare(profiles, baseline, 0.5, 0.1, 0)))
+        self.assertEqual([], compare(profiles, baseline, 0.5, 0.1, 10**6))
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from aoc.bench import fit_exponent, regressions
+
+
+class TestBench(TestCase):
+    """
+    Unit test class for the benchmark statistics.
+    """
+
+    def test_fit_exponent(self):
+        """
+        Checks if the exponent of exact power laws is found.
+        """
+        sizes = [100, 200, 400, 800]
+        self.assertAlmostEqual(1, fit_exponent(sizes, [3*n for n in sizes]))
+        self.assertAlmostEqual(2, fit_exponent(sizes, [n**2 for n in sizes]))
+
+    def test_fit_exponent_single_size(self):
+        """
+        Checks if fitting a single size, or none, raises an exception.
+        """
+        self.assertRaises(ValueError, fit_exponent, [100, 100], [1, 2])
+        self.assertRaises(ValueError, fit_exponent, [100], [1])
+        self.assertRaises(ValueError, fit_exponent, [], [])
+
+    def test_regressions(self):
+        """
+        Checks if only the exponents above the tolerance are flagged.
+        """
+        baseline = {"2024-1": {"part_one": 1.0, "part_two": 2.0}}
+        exponents = {"2024-1": {"part_one": 1.2, "part_two": 2.5},
+                     "2025-9": {"part_one": 3.0}}
+        found = regressions(exponents, baseline, 0.25)
+        self.assertEqual(1, len(found))
+        self.assertTrue(found[0].startswith("2024-1 part_two"))
@@ -0,0 +1,51 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from aoc.days import find_days, load_day
+from aoc.generators import GENERATORS, generate
+from aoc.runner import run_day
+
+
+class TestGenerators(TestCase):
+    """
+    Unit test class for the synthetic input generators.
+    """
+
+    def test_every_day(self):
+        """
+        Checks if every day with a solution has a generator.
+        """
+        self.assertEqual(set(find_days()), set(GENERATORS))
+
+    def test_seed(self):
+        """
+        Checks if the same seed gives the same input, and another seed a
+        different one.
+        """
+        for year, day in GENERATORS:
+            self.assertEqual(generate(year, day, 20, 1),
+                             generate(year, day, 20, 1))
+            self.assertNotEqual(generate(year, day, 20, 1),
+                                generate(year, day, 20, 2))
+
+    def test_solvable(self):
+        """
+        Checks if each solution reads and solves a small generated input.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "input.txt")
+            for (year, day), (_, sizes) in GENERATORS.items():
+                with open(file_name, "w", encoding="utf-8") as f:
+                    f.write(generate(year, day, min(sizes)))
+                phases = run_day(load_day(year, day), file_name)
+                self.assertTrue(all(isinstance(answer, int)
+                                    for _, answer, _, _ in phases[1:]),
+                                f"{year:d} day {day:d}")
+
+    def test_unknown_day(self):
+        """
+        Checks if generating an input for a day without a generator raises an
+        exception.
+        """
+        self.assertRaises(ValueError, generate, 2025, 10, 10)
@@ -0,0 +1,48 @@
+import csv
+import io
+import json
+from unittest import TestCase
+
+from aoc.instrument import FIELDS, Recorder, measure
+
+
+class TestInstrument(TestCase):
+    """
+    Unit test class for the measures of the phases.
+    """
+
+    def test_measure(self):
+        """
+        Checks if the result is returned and if the memory peak is only
+        traced on demand.
+        """
+        result, duration, peak = measure(sum, [1, 2, 3])
+        self.assertEqual(6, result)
+        self.assertGreaterEqual(duration, 0)
+        self.assertIsNone(peak)
+
+        result, _, peak = measure(bytearray, 10**6, memory=True)
+        self.assertEqual(10**6, len(result))
+        self.assertGreaterEqual(peak, 10**6)
+
+    def test_write(self):
+        """
+        Checks if the records are written as JSON and as CSV.
+        """
+        recorder = Recorder()
+        recorder.add(2024, 1, "input.txt",
+                     [("parse", None, 10, None), ("part_one", 11, 5, 64)])
+
+        stream = io.StringIO()
+        recorder.write(stream, "json")
+        records = json.loads(stream.getvalue())
+        self.assertEqual(recorder.records, records)
+        self.assertEqual(11, records[1]["answer"])
+
+        stream = io.StringIO()
+        recorder.write(stream, "csv")
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        self.assertEqual(list(FIELDS), list(rows[0].keys()))
+        self.assertEqual("64", rows[1]["peak_bytes"])
+
+        self.assertRaises(ValueError, recorder.write, stream, "xml")
@@ -0,0 +1,56 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from aoc.days import load_day
+from aoc.generators import generate
+from aoc.pool import run_days, run_job
+from aoc.runner import run_day
+
+
+class TestPool(TestCase):
+    """
+    Unit test class for the execution of the days in child processes.
+    """
+
+    def test_run_days(self):
+        """
+        Checks if the answers of the child processes are those of a run in
+        the current process, and if errors are reported for each day.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "input.txt")
+            with open(file_name, "w", encoding="utf-8") as f:
+                f.write(generate(2024, 1, 100))
+            missing = os.path.join(directory, "missing.txt")
+
+            expected = [
+                answer for _, answer, _, _
+                in run_day(load_day(2024, 1), file_name)
+            ]
+            results = {
+                job[2]: (phases, error) for job, phases, error
+                in run_days([(2024, 1, file_name, []),
+                             (2024, 1, missing, [])], workers=2, timeout=60)
+            }
+
+        phases, error = results[file_name]
+        self.assertIsNone(error)
+        self.assertEqual(expected, [answer for _, answer, _, _ in phases])
+
+        phases, error = results[missing]
+        self.assertEqual([], phases)
+        self.assertTrue(error.startswith("FileNotFoundError"))
+
+    def test_run_job(self):
+        """
+        Checks if an error in the current process is returned instead of
+        stopping the run.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "input.txt")
+            with open(file_name, "w", encoding="utf-8") as f:
+                f.write("not a list of locations\n")
+            phases, error = run_job((2024, 1, file_name, []))
+        self.assertEqual([], phases)
+        self.assertTrue(error.startswith("ValueError"))
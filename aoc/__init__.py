@@ -0,0 +1,3 @@
+"""
+Tools to run and measure the Advent of Code solutions from a single process.
+"""
@@ -0,0 +1,321 @@
+"""
+Command line interface of the Advent of Code tools.
+
+Examples
+--------
+python -m aoc run 2024 6 input.txt
+python -m aoc run 2025 8 input.txt 1000
+python -m aoc run --all 2024 --input input.txt
+python -m aoc run --all --memory --format csv > measures.csv
+python -m aoc run --all --jobs 0 --timeout 60 --memory-limit 2048
+python -m aoc bench 2024 1 --sizes 1000 2000 4000 --compare exponents.json
+python -m aoc check --baseline baseline.json --update
+python -m aoc check 2024 --baseline baseline.json --time-threshold 0.3
+python -m aoc generate 2024 6 130 --seed 1 --output input.txt
+"""
+import argparse
+import os
+import sys
+import time
+
+from aoc.baseline import compare, load_baseline, profile, save_baseline
+from aoc.bench import (load_exponents, regressions, save_exponents,
+                       sweep)
+from aoc.days import day_directory, find_days
+from aoc.generators import GENERATORS, generate
+from aoc.instrument import Recorder
+from aoc.pool import run_days, run_job
+from aoc.runner import format_duration, format_size
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Runs one day or all the days and prints the duration (and memory peak)
+    of each phase, as text or as JSON or CSV records.
+
+    With several jobs, a timeout or a memory limit, the days are run in
+    child processes and reported in order of completion.
+    """
+    if args.all:
+        days = [
+            (year, day) for year, day in find_days()
+            if args.year is None or year == args.year
+        ]
+        jobs = [
+            (year, day, os.path.join(day_directory(year, day), args.input), [])
+            for year, day in days
+        ]
+    else:
+        if args.year is None or args.day is None or args.file is None:
+            print("A year, a day and an input file are required without "
+                  "--all.", file=sys.stderr)
+            return 2
+        jobs = [(args.year, args.day, args.file, args.args)]
+
+    text = args.format == "text"
+    runnable = []
+    for job in jobs:
+        if os.path.isfile(job[2]):
+            runnable.append(job)
+        elif text:
+            print(f"{job[0]:d} Day {job[1]:d}")
+            print(f"    skipped, no input file {job[2]}")
+        else:
+            print(f"{job[0]:d} Day {job[1]:d} skipped, no input file "
+                  f"{job[2]}", file=sys.stderr)
+
+    recorder = Recorder()
+    failures = 0
+    start = time.perf_counter_ns()
+    if args.jobs == 1 and args.timeout is None and args.memory_limit is None:
+        results = (
+            (job, *run_job(job, args.cache, args.memory))
+            for job in runnable
+        )
+    else:
+        memory_limit = None
+        if args.memory_limit is not None:
+            memory_limit = args.memory_limit * 2**20
+        results = run_days(runnable, args.jobs, args.timeout, memory_limit,
+                           args.cache, args.memory)
+
+    for (year, day, file_name, _), phases, error in results:
+        recorder.add(year, day, file_name, phases, error=error)
+        failures += error is not None
+        if not text:
+            if error is not None:
+                print(f"{year:d} Day {day:d} failed: {error}",
+                      file=sys.stderr)
+            continue
+        print(f"{year:d} Day {day:d}")
+        for phase, answer, duration, peak in phases:
+            name = phase.replace('_', ' ')
+            line = f"    {name:<9}{format_duration(duration):>14}"
+            if peak is not None:
+                line += f"{format_size(peak):>12}"
+            if answer is not None:
+                line += f"  {answer}"
+            print(line)
+        if error is not None:
+            print(f"    failed, {error}")
+
+    if text:
+        print(f"Total: {format_duration(time.perf_counter_ns() - start)}")
+    else:
+        recorder.write(sys.stdout, args.format)
+    return 1 if failures else 0
+
+
+def bench(args: argparse.Namespace) -> int:
+    """
+    Benchmarks one day or all the days with a generator on inputs of
+    increasing size, and prints the fitted exponent of each phase.
+    """
+    if args.year is not None and args.day is not None:
+        days = [(args.year, args.day)]
+    else:
+        days = [
+            (year, day) for year, day in sorted(GENERATORS)
+            if args.year is None or year == args.year
+        ]
+
+    exponents = {}
+    for year, day in days:
+        print(f"{year:d} Day {day:d}")
+        result = sweep(year, day, args.sizes, args.warmup, args.repeat,
+                       args.seed)
+        exponents[f"{year:d}-{day:d}"] = {
+            phase: stats["exponent"] for phase, stats in result.items()
+        }
+        for phase, stats in result.items():
+            print(f"    {phase.replace('_', ' '):<9}"
+                  f"exponent {stats['exponent']:5.2f}")
+            for size, median, stdev in zip(stats["sizes"], stats["medians"],
+                                           stats["stdevs"]):
+                print(f"        {size:>10d}{format_duration(int(median)):>14}"
+                      f" ± {format_duration(int(stdev))}")
+
+    if args.save is not None:
+        save_exponents(exponents, args.save)
+
+    if args.compare is not None:
+        found = regressions(exponents, load_exponents(args.compare),
+                            args.tolerance)
+        for regression in found:
+            print(f"REGRESSION {regression}")
+        if found:
+            return 1
+    return 0
+
+
+def check(args: argparse.Namespace) -> int:
+    """
+    Profiles one day or all the days on synthetic inputs, and compares the
+    profiles with a baseline file, or updates it.
+    """
+    if args.year is not None and args.day is not None:
+        days = [(args.year, args.day)]
+    else:
+        days = [
+            (year, day) for year, day in sorted(GENERATORS)
+            if args.year is None or year == args.year
+        ]
+
+    if os.path.isfile(args.baseline):
+        baseline = load_baseline(args.baseline)
+    elif args.update:
+        baseline = {}
+    else:
+        print(f"No baseline file {args.baseline}, create it with --update.",
+              file=sys.stderr)
+        return 2
+
+    profiles = {}
+    for year, day in days:
+        key = f"{year:d}-{day:d}"
+        sizes = args.sizes
+        if sizes is None and not args.update:
+            if key not in baseline:
+                print(f"{key}: skipped, not in the baseline")
+                continue
+            sizes = sorted(int(size) for size in baseline[key])
+        print(f"{key}: profiling sizes {sizes or 'default'}")
+        profiles[key] = profile(year, day, sizes, args.warmup, args.repeat,
+                                args.seed)
+
+    if args.update:
+        baseline.update(profiles)
+        save_baseline(baseline, args.baseline)
+        print(f"Baseline {args.baseline} updated.")
+        return 0
+
+    found = compare(profiles, baseline, args.time_threshold,
+                    args.memory_threshold, int(args.time_slack * 10**6))
+    for regression in found:
+        print(f"REGRESSION {regression}")
+    return 1 if found else 0
+
+
+def generate_input(args: argparse.Namespace) -> int:
+    """
+    Writes a synthetic input to a file or to the standard output.
+    """
+    content = generate(args.year, args.day, args.size, args.seed)
+    if args.output is None:
+        sys.stdout.write(content)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(content)
+    return 0
+
+
+def main(argv=None) -> int:
+    """
+    Parses the command line and runs the chosen command.
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser(
+        "run", help="run the solutions and time their phases"
+    )
+    run_parser.add_argument("year", type=int, nargs='?')
+    run_parser.add_argument("day", type=int, nargs='?')
+    run_parser.add_argument("file", nargs='?', help="the input file")
+    run_parser.add_argument("args", nargs='*',
+                            help="other arguments of the solution")
+    run_parser.add_argument("--all", action="store_true",
+                            help="run every day (of the given year)")
+    run_parser.add_argument("--input", default="input.txt",
+                            help="input file name in each day directory "
+                                 "with --all (default: input.txt)")
+    run_parser.add_argument("--cache", action="store_true",
+                            help="cache the parsed inputs on disk")
+    run_parser.add_argument("--memory", action="store_true",
+                            help="trace the memory peak of each phase")
+    run_parser.add_argument("--format", choices=("text", "json", "csv"),
+                            default="text",
+                            help="output format (default: text)")
+    run_parser.add_argument("--jobs", "-j", type=int, default=1,
+                            help="days run in parallel processes, 0 for "
+                                 "one per processor (default: 1)")
+    run_parser.add_argument("--timeout", type=float,
+                            help="seconds after which a day is killed")
+    run_parser.add_argument("--memory-limit", type=int,
+                            help="memory cap of each day in MiB")
+    run_parser.set_defaults(func=run)
+
+    bench_parser = commands.add_parser(
+        "bench", help="benchmark the solutions on inputs of increasing size"
+    )
+    bench_parser.add_argument("year", type=int, nargs='?')
+    bench_parser.add_argument("day", type=int, nargs='?')
+    bench_parser.add_argument("--sizes", type=int, nargs='+',
+                              help="input sizes (default: per day)")
+    bench_parser.add_argument("--warmup", type=int, default=1,
+                              help="runs before measuring (default: 1)")
+    bench_parser.add_argument("--repeat", type=int, default=5,
+                              help="runs measured (default: 5)")
+    bench_parser.add_argument("--seed", type=int, default=0,
+                              help="seed of the input generators")
+    bench_parser.add_argument("--save", help="save the exponents as JSON")
+    bench_parser.add_argument("--compare",
+                              help="flag the exponents above those saved")
+    bench_parser.add_argument("--tolerance", type=float, default=0.25,
+                              help="exponent increase tolerated "
+                                   "(default: 0.25)")
+    bench_parser.set_defaults(func=bench)
+
+    check_parser = commands.add_parser(
+        "check", help="compare the solutions with a performance baseline"
+    )
+    check_parser.add_argument("year", type=int, nargs='?')
+    check_parser.add_argument("day", type=int, nargs='?')
+    check_parser.add_argument("--baseline", required=True,
+                              help="baseline file (JSON)")
+    check_parser.add_argument("--update", action="store_true",
+                              help="write the profiles in the baseline "
+                                   "instead of comparing them")
+    check_parser.add_argument("--sizes", type=int, nargs='+',
+                              help="input sizes (default: those of the "
+                                   "baseline, or per day with --update)")
+    check_parser.add_argument("--warmup", type=int, default=1,
+                              help="runs before measuring (default: 1)")
+    check_parser.add_argument("--repeat", type=int, default=5,
+                              help="runs measured (default: 5)")
+    check_parser.add_argument("--seed", type=int, default=0,
+                              help="seed of the input generators")
+    check_parser.add_argument("--time-threshold", type=float, default=0.5,
+                              help="relative increase of a median duration "
+                                   "tolerated (default: 0.5)")
+    check_parser.add_argument("--memory-threshold", type=float, default=0.1,
+                              help="relative increase of a memory peak "
+                                   "tolerated (default: 0.1)")
+    check_parser.add_argument("--time-slack", type=float, default=1.0,
+                              help="increase of a median duration in ms "
+                                   "always tolerated (default: 1)")
+    check_parser.set_defaults(func=check)
+
+    generate_parser = commands.add_parser(
+        "generate", help="generate a synthetic input"
+    )
+    generate_parser.add_argument("year", type=int)
+    generate_parser.add_argument("day", type=int)
+    generate_parser.add_argument("size", type=int)
+    generate_parser.add_argument("--seed", type=int, default=0,
+                                 help="seed of the generator (default: 0)")
+    generate_parser.add_argument("--output", "-o",
+                                 help="output file (default: stdout)")
+    generate_parser.set_defaults(func=generate_input)
+
+    args = parser.parse_args(argv)
+    if args.command in ("bench", "check") and args.sizes is not None \
+            and len(set(args.sizes)) < 2:
+        commands.choices[args.command].error(
+            "--sizes: at least two distinct sizes are required"
+        )
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
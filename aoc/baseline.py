@@ -0,0 +1,137 @@
+"""
+Performance baselines of the solutions on synthetic inputs, and the
+regressions of a run against them.
+"""
+import json
+import os
+import statistics
+import tempfile
+from collections.abc import Sequence
+from typing import Dict, List
+
+from aoc.bench import measure
+from aoc.days import load_day
+from aoc.generators import GENERATORS, generate
+from aoc.runner import run_day
+
+
+# Measures of a day: size -> phase -> {"median_ns": ..., "peak_bytes": ...}.
+Profile = Dict[str, Dict[str, Dict[str, int]]]
+
+
+def profile(year: int, day: int, sizes: Sequence[int] | None = None,
+            warmup: int = 1, repeat: int = 5, seed: int = 0) -> Profile:
+    """
+    Measures the median duration and the memory peak of each phase of a
+    solution on synthetic inputs.
+
+    The memory peak is measured by an extra run, since tracing the
+    allocations slows down the phases.
+
+    Parameters
+    ----------
+    year: int
+        The year of the puzzle.
+    day: int
+        The day of the puzzle.
+    sizes: Sequence[int] | None, default: None
+        The input sizes, or None for the default sizes of the day.
+    warmup: int, default: 1
+        The number of runs made before measuring each size.
+    repeat: int, default: 5
+        The number of runs measured for each size.
+    seed: int, default: 0
+        The seed of the input generator.
+
+    Returns
+    -------
+    Profile
+        For each size (as a string, like in JSON) and each phase, the
+        median duration in nanoseconds and the memory peak in bytes.
+    """
+    if sizes is None:
+        sizes = GENERATORS[(year, day)][1]
+
+    result = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            file_name = os.path.join(directory, f"{size:d}.txt")
+            with open(file_name, "w", encoding="utf-8") as f:
+                f.write(generate(year, day, size, seed))
+
+            durations = measure(year, day, file_name, warmup, repeat)
+            phases = run_day(load_day(year, day), file_name, memory=True)
+            result[str(size)] = {
+                phase: {
+                    "median_ns": int(statistics.median(durations[phase])),
+                    "peak_bytes": peak
+                }
+                for phase, _, _, peak in phases
+            }
+    return result
+
+
+def compare(profiles: Dict[str, Profile], baseline: Dict[str, Profile],
+            time_threshold: float = 0.5,
+            memory_threshold: float = 0.1,
+            time_slack: int = 10**6) -> List[str]:
+    """
+    Compares the profiles of a run with those of a baseline.
+
+    Parameters
+    ----------
+    profiles: Dict[str, Profile]
+        The profile of each day ("<year>-<day>").
+    baseline: Dict[str, Profile]
+        The profiles of reference, in the same format.
+    time_threshold: float, default: 0.5
+        The relative increase of a median duration tolerated before being a
+        regression (0.5 for +50%).
+    memory_threshold: float, default: 0.1
+        The relative increase of a memory peak tolerated before being a
+        regression.
+    time_slack: int, default: 10**6
+        The increase of a median duration in nanoseconds always tolerated,
+        so that the noise of the shortest phases is not a regression.
+
+    Returns
+    -------
+    List[str]
+        A description of each regression.
+    """
+    result = []
+    for key, sizes in profiles.items():
+        for size, phases in sizes.items():
+            for phase, measures in phases.items():
+                reference = baseline.get(key, {}).get(size, {}).get(phase)
+                if reference is None:
+                    continue
+                for name, threshold, slack in (
+                    ("median_ns", time_threshold, time_slack),
+                    ("peak_bytes", memory_threshold, 0)
+                ):
+                    limit = reference[name] * (1 + threshold) + slack
+                    if measures[name] > limit:
+                        result.append(
+                            f"{key} size {size} {phase}: {name} "
+                            f"{measures[name]:d} > {reference[name]:d} "
+                            f"+ {threshold:.0%}"
+                        )
+    return result
+
+
+def load_baseline(file_name: str) -> Dict[str, Profile]:
+    """
+    Loads profiles saved as JSON.
+    """
+    with open(file_name, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(profiles: Dict[str, Profile], file_name: str) -> None:
+    """
+    Saves profiles as JSON.
+    """
+    with open(file_name, "w", encoding="utf-8") as f:
+        json.dump(profiles, f, indent=4, sort_keys=True)
+        f.write('\n')
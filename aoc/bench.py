@@ -0,0 +1,187 @@
+"""
+Benchmark of the solutions on synthetic inputs of increasing size, with the
+empirical growth exponent of each phase.
+"""
+import json
+import math
+import os
+import statistics
+import tempfile
+from collections.abc import Sequence
+from typing import Any, Dict, List
+
+from aoc.days import load_day
+from aoc.generators import GENERATORS, generate
+from aoc.runner import run_day
+
+
+def fit_exponent(sizes: Sequence[int], durations: Sequence[float]) -> float:
+    """
+    Fits durations = c * sizes^k by least squares in log-log scale.
+
+    Parameters
+    ----------
+    sizes: Sequence[int]
+        The input sizes.
+    durations: Sequence[float]
+        The duration measured for each size.
+
+    Returns
+    -------
+    float
+        The exponent k, e.g. 1 for a linear phase and 2 for a quadratic one.
+
+    Raises
+    ------
+    ValueError
+        when there are less than two distinct sizes.
+    """
+    points = [
+        (math.log(size), math.log(max(duration, 1)))
+        for size, duration in zip(sizes, durations)
+    ]
+    if len(points) < 2:
+        raise ValueError("At least two distinct sizes are required.")
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    var_x = sum((x - mean_x)**2 for x, _ in points)
+    if var_x == 0:
+        raise ValueError("At least two distinct sizes are required.")
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def measure(year: int, day: int, file_name: str, warmup: int = 1,
+            repeat: int = 5) -> Dict[str, List[int]]:
+    """
+    Runs a solution several times on the same input.
+
+    Parameters
+    ----------
+    year: int
+        The year of the puzzle.
+    day: int
+        The day of the puzzle.
+    file_name: str
+        The input file path.
+    warmup: int, default: 1
+        The number of runs made before measuring.
+    repeat: int, default: 5
+        The number of runs measured.
+
+    Returns
+    -------
+    Dict[str, List[int]]
+        The durations in nanoseconds of each phase.
+    """
+    module = load_day(year, day)
+    for _ in range(0, warmup):
+        run_day(module, file_name)
+
+    result = {}
+    for _ in range(0, repeat):
+        for phase, _, duration, _ in run_day(module, file_name):
+            result.setdefault(phase, []).append(duration)
+    return result
+
+
+def sweep(year: int, day: int, sizes: Sequence[int] | None = None,
+          warmup: int = 1, repeat: int = 5,
+          seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """
+    Measures a solution on synthetic inputs of increasing size.
+
+    Parameters
+    ----------
+    year: int
+        The year of the puzzle.
+    day: int
+        The day of the puzzle.
+    sizes: Sequence[int] | None, default: None
+        The input sizes, or None for the default sizes of the day.
+    warmup: int, default: 1
+        The number of runs made before measuring each size.
+    repeat: int, default: 5
+        The number of runs measured for each size.
+    seed: int, default: 0
+        The seed of the input generator.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        For each phase, the sizes, the median and the standard deviation of
+        its durations in nanoseconds for each size, and its fitted exponent.
+    """
+    if sizes is None:
+        sizes = GENERATORS[(year, day)][1]
+
+    result = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            file_name = os.path.join(directory, f"{size:d}.txt")
+            with open(file_name, "w", encoding="utf-8") as f:
+                f.write(generate(year, day, size, seed))
+
+            for phase, durations in measure(year, day, file_name, warmup,
+                                            repeat).items():
+                stats = result.setdefault(
+                    phase, {"sizes": [], "medians": [], "stdevs": []}
+                )
+                stats["sizes"].append(size)
+                stats["medians"].append(statistics.median(durations))
+                stats["stdevs"].append(
+                    statistics.stdev(durations) if len(durations) > 1 else 0
+                )
+
+    for stats in result.values():
+        stats["exponent"] = fit_exponent(stats["sizes"], stats["medians"])
+    return result
+
+
+def regressions(exponents: Dict[str, Dict[str, float]],
+                baseline: Dict[str, Dict[str, float]],
+                tolerance: float = 0.25) -> List[str]:
+    """
+    Compares fitted exponents with those of a baseline.
+
+    Parameters
+    ----------
+    exponents: Dict[str, Dict[str, float]]
+        The exponent of each phase of each day ("<year>-<day>").
+    baseline: Dict[str, Dict[str, float]]
+        The exponents of reference, in the same format.
+    tolerance: float, default: 0.25
+        The increase of an exponent tolerated before being a regression.
+
+    Returns
+    -------
+    List[str]
+        A description of each regression.
+    """
+    result = []
+    for key, phases in exponents.items():
+        for phase, exponent in phases.items():
+            reference = baseline.get(key, {}).get(phase)
+            if reference is not None and exponent > reference + tolerance:
+                result.append(
+                    f"{key} {phase}: exponent {exponent:.2f} > "
+                    f"{reference:.2f} + {tolerance:.2f}"
+                )
+    return result
+
+
+def load_exponents(file_name: str) -> Dict[str, Dict[str, float]]:
+    """
+    Loads exponents saved as JSON.
+    """
+    with open(file_name, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_exponents(exponents: Dict[str, Dict[str, float]],
+                   file_name: str) -> None:
+    """
+    Saves exponents as JSON.
+    """
+    with open(file_name, "w", encoding="utf-8") as f:
+        json.dump(exponents, f, indent=4, sort_keys=True)
+        f.write('\n')
@@ -0,0 +1,114 @@
+"""
+Discovery and loading of the solutions of each day as libraries.
+
+Each solution is a file <year>/Day_<day>/solution.py exposing:
+- parse(file_name, *args): reads the input file;
+- part_one(data): solves the first part with the parsed input;
+- part_two(data): solves the second part with the parsed input (optional).
+The parts must not modify the parsed input, so that it can be reused.
+"""
+import importlib.util
+import os
+import re
+import sys
+from types import ModuleType
+from typing import Dict, List, Tuple
+
+
+# Root directory of the repository.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Solutions already loaded by year and day.
+MODULES: Dict[Tuple[int, int], ModuleType] = {}
+
+
+def day_directory(year: int, day: int) -> str:
+    """
+    Gets the directory of a day.
+
+    Parameters
+    ----------
+    year: int
+        The year of the puzzle.
+    day: int
+        The day of the puzzle.
+
+    Returns
+    -------
+    str
+        The directory path.
+    """
+    return os.path.join(ROOT, f"{year:d}", f"Day_{day:d}")
+
+
+def find_days() -> List[Tuple[int, int]]:
+    """
+    Finds all the days with a solution.
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        The year and day of each solution, in chronological order.
+    """
+    result = []
+    for year in os.listdir(ROOT):
+        if not re.match(r"^\d{4}$", year):
+            continue
+        for day in os.listdir(os.path.join(ROOT, year)):
+            match = re.match(r"^Day_(\d+)$", day)
+            if match and os.path.isfile(
+                os.path.join(ROOT, year, day, "solution.py")
+            ):
+                result.append((int(year), int(match.group(1))))
+    return sorted(result)
+
+
+def load_day(year: int, day: int) -> ModuleType:
+    """
+    Imports the solution of a day without running its main block.
+    The directory of the day is added to the import path while it is loaded,
+    so that the solution can import its own modules (e.g. Map or Disk).
+
+    Parameters
+    ----------
+    year: int
+        The year of the puzzle.
+    day: int
+        The day of the puzzle.
+
+    Returns
+    -------
+    ModuleType
+        The solution module.
+
+    Raises
+    ------
+    ValueError
+        when there is no solution for this day.
+    """
+    if (year, day) in MODULES:
+        return MODULES[(year, day)]
+
+    directory = day_directory(year, day)
+    file_name = os.path.join(directory, "solution.py")
+    if not os.path.isfile(file_name):
+        raise ValueError(f"No solution found for {year:d} day {day:d}!")
+
+    spec = importlib.util.spec_from_file_location(
+        f"aoc_{year:d}_day_{day:d}", file_name
+    )
+    module = importlib.util.module_from_spec(spec)
+    # Registered so that its functions can be pickled, e.g. by a pool of
+    # processes.
+    sys.modules[spec.name] = module
+    sys.path.insert(0, directory)
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+    finally:
+        sys.path.remove(directory)
+
+    MODULES[(year, day)] = module
+    return module
@@ -0,0 +1,510 @@
+"""
+Seeded generators of synthetic puzzle inputs of any size.
+
+Each generator takes a size and a random generator, and returns the contents
+of an input file in the exact format read by the parse function of its day.
+"""
+import random
+from collections.abc import Callable, Sequence
+from typing import Dict, Tuple
+
+
+def location_ids(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 1: two columns of size location IDs, with repeated IDs.
+    """
+    low = 10000
+    high = low + max(size, 10)
+    return "".join(
+        f"{rng.randint(low, high):d}   {rng.randint(low, high):d}\n"
+        for _ in range(0, size)
+    )
+
+
+def reports(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 2: size reports of 5 to 8 levels, increasing or decreasing by 1
+    to 3, where a level is sometimes replaced by a random one.
+    """
+    lines = []
+    for _ in range(0, size):
+        n_levels = rng.randint(5, 8)
+        step = rng.choice((-1, 1))
+        levels = [rng.randint(25, 75)]
+        for _ in range(1, n_levels):
+            levels.append(levels[-1] + step * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            levels[rng.randrange(n_levels)] = rng.randint(1, 99)
+        lines.append(" ".join(f"{level:d}" for level in levels))
+    return "\n".join(lines) + "\n"
+
+
+def corrupted_memory(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 3: size instructions, mostly mul(X,Y) but also do(), don't() and
+    corrupted ones, mixed with garbage characters on lines of 100
+    instructions.
+    """
+    garbage = "!@#$%^&*()[]{}<>?/+-_ ,:;'what\\from"
+    lines = []
+    line = []
+    for i in range(0, size):
+        draw = rng.random()
+        if draw < 0.7:
+            x, y = rng.randint(1, 999), rng.randint(1, 999)
+            line.append(f"mul({x:d},{y:d})")
+        elif draw < 0.8:
+            line.append("do()")
+        elif draw < 0.9:
+            line.append("don't()")
+        else:
+            line.append(rng.choice(("mul(4*", "mul[3,7]", "mul ( 2 , 4 )",
+                                    "?(12,34)", "do_not_mul(5,5")))
+        line.append("".join(rng.choice(garbage)
+                            for _ in range(0, rng.randint(0, 8))))
+        if (i + 1) % 100 == 0:
+            lines.append("".join(line))
+            line = []
+    if line:
+        lines.append("".join(line))
+    return "\n".join(lines) + "\n"
+
+
+def word_search(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 4: a size x size grid of the letters X, M, A and S.
+    """
+    return "".join(
+        "".join(rng.choice("XMAS") for _ in range(0, size)) + "\n"
+        for _ in range(0, size)
+    )
+
+
+def page_updates(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 5: the ordering rules of 49 two-digit pages, followed by size
+    updates of 5 to 23 pages, half of them correctly ordered.
+    """
+    pages = rng.sample(range(10, 100), 49)
+    rules = [
+        f"{pages[i]:d}|{pages[j]:d}"
+        for i in range(0, len(pages))
+        for j in range(i+1, len(pages))
+    ]
+    rng.shuffle(rules)
+
+    rank = {page: i for i, page in enumerate(pages)}
+    updates = []
+    for _ in range(0, size):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=lambda page: rank[page])
+        updates.append(",".join(f"{page:d}" for page in update))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def guard_map(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 6: a size x size map where the obstacles lead the guard, facing
+    up from the center, along a spiral whose arms are 4 cells apart, until it
+    leaves the map.
+    The other cells have 2% of obstacles.
+    """
+    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    grid = [['.' for _ in range(0, size)] for _ in range(0, size)]
+    x = y = size // 2
+    grid[x][y] = '^'
+
+    # Walks along the spiral and places an obstacle at the end of each arm.
+    path = {(x, y)}
+    arm = 0
+    is_inside = True
+    while is_inside:
+        dx, dy = directions[arm % 4]
+        for _ in range(0, 4 * (arm // 2 + 1)):
+            x, y = x + dx, y + dy
+            if not (0 <= x < size and 0 <= y < size):
+                is_inside = False
+                break
+            path.add((x, y))
+        if is_inside and 0 <= x + dx < size and 0 <= y + dy < size:
+            grid[x + dx][y + dy] = '#'
+        arm += 1
+
+    for i in range(0, size):
+        for j in range(0, size):
+            if (i, j) not in path and rng.random() < 0.02:
+                grid[i][j] = '#'
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+def calibrations(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 7: size equations of 2 to 9 operands, half of them true with a
+    random combination of +, * and ||.
+    """
+    lines = []
+    for _ in range(0, size):
+        operands = [rng.randint(1, 99) for _ in range(0, rng.randint(2, 9))]
+        result = operands[0]
+        for operand in operands[1:]:
+            operator = rng.randrange(3)
+            if operator == 0:
+                result += operand
+            elif operator == 1:
+                result *= operand
+            else:
+                result = int(f"{result:d}{operand:d}")
+        if rng.random() < 0.5:
+            result += rng.randint(1, 9)
+        lines.append(f"{result:d}: " + " ".join(f"{o:d}" for o in operands))
+    return "\n".join(lines) + "\n"
+
+
+def antennas(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 8: a size x size map with 1% of antennas of 36 frequencies.
+    """
+    frequencies = "0123456789abcdefghijklmnopqrstuvwxyz"
+    return "".join(
+        "".join(
+            rng.choice(frequencies) if rng.random() < 0.01 else '.'
+            for _ in range(0, size)
+        ) + "\n"
+        for _ in range(0, size)
+    )
+
+
+def disk_map(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 9: a disk map of size digits, with files of 1 to 9 blocks.
+    """
+    return "".join(
+        f"{rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9):d}"
+        for i in range(0, size)
+    ) + "\n"
+
+
+def topographic_map(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 10: a size x size map of heights rising diagonally from 0 to 9,
+    with 10% of random heights.
+    """
+    return "".join(
+        "".join(
+            f"{rng.randint(0, 9) if rng.random() < 0.1 else (i + j) % 10:d}"
+            for j in range(0, size)
+        ) + "\n"
+        for i in range(0, size)
+    )
+
+
+def stones(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 11: size stones engraved with numbers up to 10^6.
+    """
+    return " ".join(
+        f"{rng.randint(0, 10**6):d}" for _ in range(0, size)
+    ) + "\n"
+
+
+def garden(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 12: a size x size garden made of 4 x 4 plots of 8 kinds of
+    plants, with 10% of random plants.
+    """
+    plants = "ABCDEFGH"
+    plots = [
+        [rng.choice(plants) for _ in range(0, size // 4 + 1)]
+        for _ in range(0, size // 4 + 1)
+    ]
+    return "".join(
+        "".join(
+            rng.choice(plants) if rng.random() < 0.1 else plots[i//4][j//4]
+            for j in range(0, size)
+        ) + "\n"
+        for i in range(0, size)
+    )
+
+
+def claw_machines(size: int, rng: random.Random) -> str:
+    """
+    2024 Day 13: size claw machines, half of them with a reachable prize and
+    the other half with a prize slightly off.
+    """
+    machines = []
+    for _ in range(0, size):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(0, 4))
+        # The moves of the two buttons must not be collinear.
+        while ax * by == ay * bx:
+            by = rng.randint(10, 99)
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        px, py = a * ax + b * bx, a * ay + b * by
+        if rng.random() < 0.5:
+            # Moves the prize slightly away from the reachable positions.
+            px += rng.randint(1, 9)
+        machines.append(
+            f"Button A: X+{ax:d}, Y+{ay:d}\n"
+            f"Button B: X+{bx:d}, Y+{by:d}\n"
+            f"Prize: X={px:d}, Y={py:d}\n"
+        )
+    return "\n".join(machines)
+
+
+def rotations(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 1: size rotations of the dial of 1 to 999 clicks.
+    """
+    return "".join(
+        f"{rng.choice('LR')}{rng.randint(1, 999):d}\n"
+        for _ in range(0, size)
+    )
+
+
+def id_ranges(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 2: size ranges of up to 1000 IDs, on a single line, each one
+    starting a little before an ID made of a sequence of 1 to 5 digits
+    repeated from twice to 10 times, so that the IDs repeated more than
+    twice of part 2 occur too.
+    """
+    ranges = []
+    for _ in range(0, size):
+        n_digits = rng.randint(1, 5)
+        pattern = f"{rng.randint(10**(n_digits - 1), 10**n_digits - 1):d}"
+        repeated = int(pattern * rng.randint(2, max(2, 10 // n_digits)))
+        start = max(1, repeated - rng.randint(0, 500))
+        ranges.append(f"{start:d}-{start + rng.randint(0, 1000):d}")
+    return ",".join(ranges) + "\n"
+
+
+def battery_banks(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 3: size banks of 100 batteries rated from 1 to 9.
+    """
+    return "".join(
+        "".join(f"{rng.randint(1, 9):d}" for _ in range(0, 100)) + "\n"
+        for _ in range(0, size)
+    )
+
+
+def paper_rolls(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 4: a size x size grid with 60% of paper rolls.
+    """
+    return "".join(
+        "".join('@' if rng.random() < 0.6 else '.' for _ in range(0, size))
+        + "\n"
+        for _ in range(0, size)
+    )
+
+
+def ingredients(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 5: size ranges of fresh ingredient IDs and size IDs.
+    """
+    high = 10**12
+    ranges = []
+    for _ in range(0, size):
+        start = rng.randint(1, high)
+        ranges.append(f"{start:d}-{start + rng.randint(0, high // size):d}")
+    ids = [f"{rng.randint(1, high):d}" for _ in range(0, size)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids) + "\n"
+
+
+def worksheet(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 6: size problems of 4 numbers of 1 to 4 digits, each problem
+    having 2 to 4 columns where its numbers are aligned.
+    """
+    rows = [[] for _ in range(0, 4)]
+    operators = []
+    for _ in range(0, size):
+        width = rng.randint(2, 4)
+        numbers = [
+            f"{rng.randint(10**(n_digits-1), 10**n_digits - 1):d}"
+            for n_digits in [width] + [rng.randint(1, width)
+                                       for _ in range(0, 3)]
+        ]
+        rng.shuffle(numbers)
+        is_left = rng.random() < 0.5
+        for row, number in zip(rows, numbers):
+            row.append(number.ljust(width) if is_left
+                       else number.rjust(width))
+        operators.append(rng.choice("+*").ljust(width))
+    return "".join(" ".join(row) + "\n" for row in rows + [operators])
+
+
+def tachyon_manifold(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 7: a size x size manifold with the beam starting at the top, and
+    splitters on every other row.
+    """
+    lines = []
+    for i in range(0, size):
+        if i == 0:
+            line = ['.'] * size
+            line[size // 2] = 'S'
+        elif i % 2 == 0:
+            line = ['^' if rng.random() < 0.3 else '.'
+                    for _ in range(0, size)]
+        else:
+            line = ['.'] * size
+        lines.append("".join(line) + "\n")
+    return "".join(lines)
+
+
+def junction_boxes(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 8: the 3D coordinates of size junction boxes.
+    """
+    return "".join(
+        ",".join(f"{rng.randint(0, 99999):d}" for _ in range(0, 3)) + "\n"
+        for _ in range(0, size)
+    )
+
+
+def red_tiles(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 9: the corners of a rectilinear polygon of about size corners,
+    shaped as a histogram whose bars have distinct consecutive heights.
+    """
+    n_bars = max(size // 2 - 1, 1)
+    xs = [2]
+    for _ in range(0, n_bars):
+        xs.append(xs[-1] + rng.randint(2, 10))
+    heights = [rng.randint(2, 10 * n_bars)]
+    while len(heights) < n_bars:
+        height = rng.randint(2, 10 * n_bars)
+        if height != heights[-1]:
+            heights.append(height)
+
+    corners = [(xs[0], 0), (xs[0], heights[0])]
+    for i in range(1, n_bars):
+        corners.append((xs[i], heights[i-1]))
+        corners.append((xs[i], heights[i]))
+    corners.append((xs[-1], heights[-1]))
+    corners.append((xs[-1], 0))
+    return "".join(f"{x:d},{y:d}\n" for x, y in corners)
+
+
+def devices(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 11: a directed acyclic graph of size devices connected to 1 to 3
+    following devices, where svr comes before fft, fft before dac and every
+    device before out, and you is among the first devices.
+    """
+    special = ("svr", "you", "fft", "dac", "out")
+    names = set()
+    while len(names) < max(size, 10) - len(special):
+        name = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz")
+                       for _ in range(0, 3))
+        if name not in special:
+            names.add(name)
+
+    # Places the special devices in the topological order.
+    order = sorted(names)
+    rng.shuffle(order)
+    order.insert(len(order) // 3, "fft")
+    order.insert(2 * len(order) // 3, "dac")
+    order.insert(rng.randint(1, len(order) // 4), "you")
+    order.insert(0, "svr")
+    order.append("out")
+
+    lines = []
+    for i, name in enumerate(order[:-1]):
+        # Connects to close following devices, to keep long paths.
+        window = order[i+1:i+1+max(4, len(order) // 50)]
+        outputs = rng.sample(window, min(len(window), rng.randint(1, 3)))
+        lines.append(f"{name}: {' '.join(outputs)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def presents(size: int, rng: random.Random) -> str:
+    """
+    2025 Day 12: 6 random 3 x 3 present shapes and size regions to fill.
+    """
+    shapes = []
+    for i in range(0, 6):
+        cells = ['#'] * 7 + ['.'] * 2
+        rng.shuffle(cells)
+        rows = ["".join(cells[j:j+3]) for j in range(0, 9, 3)]
+        shapes.append(f"{i:d}:\n" + "\n".join(rows) + "\n")
+
+    regions = []
+    for _ in range(0, size):
+        width, length = rng.randint(5, 50), rng.randint(5, 50)
+        if rng.random() < 0.2:
+            # Few presents, which fit side by side.
+            total = rng.randint(0, min(width, length) // 3)
+        else:
+            # From an empty region to presents of 30% more cells than the
+            # region, which can't fit.
+            total = int(rng.uniform(0, 1.3) * width * length / 7)
+        counts = [0] * 6
+        for i in rng.choices(range(0, 6), k=total):
+            counts[i] += 1
+        regions.append(f"{width:d}x{length:d}: "
+                       + " ".join(f"{n:d}" for n in counts))
+    return "\n".join(shapes) + "\n" + "\n".join(regions) + "\n"
+
+
+# Generator and default sizes of the benchmark for each year and day.
+GENERATORS: Dict[Tuple[int, int],
+                 Tuple[Callable[[int, random.Random], str], Sequence[int]]] = {
+    (2024, 1): (location_ids, (20000, 40000, 80000, 160000)),
+    (2024, 2): (reports, (1000, 2000, 4000, 8000)),
+    (2024, 3): (corrupted_memory, (1000, 2000, 4000, 8000)),
+    (2024, 4): (word_search, (50, 100, 200, 400)),
+    (2024, 5): (page_updates, (50, 100, 200, 400)),
+    (2024, 6): (guard_map, (20, 40, 60, 80)),
+    (2024, 7): (calibrations, (25, 50, 100, 200)),
+    (2024, 8): (antennas, (50, 100, 200, 400)),
+    (2024, 9): (disk_map, (500, 1000, 2000, 4000)),
+    (2024, 10): (topographic_map, (20, 40, 80, 160)),
+    (2024, 11): (stones, (10, 20, 40, 80)),
+    (2024, 12): (garden, (25, 50, 100, 200)),
+    (2024, 13): (claw_machines, (500, 1000, 2000, 4000)),
+    (2025, 1): (rotations, (1000, 2000, 4000, 8000)),
+    (2025, 2): (id_ranges, (25, 50, 100, 200)),
+    (2025, 3): (battery_banks, (100, 200, 400, 800)),
+    (2025, 4): (paper_rolls, (25, 50, 100, 200)),
+    (2025, 5): (ingredients, (250, 500, 1000, 2000)),
+    (2025, 6): (worksheet, (250, 500, 1000, 2000)),
+    (2025, 7): (tachyon_manifold, (50, 100, 200, 400)),
+    (2025, 8): (junction_boxes, (125, 250, 500, 1000)),
+    (2025, 9): (red_tiles, (20, 40, 80, 160)),
+    (2025, 11): (devices, (250, 500, 1000, 2000)),
+    (2025, 12): (presents, (250, 500, 1000, 2000)),
+}
+
+
+def generate(year: int, day: int, size: int, seed: int = 0) -> str:
+    """
+    Generates a synthetic input.
+
+    Parameters
+    ----------
+    year: int
+        The year of the puzzle.
+    day: int
+        The day of the puzzle.
+    size: int
+        The size of the input, whose meaning depends on the day.
+    seed: int, default: 0
+        The seed of the random generator; the same seed gives the same input.
+
+    Returns
+    -------
+    str
+        The contents of the input file.
+
+    Raises
+    ------
+    ValueError
+        when there is no generator for this day.
+    """
+    if (year, day) not in GENERATORS:
+        raise ValueError(f"No generator for {year:d} day {day:d}!")
+    return GENERATORS[(year, day)][0](size, random.Random(seed))
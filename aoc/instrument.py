@@ -0,0 +1,150 @@
+"""
+Measures of the phases of the solutions, emitted as text, JSON or CSV.
+"""
+import csv
+import json
+import numbers
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any, Dict, List, TextIO, Tuple
+
+
+# Fields of a record, in order.
+FIELDS = ("year", "day", "input", "size", "phase", "answer", "time_ns",
+          "peak_bytes", "error")
+
+
+def measure(function: Callable[..., Any], *args: Any,
+            memory: bool = False) -> Tuple[Any, int, int | None]:
+    """
+    Calls a function and measures its duration, and optionally the peak of
+    the memory it allocated.
+
+    Parameters
+    ----------
+    function: Callable[..., Any]
+        The function to call.
+    args: Any
+        The arguments of the function.
+    memory: bool, default: False
+        When true, then the allocations are traced with tracemalloc, which
+        slows down the function.
+
+    Returns
+    -------
+    Tuple[Any, int, int | None]
+        The result of the function, its duration in nanoseconds and the peak
+        in bytes of the memory allocated during the call (None when memory
+        is false).
+    """
+    if not memory:
+        start = time.perf_counter_ns()
+        result = function(*args)
+        return result, time.perf_counter_ns() - start, None
+
+    is_tracing = tracemalloc.is_tracing()
+    if not is_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+    try:
+        start = time.perf_counter_ns()
+        result = function(*args)
+        duration = time.perf_counter_ns() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not is_tracing:
+            tracemalloc.stop()
+    return result, duration, peak - current
+
+
+class Recorder():
+    """
+    Collects the measures of each phase of the solutions and writes them.
+
+    Attributes
+    ----------
+    __records: List[Dict[str, Any]]
+        A record per phase, with the FIELDS as keys.
+    """
+
+    __records: List[Dict[str, Any]]
+
+    def __init__(self):
+        self.__records = []
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """
+        The records, in order of addition.
+        """
+        return self.__records
+
+    def add(self, year: int, day: int, file_name: str,
+            phases: List[Tuple[str, Any, int, int | None]],
+            size: int | None = None, error: str | None = None) -> None:
+        """
+        Adds the measures of a run, and a record without phase for the error
+        that stopped it if any.
+
+        Parameters
+        ----------
+        year: int
+            The year of the puzzle.
+        day: int
+            The day of the puzzle.
+        file_name: str
+            The input file path.
+        phases: List[Tuple[str, Any, int, int | None]]
+            The name, answer, duration in nanoseconds and memory peak in
+            bytes of each phase (see aoc.runner.run_day).
+        size: int | None, default: None
+            The size of a synthetic input.
+        error: str | None, default: None
+            The description of the error that stopped the run.
+        """
+        for phase, answer, duration, peak in phases:
+            if isinstance(answer, numbers.Integral):
+                answer = int(answer)
+            elif answer is not None:
+                answer = str(answer)
+            self.__records.append({
+                "year": year, "day": day, "input": file_name, "size": size,
+                "phase": phase, "answer": answer, "time_ns": duration,
+                "peak_bytes": peak, "error": None
+            })
+        if error is not None:
+            self.__records.append({
+                "year": year, "day": day, "input": file_name, "size": size,
+                "phase": None, "answer": None, "time_ns": None,
+                "peak_bytes": None, "error": error
+            })
+
+    def write(self, stream: TextIO, output: str = "json") -> None:
+        """
+        Writes the records.
+
+        Parameters
+        ----------
+        stream: TextIO
+            The stream where the records are written.
+        output: str, default: "json"
+            "json" for a list of objects, or "csv" for a header and a row per
+            record.
+
+        Raises
+        ------
+        ValueError
+            when the output format is unknown.
+        """
+        if output == "json":
+            json.dump(self.__records, stream, indent=4)
+            stream.write('\n')
+        elif output == "csv":
+            writer = csv.DictWriter(stream, fieldnames=FIELDS,
+                                    lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(self.__records)
+        else:
+            raise ValueError("The output must be 'json' or 'csv'.")
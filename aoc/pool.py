@@ -0,0 +1,154 @@
+"""
+Execution of several solutions in parallel processes, each one with a
+wall-clock timeout and a memory cap.
+"""
+import multiprocessing
+import os
+import time
+from collections.abc import Iterator, Sequence
+from multiprocessing.connection import Connection, wait
+from typing import Any, List, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
+from aoc.days import load_day
+from aoc.runner import run_day
+
+
+# A day to run: its year, its day, its input file path and the other
+# arguments of its parse function.
+Job = Tuple[int, int, str, Sequence[str]]
+
+
+def run_job(job: Job, cache: bool = False, memory: bool = False
+            ) -> Tuple[List[Tuple[str, Any, int, int | None]], str | None]:
+    """
+    Runs a day in the current process, an error being returned instead of
+    raised so that the other days can still be run.
+
+    Parameters
+    ----------
+    job: Job
+        The day to run.
+    cache: bool, default: False
+        When true, then the parsed input is cached (see reader.cached).
+    memory: bool, default: False
+        When true, then the memory peak of each phase is traced.
+
+    Returns
+    -------
+    Tuple[List[Tuple[str, Any, int, int | None]], str | None]
+        The phases of the day (see aoc.runner.run_day) and None, or an empty
+        list and the description of the error.
+    """
+    year, day, file_name, extra = job
+    try:
+        return run_day(load_day(year, day), file_name, *extra,
+                       cache=cache, memory=memory), None
+    except MemoryError:
+        return [], "memory limit exceeded"
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return [], f"{type(error).__name__}: {error}"
+
+
+def _worker(connection: Connection, job: Job, cache: bool, memory: bool,
+            memory_limit: int | None) -> None:
+    """
+    Runs a day in a child process and sends back its phases, or the error
+    that stopped it.
+    """
+    try:
+        try:
+            if memory_limit is not None and resource is not None:
+                resource.setrlimit(resource.RLIMIT_AS,
+                                   (memory_limit, memory_limit))
+            result = run_job(job, cache, memory)
+        except (ValueError, OSError) as error:
+            result = ([], f"{type(error).__name__}: {error}")
+        connection.send(result)
+    finally:
+        connection.close()
+
+
+def run_days(jobs: Sequence[Job], workers: int | None = None,
+             timeout: float | None = None, memory_limit: int | None = None,
+             cache: bool = False, memory: bool = False
+             ) -> Iterator[Tuple[Job, List[Tuple[str, Any, int, int | None]],
+                                 str | None]]:
+    """
+    Runs days in parallel processes and yields their phases as soon as each
+    day finishes, so that a slow day does not block the others.
+
+    Parameters
+    ----------
+    jobs: Sequence[Job]
+        The days to run.
+    workers: int | None, default: None
+        The number of days run at the same time, or None for the number of
+        processors.
+    timeout: float | None, default: None
+        The wall-clock time in seconds after which a day is killed, or None
+        to wait for it.
+    memory_limit: int | None, default: None
+        The address space in bytes of each process, or None for no limit.
+        It is ignored where the resource module is not available.
+    cache: bool, default: False
+        When true, then the parsed inputs are cached (see reader.cached).
+    memory: bool, default: False
+        When true, then the memory peak of each phase is traced.
+
+    Returns
+    -------
+    Iterator[Tuple[Job, List[Tuple[str, Any, int, int | None]], str | None]]
+        For each day, in order of completion, its job, its phases (see
+        aoc.runner.run_day) and None, or an empty list and the description
+        of the error.
+    """
+    if workers is None or workers < 1:
+        workers = os.cpu_count() or 1
+
+    pending = list(reversed(jobs))
+    # Receiving end of the pipe of each running day -> (job, process,
+    # deadline).
+    running = {}
+    while pending or running:
+        while pending and len(running) < workers:
+            job = pending.pop()
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_worker,
+                args=(sender, job, cache, memory, memory_limit),
+                daemon=True
+            )
+            process.start()
+            sender.close()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            running[receiver] = (job, process, deadline)
+
+        deadlines = [d for _, _, d in running.values() if d is not None]
+        remaining = None
+        if deadlines:
+            remaining = max(0, min(deadlines) - time.monotonic())
+
+        for receiver in wait(list(running), remaining):
+            job, process, _ = running.pop(receiver)
+            try:
+                phases, error = receiver.recv()
+            except EOFError:
+                process.join()
+                phases, error = [], f"exit code {process.exitcode}"
+            receiver.close()
+            process.join()
+            yield job, phases, error
+
+        now = time.monotonic()
+        for receiver, (job, process, deadline) in list(running.items()):
+            if deadline is not None and now >= deadline:
+                process.kill()
+                process.join()
+                receiver.close()
+                del running[receiver]
+                yield job, [], f"timeout after {timeout:g} s"
@@ -0,0 +1,103 @@
+"""
+Execution of the solutions with the duration of each phase.
+"""
+from types import ModuleType
+from typing import Any, List, Tuple
+
+from aoc.instrument import measure
+from reader import cached
+
+
+# Phases of a solution, in order of execution.
+PHASES = ("parse", "part_one", "part_two")
+
+
+def run_day(module: ModuleType, file_name: str, *args: str,
+            cache: bool = False, memory: bool = False
+            ) -> List[Tuple[str, Any, int, int | None]]:
+    """
+    Runs the phases of a solution and measures their duration and
+    optionally their memory peak.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The solution (see aoc.days).
+    file_name: str
+        The input file path.
+    args: str
+        The other arguments of the parse function.
+    cache: bool, default: False
+        When true, then the parsed input is stored on disk and loaded back by
+        the next runs (see reader.cached).
+    memory: bool, default: False
+        When true, then the memory peak of each phase is traced (see
+        aoc.instrument.measure).
+
+    Returns
+    -------
+    List[Tuple[str, Any, int, int | None]]
+        For each phase, its name, its result (None for the parse phase), its
+        duration in nanoseconds and its memory peak in bytes (None when
+        memory is false).
+    """
+    parse = cached(module.parse) if cache else module.parse
+
+    result = []
+    data, duration, peak = measure(parse, file_name, *args, memory=memory)
+    result.append(("parse", None, duration, peak))
+
+    for phase in PHASES[1:]:
+        if not hasattr(module, phase):
+            continue
+        answer, duration, peak = measure(getattr(module, phase), data,
+                                         memory=memory)
+        result.append((phase, answer, duration, peak))
+
+    return result
+
+
+def format_duration(duration: int) -> str:
+    """
+    Formats a duration with a readable unit.
+
+    Parameters
+    ----------
+    duration: int
+        The duration in nanoseconds.
+
+    Returns
+    -------
+    str
+        The formatted duration.
+    """
+    if duration < 10**3:
+        return f"{duration:d} ns"
+    if duration < 10**6:
+        return f"{duration / 10**3:.3f} µs"
+    if duration < 10**9:
+        return f"{duration / 10**6:.3f} ms"
+    return f"{duration / 10**9:.3f} s"
+
+
+def format_size(size: int) -> str:
+    """
+    Formats a memory size with a readable unit.
+
+    Parameters
+    ----------
+    size: int
+        The size in bytes.
+
+    Returns
+    -------
+    str
+        The formatted size.
+    """
+    if size < 2**10:
+        return f"{size:d} B"
+    if size < 2**20:
+        return f"{size / 2**10:.1f} KiB"
+    if size < 2**30:
+        return f"{size / 2**20:.1f} MiB"
+    return f"{size / 2**30:.1f} GiB"
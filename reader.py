@@ -1,9 +1,20 @@
-from collections.abc import Sequence
+import functools
+import hashlib
+import mmap
+import os
+import pickle
+import warnings
+from collections.abc import Callable, Iterator, Sequence
+from types import CodeType
+from typing import Any
+
+import numpy as np
 
 
 def csv_to_list(file_name: str,
                 sep: str = ',',
-                by: str = "row") -> Sequence[Sequence[int]]:
+                by: str = "row",
+                output: str = "list") -> Sequence[Sequence[int]]:
     """
     Reads the contents of a csv file and returns it as an integer matrix.
 
@@ -17,26 +28,27 @@ def csv_to_list(file_name: str,
         The way the list will be built.
         When "row", then each list contains the values of each line.
         And when "column", then each list contains the values of each columns.
+    output: str, default: "list"
+        The type of the returned matrix.
+        When "list", then the matrix is built with nested lists.
+        When "array" or "padded", then the matrix is a NumPy array parsed in
+        bulk (see csv_to_array).
 
     Returns
     -------
     Sequence[Sequence[int]]
         An integer matrix containing the contents of each row in the file.
     """
+    if output in ("array", "padded"):
+        return csv_to_array(file_name, sep, by, output == "padded")
+    if output != "list":
+        raise ValueError("The output must be 'list', 'array' or 'padded'.")
+
+    if by == "row":
+        return list(csv_to_iter(file_name, sep))
+
     with open(file_name, "r", encoding="utf-8") as input_file:
-        if by == "row":
-            if sep is None:
-                return [
-                    [int(num) for num in row.strip()]
-                    for row in input_file.readlines()
-                ]
-            else:
-                return [
-                    [int(num) for num in row.split(sep)]
-                    for row in input_file.readlines()
-                ]
-
-        elif by == "column":
+        if by == "column":
             lines = input_file.readlines()
             result = [[int(val)] for val in lines[0].split(sep)]
             for i in range(1, len(lines)):
@@ -46,3 +58,503 @@ def csv_to_list(file_name: str,
             return result
 
     return None
+
+
+def parse_row(row: str, sep: str = ',') -> Sequence[int]:
+    """
+    Converts one line of a csv file into a list of integers.
+
+    Parameters
+    ----------
+    row: str
+        The line to convert.
+    sep: str, default: ','
+        The character separating each value in the line.
+        When None, then each digit of the line is a value.
+
+    Returns
+    -------
+    Sequence[int]
+        The values of the line.
+    """
+    if sep is None:
+        return [int(num) for num in row.strip()]
+    return [int(num) for num in row.split(sep)]
+
+
+def csv_to_iter(file_name: str,
+                sep: str = ',',
+                batch_size: int | None = None
+                ) -> Iterator[Sequence[int] | Sequence[Sequence[int]]]:
+    """
+    Lazily reads the contents of a csv file, one line at a time, so that
+    neither the whole file nor the whole matrix is held in memory.
+
+    Parameters
+    ----------
+    file_name: str
+        The file path.
+    sep: str, default: ','
+        The character separating each value in the file.
+        When None, then each digit of a line is a value.
+    batch_size: int | None, default: None
+        When None, then the values of each line are yielded one line at a
+        time.
+        Otherwise, lists of batch_size lines are yielded (the last one may be
+        shorter).
+
+    Yields
+    ------
+    Sequence[int] | Sequence[Sequence[int]]
+        The values of a line, or a batch of lines.
+
+    Raises
+    ------
+    ValueError
+        when batch_size isn't strictly positive.
+    """
+    if batch_size is not None and batch_size <= 0:
+        raise ValueError("The batch size must be strictly positive.")
+
+    with open(file_name, "r", encoding="utf-8") as input_file:
+        if batch_size is None:
+            for row in input_file:
+                yield parse_row(row, sep)
+        else:
+            batch = []
+            for row in input_file:
+                batch.append(parse_row(row, sep))
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+
+def csv_to_array(file_name: str,
+                 sep: str = ',',
+                 by: str = "row",
+                 padded: bool = False,
+                 start: int = 0,
+                 end: int | None = None
+                 ) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    """
+    Reads the contents of a csv file and returns it as a 2D integer NumPy
+    array.
+    The whole file is parsed at once from its raw bytes, without converting
+    each value one by one.
+
+    Parameters
+    ----------
+    file_name: str
+        The file path.
+    sep: str, default: ','
+        The character separating each value in the file.
+        When None, then each digit of a line is a value.
+    by: str, default: "row"
+        The way the array is indexed.
+        When "row", then each row of the array contains the values of each
+        line.
+        And when "column", then each row of the array contains the values of
+        each column; it is a transposed view of the same buffer.
+    padded: bool, default: False
+        When false, then all lines must have the same number of values.
+        When true, then the lines may have different numbers of values: the
+        shortest rows are padded with zeros and the number of values of each
+        line is returned alongside the array.
+    start: int, default: 0
+        The position of the first byte read, at the start of a line.
+    end: int | None, default: None
+        The position after the last byte read, at the end of a line (see
+        line_ranges), or None to read until the end of the file.
+
+    Returns
+    -------
+    np.ndarray | tuple[np.ndarray, np.ndarray]
+        The integer array, or when padded, the padded array and the number of
+        values of each row.
+
+    Raises
+    ------
+    ValueError
+        when a value isn't an integer, when the lines don't have the same
+        number of values and padded is false, or when by is unknown.
+    """
+    if by not in ("row", "column"):
+        raise ValueError("The array must be built by 'row' or 'column'.")
+    if padded and by == "column":
+        raise ValueError("A padded array can only be built by 'row'.")
+
+    with open(file_name, "rb") as input_file:
+        input_file.seek(start)
+        raw = input_file.read(-1 if end is None else end - start)
+    raw = raw.replace(b'\r', b'').rstrip(b'\n')
+
+    # An empty value, between two separators or at either end of a line,
+    # would otherwise vanish with the blanks around it.
+    if sep is not None:
+        sep_bytes = sep.encode("utf-8")
+        if sep_bytes + sep_bytes in raw or raw.startswith(sep_bytes) \
+                or raw.endswith(sep_bytes) or b'\n' + sep_bytes in raw \
+                or sep_bytes + b'\n' in raw:
+            raise ValueError("The file must contain only integers.")
+
+    # Replaces the separators with spaces, the only separator understood by
+    # NumPy's text parser with line breaks.
+    if sep is not None and sep != ' ':
+        raw = raw.replace(sep.encode("utf-8"), b' ')
+
+    buffer = np.frombuffer(raw, dtype=np.uint8)
+    newlines = np.flatnonzero(buffer == ord('\n'))
+    n_rows = len(newlines) + 1 if len(buffer) > 0 else 0
+
+    if sep is None:
+        # Each character that is not a line break is a one digit value.
+        is_value = buffer != ord('\n')
+        positions = np.flatnonzero(is_value)
+        values = buffer[is_value].astype(np.int64) - ord('0')
+        if np.any((values < 0) | (values > 9)):
+            raise ValueError("The file must contain only digits.")
+    else:
+        # A value starts on each character that follows a blank one.
+        is_blank = (buffer == ord(' ')) | (buffer == ord('\n'))
+        is_start = ~is_blank
+        is_start[1:] &= is_blank[:-1]
+        positions = np.flatnonzero(is_start)
+        with warnings.catch_warnings():
+            # NumPy only warns when it stops on an unexpected character.
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                values = np.fromstring(raw, dtype=np.int64, sep=' ')
+            except (DeprecationWarning, ValueError) as error:
+                raise ValueError("The file must contain only integers.") \
+                    from error
+        if len(values) != len(positions):
+            raise ValueError("The file must contain only integers.")
+
+    # Gets the row of each value and the number of values of each row.
+    rows = np.searchsorted(newlines, positions)
+    lengths = np.bincount(rows, minlength=n_rows)
+
+    if not padded:
+        if n_rows > 0 and np.any(lengths != lengths[0]):
+            raise ValueError("All lines must have the same number of values.")
+        n_cols = int(lengths[0]) if n_rows > 0 else 0
+        result = values.reshape(n_rows, n_cols)
+        return result if by == "row" else result.T
+
+    # Places each value at its column in the padded array.
+    offsets = np.cumsum(lengths) - lengths
+    cols = np.arange(len(values)) - offsets[rows]
+    n_cols = int(lengths.max()) if n_rows > 0 else 0
+    result = np.zeros((n_rows, n_cols), dtype=np.int64)
+    result[rows, cols] = values
+    return result, lengths
+
+
+def line_ranges(file_name: str, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Splits a file into ranges of bytes made of whole lines, without reading
+    it entirely.
+
+    Parameters
+    ----------
+    file_name: str
+        The file path.
+    chunk_size: int
+        The approximate number of bytes of each range: a range ends at the
+        end of the line containing its chunk_size-th byte.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The position of the first byte of each range and the position after
+        its last byte.
+
+    Raises
+    ------
+    ValueError
+        when the chunk size isn't positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("The chunk size must be positive.")
+
+    size = os.path.getsize(file_name)
+    result = []
+    start = 0
+    with open(file_name, "rb") as input_file:
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                # Reads the end of the line containing the byte end-1.
+                input_file.seek(end - 1)
+                input_file.readline()
+                end = input_file.tell()
+            result.append((start, min(end, size)))
+            start = end
+    return result
+
+
+def grid_to_array(file_name: str) -> np.ndarray:
+    """
+    Maps a file containing a character grid into memory and returns it as a
+    read-only 2D array of bytes, without copying it.
+    The line breaks are skipped by the strides of the array.
+
+    Parameters
+    ----------
+    file_name: str
+        The file path.
+
+    Returns
+    -------
+    np.ndarray
+        A (rows, columns) uint8 array of the characters of the grid, e.g. use
+        grid == ord('#') to find the obstacles.
+
+    Raises
+    ------
+    ValueError
+        when the file is empty or when its lines don't have the same length.
+    """
+    with open(file_name, "rb") as input_file:
+        if os.fstat(input_file.fileno()).st_size == 0:
+            raise ValueError("The grid is empty.")
+        # The mapping stays valid after the file is closed, and lives as long
+        # as the arrays built on it.
+        memory = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = np.frombuffer(memory, dtype=np.uint8)
+
+    # Gets the width of the grid and the size of its line breaks.
+    n_cols = memory.find(b'\n')
+    if n_cols == -1:
+        n_cols = len(buffer)
+    newline = 1 if n_cols < len(buffer) else 0
+    if n_cols > 0 and newline and buffer[n_cols-1] == ord('\r'):
+        n_cols -= 1
+        newline = 2
+
+    # The last line may not end with a line break.
+    stride = n_cols + newline
+    n_rows = -(-len(buffer) // stride)
+    if n_cols == 0 or len(buffer) not in (n_rows * stride,
+                                          n_rows * stride - newline):
+        raise ValueError("All lines of the grid must have the same length.")
+
+    grid = np.lib.stride_tricks.as_strided(
+        buffer, shape=(n_rows, n_cols), strides=(stride, 1), writeable=False
+    )
+    if (np.any(grid == ord('\n'))
+       or np.any(buffer[stride-1::stride] != buffer[stride-1])):
+        raise ValueError("All lines of the grid must have the same length.")
+    return grid
+
+
+def cache_location() -> str:
+    """
+    Gets the directory where the parsed inputs are cached.
+    It can be changed with the AOC_CACHE_DIR environment variable.
+
+    Returns
+    -------
+    str
+        The directory path.
+    """
+    return os.environ.get(
+        "AOC_CACHE_DIR",
+        os.path.join(os.path.expanduser('~'), ".cache", "advent_of_code")
+    )
+
+
+def cache_max_size() -> int:
+    """
+    Gets the maximum size in bytes of the cached parsed inputs.
+    It can be changed with the AOC_CACHE_SIZE environment variable.
+
+    Returns
+    -------
+    int
+        The size in bytes, 256 MiB by default.
+    """
+    return int(os.environ.get("AOC_CACHE_SIZE", 256 * 2**20))
+
+
+def _update_with_code(digest: Any, code: CodeType) -> None:
+    """
+    Adds the code of a function to a digest, with the code of its nested
+    functions and comprehensions, but not their addresses which change in
+    every process.
+    """
+    digest.update(code.co_code)
+    digest.update(repr((code.co_names, code.co_varnames)).encode("utf-8"))
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            _update_with_code(digest, constant)
+        elif isinstance(constant, frozenset):
+            # The order of a set changes with the hash seed of the process.
+            digest.update(repr(sorted(constant, key=repr)).encode("utf-8"))
+        else:
+            digest.update(repr(constant).encode("utf-8"))
+
+
+def _update_with_sources(digest: Any, file_name: str) -> None:
+    """
+    Adds the contents of the Python files of a directory to a digest.
+    """
+    directory = os.path.dirname(os.path.abspath(file_name))
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            digest.update(name.encode("utf-8"))
+            with open(os.path.join(directory, name), "rb") as source:
+                digest.update(source.read())
+
+
+def cache_key(parser: Callable[..., Any], file_name: str,
+              *args: Any, **kwargs: Any) -> str:
+    """
+    Computes the key of a parsed input from the contents of the input file
+    and the identity of the parser: its name, its code, its arguments, and
+    the source files of its directory and of this module, which define the
+    code it calls and the classes of its result.
+    Thus, editing either the file or the parser invalidates the key.
+
+    Parameters
+    ----------
+    parser: Callable[..., Any]
+        The function parsing the file.
+    file_name: str
+        The file path.
+    args, kwargs: Any
+        The other arguments given to the parser.
+
+    Returns
+    -------
+    str
+        The key as a hexadecimal string, the same in every process.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_name, "rb") as input_file:
+        for chunk in iter(lambda: input_file.read(2**20), b''):
+            digest.update(chunk)
+
+    identity = (
+        getattr(parser, "__module__", None),
+        getattr(parser, "__qualname__", repr(parser)),
+        repr(args),
+        repr(sorted(kwargs.items())),
+    )
+    digest.update(repr(identity).encode("utf-8"))
+
+    code = getattr(parser, "__code__", None)
+    if code is not None:
+        _update_with_code(digest, code)
+        if os.path.exists(code.co_filename):
+            _update_with_sources(digest, code.co_filename)
+    _update_with_sources(digest, __file__)
+    return digest.hexdigest()
+
+
+def _cache_load(path: str) -> Any:
+    """
+    Loads a parsed input from the cache.
+    An array, or a tuple of arrays, is stored in a .npz file, any other value
+    is pickled.
+    """
+    if path.endswith(".npz"):
+        with np.load(path, allow_pickle=False) as arrays:
+            if "result" in arrays.files:
+                return arrays["result"]
+            return tuple(arrays[f"arr_{i:d}"]
+                         for i in range(0, len(arrays.files)))
+    with open(path, "rb") as cache_file:
+        return pickle.load(cache_file)
+
+
+def _cache_store(path: str, result: Any) -> None:
+    """
+    Stores a parsed input in the cache, through a temporary file so that a
+    reader never sees a partially written entry.
+    """
+    tmp_path = f"{path}.{os.getpid():d}.tmp"
+    with open(tmp_path, "wb") as cache_file:
+        if isinstance(result, np.ndarray):
+            np.savez(cache_file, result=result)
+        elif path.endswith(".npz"):
+            np.savez(cache_file, *result)
+        else:
+            pickle.dump(result, cache_file, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def _cache_evict(directory: str, max_size: int) -> None:
+    """
+    Removes the least recently used entries of the cache until its size is
+    below the maximum size.
+    """
+    entries = []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if name.endswith((".npz", ".pkl")):
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    size = sum(entry[1] for entry in entries)
+    for _, entry_size, path in sorted(entries):
+        if size <= max_size:
+            break
+        os.remove(path)
+        size -= entry_size
+
+
+def cached(parser: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorates a function parsing an input file so that its result is stored
+    on disk, and loaded back without parsing on the next calls with the same
+    file contents and the same arguments.
+    The least recently used results are removed once the cache exceeds its
+    maximum size (see cache_location and cache_max_size).
+
+    Parameters
+    ----------
+    parser: Callable[..., Any]
+        The function parsing the file, whose first argument is the file path.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The parser with the cache.
+    """
+    @functools.wraps(parser)
+    def wrapper(file_name: str, *args: Any, **kwargs: Any) -> Any:
+        directory = cache_location()
+        key = cache_key(parser, file_name, *args, **kwargs)
+        for extension in (".npz", ".pkl"):
+            path = os.path.join(directory, key + extension)
+            if os.path.exists(path):
+                try:
+                    result = _cache_load(path)
+                except (OSError, ValueError, EOFError, pickle.PickleError):
+                    # A corrupted entry is parsed again.
+                    os.remove(path)
+                    break
+                # Marks the entry as recently used.
+                os.utime(path)
+                return result
+
+        result = parser(file_name, *args, **kwargs)
+
+        arrays = result if isinstance(result, tuple) else (result,)
+        is_arrays = len(arrays) > 0 and all(
+            isinstance(array, np.ndarray) and array.dtype != object
+            for array in arrays
+        )
+        os.makedirs(directory, exist_ok=True)
+        _cache_store(
+            os.path.join(directory, key + (".npz" if is_arrays else ".pkl")),
+            result
+        )
+        _cache_evict(directory, cache_max_size())
+        return result
+
+    return wrapper